@@ -44,6 +44,7 @@ if DEV:
     INSTALLED_APPS.append('django_extensions')
 
 MIDDLEWARE = [
+    'BackendTennis.middleware.RequestTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -84,6 +85,16 @@ SPECTACULAR_SETTINGS = {
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    # orjson encoding and decoding, same JSON as the default JSONRenderer and JSONParser
+    'DEFAULT_RENDERER_CLASSES': [
+        'BackendTennis.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'BackendTennis.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
 SIMPLE_JWT = {
@@ -126,6 +137,47 @@ DATABASES = {
     }
 }
 
+# CACHE
+# The payload cache keeps the precomputed public payloads (navigation bars, home pages, ...).
+# Local memory is enough with a single worker, use a shared backend when running several workers, e.g.:
+# 'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': BASE_DIR / 'cache' / 'payload'
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'tennis-arsac-default',
+    },
+    'payload': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'tennis-arsac-payload',
+        'TIMEOUT': 60 * 60,
+    },
+    'permission': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'tennis-arsac-permission',
+        'TIMEOUT': 60 * 5,
+    },
+}
+# The tests run the payload and permission caches as DummyCache, see BackendTennis.tests.runner
+TEST_RUNNER = 'BackendTennis.tests.runner.TestRunner'
+
+PAYLOAD_CACHE_ALIAS = 'payload'
+PERMISSION_CACHE_ALIAS = 'permission'
+# The permissions version bumped on a revocation lives in the permission cache. With a process-local backend
+# (LocMemCache) the other workers do not see it: their cached permission sets are then kept LOCAL_TIMEOUT seconds
+# only, the delay for a revocation to reach them. Use a shared backend to keep the sets for the TIMEOUT of the alias.
+PERMISSION_CACHE = {
+    'LOCAL_TIMEOUT': 5,
+}
+
+# Verified API keys are kept in memory for TIMEOUT seconds to skip the password hasher on every request.
+# Set SHARED_CACHE_ALIAS to a shared cache so a revocation is seen at once by every worker,
+# the local entries of the other workers still live until their TIMEOUT.
+API_KEY_CACHE = {
+    'MAX_SIZE': 1024,
+    'TIMEOUT': 60,
+    'SHARED_CACHE_ALIAS': None,
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -178,6 +230,11 @@ LOGGING = {
             'level': 'DEBUG',
             'propagate': False,
         },
+        'BackendTennis.services.request_timing_service': {
+            'handlers': ['console', 'file'],
+            'level': 'INFO',
+            'propagate': False,
+        },
         'BackendTennis.signals': {
             'handlers': ['console', 'file'],
             'level': 'INFO',
@@ -220,6 +277,53 @@ CORS_ALLOW_CREDENTIALS = True
 MEDIA_URL = '/images/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'images')
 
+# IMAGE DERIVATIVES
+# Resized copies of every uploaded image, stored next to the original as <id>_<width>w.<format>.
+# Widths larger than the original are skipped, formats unsupported by the installed Pillow (e.g. avif) too.
+IMAGE_DERIVATIVES = {
+    'WIDTHS': [320, 640, 1280],
+    'FORMATS': ['webp'],
+    'QUALITY': 80,
+    'WORKERS': 2,
+}
+# Threads decoding and storing the files of a bulk image upload
+IMAGE_BULK_UPLOAD_WORKERS = 4
+# Django refuses more than 100 files per request by default
+DATA_UPLOAD_MAX_NUMBER_FILES = 500
+
+# STATIC SNAPSHOTS
+# The public GET payloads (pages, navigation bar, routes) are exported to ROOT as immutable <name>.<hash>.json
+# files listed in manifest.json with the ETag of the API, for a reverse proxy to serve them without reaching Django.
+# They are rebuilt in the background REBUILD_DELAY seconds after a content change. ROOT = None disables the export.
+# The site bundle is not exported, its upcoming events change with the day and not with the content.
+# BASE_URL is the scheme and host used for the absolute image URLs of the payloads, required with ROOT.
+STATIC_SNAPSHOT = {
+    'ROOT': None,
+    'BASE_URL': None,
+    'REBUILD_DELAY': 5,
+}
+
+# REQUEST TIMING
+# Query count, database, authentication, serialization and rendering times of every BackendTennis request, returned
+# in the Server-Timing header and logged. The last WINDOW requests of every view are kept in memory (per worker) for
+# the percentiles of the admin request_timing_stats/ endpoint.
+REQUEST_TIMING = {
+    'ENABLED': True,
+    'WINDOW': 500,
+}
+
+# METRICS
+# Prometheus metrics of the BackendTennis views, of the API key cache and of the image uploads, served at /metrics.
+# With several gunicorn workers, set the PROMETHEUS_MULTIPROC_DIR environment variable to a directory shared by the
+# workers and emptied before each start: every worker writes its values there and /metrics sums them.
+# When TOKEN is set, /metrics requires the `Authorization: Bearer <TOKEN>` header. Without a token, /metrics is only
+# served with DEBUG, or when PUBLIC is set to True to expose it on purpose (e.g. behind a private network).
+METRICS = {
+    'ENABLED': True,
+    'TOKEN': None,
+    'PUBLIC': False,
+}
+
 # TRADUCTIONS
 LANGUAGES = [
     ('en', 'English'),
@@ -3,6 +3,8 @@ from django.conf.urls.static import static
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
 
+from BackendTennis.views import MetricsView
+
 urlpatterns = [
     # Inclusion of the Tennis Backend application URLs
     path('BackendTennis/', include('BackendTennis.urls')),
@@ -12,6 +14,9 @@ urlpatterns = [
     path('swagger/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
 
+    # Prometheus metrics
+    path('metrics', MetricsView.as_view(), name='metrics'),
+
 ]
 
 if settings.DEBUG:
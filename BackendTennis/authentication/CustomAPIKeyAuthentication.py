@@ -3,16 +3,24 @@ from rest_framework import exceptions
 from rest_framework_api_key.models import APIKey
 import logging
 
+from BackendTennis.services.api_key_cache_service import is_verified_api_key, remember_verified_api_key
+from BackendTennis.services.request_timing_service import timed_step
+
 logger = logging.getLogger(__name__)
 
 
 class CustomAPIKeyAuthentication(authentication.BaseAuthentication):
+    @timed_step('auth')
     def authenticate(self, request):
         api_key = request.headers.get('Api-Key')
         if not api_key:
             logger.debug('No API Key provided in headers')
             raise exceptions.AuthenticationFailed('API Key is required')
 
+        if is_verified_api_key(api_key):
+            logger.debug('API Key is valid and active (cached)')
+            return None, None
+
         try:
             key = APIKey.objects.get_from_key(api_key)
             if key.revoked:
@@ -22,5 +30,6 @@ class CustomAPIKeyAuthentication(authentication.BaseAuthentication):
             logger.debug('API Key does not exist')
             raise exceptions.AuthenticationFailed('Invalid API Key')
 
+        remember_verified_api_key(api_key)
         logger.debug('API Key is valid and active')
         return None, None
@@ -0,0 +1,30 @@
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from BackendTennis.services.request_timing_service import timed_step
+
+_JWT_USER_ATTRIBUTE = '_jwt_user'
+
+
+def get_request_user(request):
+    """
+    Return the user of the request JWT, the token being decoded at most once per request.
+    CustomAPIKeyAuthentication ends DRF authentication without a user, so the token is only read when a
+    permission needs it. An invalid or missing token gives None, as anonymous write requests are refused.
+    """
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return user
+
+    if not hasattr(request, _JWT_USER_ATTRIBUTE):
+        try:
+            with timed_step('auth'):
+                user_auth_tuple = JWTAuthentication().authenticate(request)
+        except AuthenticationFailed:
+            user_auth_tuple = None
+        setattr(request, _JWT_USER_ATTRIBUTE, user_auth_tuple[0] if user_auth_tuple is not None else None)
+
+    user = getattr(request, _JWT_USER_ATTRIBUTE)
+    if user is not None:
+        request.user = user
+    return user
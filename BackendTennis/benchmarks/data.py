@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import random
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from typing import TYPE_CHECKING
+
+from rest_framework_api_key.models import APIKey
+from rest_framework_simplejwt.tokens import AccessToken
+
+from BackendTennis.constant import Constant
+from BackendTennis.models import Image, Tag, NavigationItem, Render, HomePage, NavigationBar, Training, User
+
+if TYPE_CHECKING:
+    from typing import Dict
+
+# Rows generated for a scale of 1, every count is multiplied by the scale
+BENCHMARK_DATA_SIZES = {
+    'tags': 50,
+    'images': 2000,
+    'tags_per_image': 3,
+    'root_navigation_items': 8,
+    'children_per_navigation_item': 6,
+    'users': 200,
+    'trainings': 1000,
+    'participants_per_training': 8,
+}
+
+_BATCH_SIZE = 5000
+
+
+def _scaled(name: str, scale: float) -> int:
+    return max(1, int(BENCHMARK_DATA_SIZES[name] * scale))
+
+
+def _generate_images(scale: float):
+    tags = Tag.objects.bulk_create([Tag(name=f'benchmark-tag-{index}') for index in range(_scaled('tags', scale))])
+    # Skewed popularity, the first tags are on most images
+    weights = [1 / (index + 1) for index in range(len(tags))]
+    through = Image.tags.through
+    image_count = _scaled('images', scale)
+    for offset in range(0, image_count, _BATCH_SIZE):
+        images = Image.objects.bulk_create([
+            Image(title=f'benchmark {index}', type=Constant.IMAGE_TYPE.PICTURE)
+            for index in range(offset, min(offset + _BATCH_SIZE, image_count))
+        ])
+        through.objects.bulk_create([
+            through(image_id=image.id, tag_id=tag.id)
+            for image in images
+            for tag in set(random.choices(tags, weights=weights, k=BENCHMARK_DATA_SIZES['tags_per_image']))
+        ])
+    return tags
+
+
+def _generate_navigation(scale: float):
+    """Root items of the home page and the navigation bar, each one with its children."""
+    root_count = _scaled('root_navigation_items', scale)
+    children_count = BENCHMARK_DATA_SIZES['children_per_navigation_item']
+    renders = Render.objects.bulk_create([
+        Render(navBarPosition='left', type='nav_bar', order=100000 + index)
+        for index in range(root_count * (children_count + 1))
+    ])
+    render_iterator = iter(renders)
+    roots = NavigationItem.objects.bulk_create([
+        NavigationItem(title=f'Benchmark {index}', navBarRender=next(render_iterator)) for index in range(root_count)
+    ])
+    children_by_root = {}
+    through = NavigationItem.childrenNavigationItems.through
+    for root in roots:
+        children_by_root[root] = NavigationItem.objects.bulk_create([
+            NavigationItem(title=f'{root.title} - {index}', navBarRender=next(render_iterator))
+            for index in range(children_count)
+        ])
+        through.objects.bulk_create([
+            through(from_navigationitem_id=root.id, to_navigationitem_id=child.id)
+            for child in children_by_root[root]
+        ])
+
+    home_page = HomePage.objects.create(title='Benchmark')
+    home_page.navigationItems.set(roots)
+    navigation_bar = NavigationBar.objects.create()
+    navigation_bar.navigationItems.set(roots)
+    return children_by_root
+
+
+def _generate_trainings(scale: float, start: date):
+    users = User.objects.bulk_create([
+        User(
+            email=f'benchmark-{index}@example.com',
+            first_name='Benchmark',
+            last_name=f'User {index}',
+            birthdate=date(1990, 1, 1)
+        )
+        for index in range(_scaled('users', scale))
+    ])
+    first_day = datetime.combine(start, time.min, tzinfo=dt_timezone.utc)
+    training_count = _scaled('trainings', scale)
+    # Spread over a year, a few trainings every day
+    trainings = Training.objects.bulk_create([
+        Training(
+            name=f'benchmark {index}',
+            start=first_day + timedelta(hours=index * 365 * 24 // training_count),
+            end=first_day + timedelta(hours=index * 365 * 24 // training_count + 1)
+        )
+        for index in range(training_count)
+    ])
+    participant_count = min(len(users), BENCHMARK_DATA_SIZES['participants_per_training'])
+    Training.participants.through.objects.bulk_create([
+        Training.participants.through(training_id=training.id, user_id=user.id)
+        for training in trainings
+        for user in random.sample(users, participant_count)
+    ])
+
+
+def generate_benchmark_data(scale: float = 1, start: date = date(2025, 1, 1)) -> Dict:
+    """
+    Create the data set of the benchmark scenarios, seeded so every run has the same rows and links, and a
+    superuser with an API key. Meant to run in a transaction rolled back afterwards.
+
+    :return: the API key, the superuser JWT, the tags, the navigation items by root and the training calendar start
+    """
+    random.seed(0)
+    tags = _generate_images(scale)
+    children_by_root = _generate_navigation(scale)
+    _generate_trainings(scale, start)
+
+    superuser = User.objects.create_superuser(
+        email='benchmark@example.com',
+        password='benchmark',
+        first_name='Bench',
+        last_name='Mark',
+        birthdate=date(1990, 1, 1)
+    )
+    _, key = APIKey.objects.create_key(name='benchmark-api-key')
+    return {
+        'api_key': key,
+        'token': str(AccessToken.for_user(superuser)),
+        'tags': [tag.name for tag in tags],
+        'children_by_root': children_by_root,
+        'start': start,
+    }
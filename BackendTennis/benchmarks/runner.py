@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+import resource
+import statistics
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from BackendTennis.benchmarks.scenarios import SCENARIOS
+from BackendTennis.services.request_timing_service import get_percentile
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional
+
+# Latencies and memory may grow by `tolerance` (ratio) over the baseline, query counts may not grow at all
+COMPARED_LATENCIES = ('p50_ms', 'p95_ms')
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+def get_peak_rss_mb() -> float:
+    """Peak RSS of the process since its start: measured once per run, a scenario cannot be told from the others"""
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return round(peak_rss / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def run_scenario(name: str, data: Dict, iterations: int, warmup: int) -> Dict:
+    """
+    Run the scenario `warmup` times without measuring, then `iterations` times.
+    Every request is timed (until its body is read) and its queries are counted.
+    """
+    client = Client()
+    durations: List[float] = []
+    query_counts: List[int] = []
+    measuring = False
+
+    def send(method, path, **kwargs):
+        with CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            response = getattr(client, method)(path, **kwargs)
+            if response.streaming:
+                b''.join(response.streaming_content)
+            duration = time.perf_counter() - start
+        if response.status_code >= 400:
+            raise BenchmarkError(f'{name}: {method.upper()} {path} answered {response.status_code}')
+        if measuring:
+            durations.append(duration * 1000)
+            query_counts.append(len(context.captured_queries))
+        return response
+
+    for iteration in range(warmup):
+        SCENARIOS[name](send, data, iteration)
+    measuring = True
+    start = time.perf_counter()
+    for iteration in range(warmup, warmup + iterations):
+        SCENARIOS[name](send, data, iteration)
+    duration = time.perf_counter() - start
+
+    durations.sort()
+    return {
+        'requests': len(durations),
+        'requests_per_second': round(len(durations) / duration, 1),
+        **{f'p{percentile}_ms': get_percentile(durations, percentile) for percentile in (50, 95, 99)},
+        'queries_per_request': round(statistics.mean(query_counts), 2),
+        'max_queries': max(query_counts),
+    }
+
+
+def compare_with_baseline(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """:return: a message for every metric of `results` worse than the baseline"""
+    regressions = []
+    if 'peak_rss_mb' in baseline and results['peak_rss_mb'] > baseline['peak_rss_mb'] * (1 + tolerance):
+        regressions.append(f'peak_rss_mb {results["peak_rss_mb"]} > {baseline["peak_rss_mb"]} (+{tolerance:.0%})')
+    for name, result in results['scenarios'].items():
+        reference = baseline['scenarios'].get(name)
+        if reference is None:
+            continue
+        for metric in COMPARED_LATENCIES:
+            if result[metric] > reference[metric] * (1 + tolerance):
+                regressions.append(f'{name}: {metric} {result[metric]} > {reference[metric]} (+{tolerance:.0%})')
+        for metric in ['queries_per_request', 'max_queries']:
+            if result[metric] > reference[metric]:
+                regressions.append(f'{name}: {metric} {result[metric]} > {reference[metric]}')
+    return regressions
+
+
+def read_baseline(path: str) -> Optional[Dict]:
+    try:
+        with open(path) as baseline_file:
+            return json.load(baseline_file)
+    except FileNotFoundError:
+        return None
+
+
+def write_baseline(path: str, results: Dict) -> None:
+    with open(path, 'w') as baseline_file:
+        json.dump(results, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write('\n')
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+from PIL import Image as PilImage
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from BackendTennis.constant import Constant
+
+if TYPE_CHECKING:
+    from typing import Callable, Dict
+
+API_ROOT = '/BackendTennis'
+GALLERY_PAGE_SIZE = 40
+GALLERY_PAGES = 5
+UPLOAD_BATCH_SIZE = 10
+
+
+def _public_headers(data: Dict) -> Dict:
+    return {'HTTP_API_KEY': data['api_key']}
+
+
+def _admin_headers(data: Dict) -> Dict:
+    return {'HTTP_API_KEY': data['api_key'], 'HTTP_AUTHORIZATION': f'Bearer {data["token"]}'}
+
+
+def public_homepage(send: Callable, data: Dict, iteration: int) -> None:
+    """First load of the public site: home page, navigation bar and the site bundle."""
+    for path in ['home_page/', 'navigation_bar/', 'site_bundle/']:
+        send('get', f'{API_ROOT}/{path}', **_public_headers(data))
+
+
+def image_gallery(send: Callable, data: Dict, iteration: int) -> None:
+    """Gallery browsing with the keyset pagination, every other visit filtered on the most used tag."""
+    path = f'{API_ROOT}/image/?cursor=&page_size={GALLERY_PAGE_SIZE}'
+    if iteration % 2:
+        path += f'&tags={data["tags"][0]}'
+    for _ in range(GALLERY_PAGES):
+        response = send('get', path, **_public_headers(data))
+        path = response.json()['links']['next']
+        if not path:
+            break
+
+
+def training_calendar(send: Callable, data: Dict, iteration: int) -> None:
+    """Week view of the training calendar, one week further at each iteration."""
+    start = datetime.combine(data['start'], time.min) + timedelta(weeks=iteration % 52)
+    end = start + timedelta(weeks=1)
+    send(
+        'get',
+        f'{API_ROOT}/training/?start_date={start.isoformat()}&end_date={end.isoformat()}&page_size=100',
+        **_public_headers(data)
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_upload_content() -> bytes:
+    buffer = BytesIO()
+    PilImage.effect_noise((320, 240), 64).convert('RGB').save(buffer, 'jpeg', quality=85)
+    return buffer.getvalue()
+
+
+def bulk_upload(send: Callable, data: Dict, iteration: int) -> None:
+    """Admin upload of a batch of photos."""
+    images_data = [
+        {'index': index, 'title': f'upload {iteration}-{index}', 'type': Constant.IMAGE_TYPE.PICTURE}
+        for index in range(UPLOAD_BATCH_SIZE)
+    ]
+    payload = {'images_data': json.dumps(images_data)}
+    for index in range(UPLOAD_BATCH_SIZE):
+        # The iteration changes the content, every upload is a new blob
+        content = _get_upload_content() + iteration.to_bytes(4, 'big') + index.to_bytes(4, 'big')
+        payload[f'image_{index}'] = SimpleUploadedFile(f'{index}.jpg', content, content_type='image/jpeg')
+    send('post', f'{API_ROOT}/images/batch-create/', data=payload, **_admin_headers(data))
+
+
+def admin_reorder(send: Callable, data: Dict, iteration: int) -> None:
+    """Admin reversing the order of the children of a menu, the next menu at each iteration."""
+    roots = list(data['children_by_root'])
+    root = roots[iteration % len(roots)]
+    children = data['children_by_root'][root]
+    orders = [child.navBarRender.order for child in children]
+    # Reversed on the first pass over the menus, restored on the second one
+    if (iteration // len(roots)) % 2 == 0:
+        orders.reverse()
+    updates = [
+        {'id': str(child.id), 'order': order, 'parent': str(root.id)} for child, order in zip(children, orders)
+    ]
+    send(
+        'patch',
+        f'{API_ROOT}/navigation_items/',
+        data=json.dumps({'updates': updates}),
+        content_type='application/json',
+        **_admin_headers(data)
+    )
+
+
+SCENARIOS: Dict[str, Callable] = {
+    'public_homepage': public_homepage,
+    'image_gallery': image_gallery,
+    'training_calendar': training_calendar,
+    'bulk_upload': bulk_upload,
+    'admin_reorder': admin_reorder,
+}
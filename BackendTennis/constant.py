@@ -65,6 +65,23 @@ class Constant(types.SimpleNamespace):
         HOME_PAGE=('home_page', 'HOME_PAGE'),
     )
 
+    PAYLOAD_GROUP: types.SimpleNamespace = types.SimpleNamespace(
+        HOME_PAGE='home_page',
+        NAVIGATION_BAR='navigation_bar',
+        SITE_BUNDLE='site_bundle'
+    )
+
+    TAG_MATCH_MODE: types.SimpleNamespace = types.SimpleNamespace(
+        ALL='all',
+        ANY='any'
+    )
+
+    PARTICIPANTS_MODE: types.SimpleNamespace = types.SimpleNamespace(
+        IDS='ids',
+        COMPACT='compact',
+        FULL='full'
+    )
+
     def __setattr__(self, *_):
         raise Exception('Tried to change the value of a constant')
 
@@ -75,3 +92,5 @@ constant_event_mode_list: List = list(vars(Constant.EVENT_MODE).values())
 constant_route_protocol_list: List = list(vars(Constant.ROUTE_PROTOCOL_CHOICES).values())
 constant_nav_bar_position_list: List = list(vars(Constant.NAV_BAR_POSITION_CHOICES).values())
 constant_render_type_list: List = list(vars(Constant.RENDER_TYPE_CHOICES).values())
+constant_tag_match_mode_list: List = list(vars(Constant.TAG_MATCH_MODE).values())
+constant_participants_mode_list: List = list(vars(Constant.PARTICIPANTS_MODE).values())
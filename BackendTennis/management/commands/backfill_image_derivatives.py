@@ -0,0 +1,26 @@
+from concurrent.futures import wait
+
+from django.core.management.base import BaseCommand
+
+from BackendTennis.models import Image
+from BackendTennis.services.image_derivative_service import schedule_image_derivatives
+
+
+class Command(BaseCommand):
+    help = 'Generate the missing derivatives (resized and webp copies) of the images stored in images/'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Regenerate the derivatives of every image')
+
+    def handle(self, *args, **options):
+        images = Image.objects.exclude(imageUrl='').exclude(imageUrl__isnull=True)
+        if not options['force']:
+            images = images.filter(derivatives={})
+        # Derivatives belong to the file, one image per file is enough
+        image_ids = list(images.order_by('imageUrl').distinct('imageUrl').values_list('id', flat=True))
+
+        self.stdout.write(f'Generating derivatives for {len(image_ids)} image files')
+        wait(schedule_image_derivatives(image_ids))
+
+        generated = Image.objects.filter(id__in=image_ids).exclude(derivatives={}).count()
+        self.stdout.write(self.style.SUCCESS(f'Derivatives generated for {generated}/{len(image_ids)} image files'))
@@ -0,0 +1,59 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework_api_key.models import APIKey
+
+from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.services.api_key_cache_service import purge_api_key, verified_api_keys
+
+
+class Command(BaseCommand):
+    help = 'Measure CustomAPIKeyAuthentication latency without and with the verified API key cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=200, help='Number of authentications per run')
+
+    def _run(self, authentication, request, iterations, use_cache):
+        durations = []
+        for _ in range(iterations):
+            if not use_cache:
+                verified_api_keys.clear()
+            start = time.perf_counter()
+            authentication.authenticate(request)
+            durations.append((time.perf_counter() - start) * 1000)
+        return durations
+
+    def _report(self, label, durations):
+        durations = sorted(durations)
+        p95 = durations[int(len(durations) * 0.95) - 1]
+        self.stdout.write(
+            f'{label:<10} mean {statistics.mean(durations):8.3f} ms | '
+            f'median {statistics.median(durations):8.3f} ms | p95 {p95:8.3f} ms'
+        )
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        authentication = CustomAPIKeyAuthentication()
+
+        # The benchmark key is rolled back with the transaction
+        with transaction.atomic():
+            api_key, key = APIKey.objects.create_key(name='benchmark-api-key')
+            request = Request(APIRequestFactory().get('/', HTTP_API_KEY=key))
+
+            uncached = self._run(authentication, request, iterations, use_cache=False)
+            verified_api_keys.clear()
+            authentication.authenticate(request)
+            cached = self._run(authentication, request, iterations, use_cache=True)
+            transaction.set_rollback(True)
+        # The rollback sends no post_delete signal
+        purge_api_key(api_key.prefix)
+
+        self._report('uncached', uncached)
+        self._report('cached', cached)
+        self.stdout.write(self.style.SUCCESS(
+            f'Speedup x{statistics.mean(uncached) / statistics.mean(cached):.1f} over {iterations} iterations'
+        ))
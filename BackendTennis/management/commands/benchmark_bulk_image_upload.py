@@ -0,0 +1,83 @@
+import json
+import shutil
+import tempfile
+import time
+from io import BytesIO
+
+from PIL import Image as PilImage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory
+from rest_framework_api_key.models import APIKey
+from rest_framework_simplejwt.tokens import AccessToken
+
+from BackendTennis.constant import Constant
+from BackendTennis.models import User
+from BackendTennis.services.api_key_cache_service import purge_api_key
+from BackendTennis.views import BulkImageUploadView
+
+
+class Command(BaseCommand):
+    help = 'Measure BulkImageUploadView with a single upload worker and with IMAGE_BULK_UPLOAD_WORKERS workers'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=200, help='Number of images per upload')
+        parser.add_argument('--size', type=int, default=1600, help='Width in pixels of the generated images')
+        parser.add_argument('--workers', type=int, default=4, help='Upload workers of the parallel run')
+
+    @staticmethod
+    def _build_payload(count, size):
+        pil_image = PilImage.effect_noise((size, size * 2 // 3), 64).convert('RGB')
+        buffer = BytesIO()
+        pil_image.save(buffer, 'jpeg', quality=90)
+        content = buffer.getvalue()
+
+        images_data = [
+            {'index': index, 'title': f'benchmark {index}', 'type': Constant.IMAGE_TYPE.SPONSOR}
+            for index in range(count)
+        ]
+        payload = {'images_data': json.dumps(images_data)}
+        for index in range(count):
+            payload[f'image_{index}'] = SimpleUploadedFile(f'{index}.jpg', content, content_type='image/jpeg')
+        return payload, len(content)
+
+    def _upload(self, count, size, headers):
+        payload, file_size = self._build_payload(count, size)
+        request = APIRequestFactory().post('/BackendTennis/images/batch-create/', payload, format='multipart', **headers)
+        start = time.perf_counter()
+        response = BulkImageUploadView.as_view()(request)
+        duration = time.perf_counter() - start
+        if response.status_code != 201:
+            self.stderr.write(f'Unexpected status {response.status_code} : {response.data.get("error")}')
+        return duration, file_size
+
+    def handle(self, *args, **options):
+        count = options['count']
+        media_root = tempfile.mkdtemp()
+        try:
+            # Everything created by the benchmark is rolled back, the files are written in a temporary directory
+            with override_settings(MEDIA_ROOT=media_root, ALLOWED_HOSTS=['testserver']), transaction.atomic():
+                user = User.objects.create_superuser(
+                    email='benchmark@example.com',
+                    password='benchmark',
+                    first_name='Bench',
+                    last_name='Mark',
+                    birthdate='1990-01-01'
+                )
+                api_key, key = APIKey.objects.create_key(name='benchmark-api-key')
+                headers = {'HTTP_API_KEY': key, 'HTTP_AUTHORIZATION': f'Bearer {AccessToken.for_user(user)}'}
+
+                results = {}
+                for workers in [1, options['workers']]:
+                    with override_settings(IMAGE_BULK_UPLOAD_WORKERS=workers):
+                        results[workers], file_size = self._upload(count, options['size'], headers)
+                transaction.set_rollback(True)
+            purge_api_key(api_key.prefix)
+        finally:
+            shutil.rmtree(media_root, ignore_errors=True)
+
+        self.stdout.write(f'{count} images of {file_size / 1024:.0f} KiB')
+        for workers, duration in results.items():
+            self.stdout.write(f'{workers:>2} worker(s) : {duration:7.2f} s ({count / duration:6.1f} images/s)')
@@ -0,0 +1,88 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count
+
+from BackendTennis.constant import Constant
+from BackendTennis.models import Image, Tag
+from BackendTennis.services.image_tag_filter_service import filter_images_by_tags
+
+
+class Command(BaseCommand):
+    help = 'Compare the former Count() tag filter of the image list with the EXISTS one on generated images'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--images', type=int, default=100000, help='Number of generated images')
+        parser.add_argument('--tags', type=int, default=50, help='Number of generated tags')
+        parser.add_argument('--tags-per-image', type=int, default=3, help='Tags linked to every image')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs of every query, the best one is kept')
+
+    @staticmethod
+    def _count_filter(names):
+        # Filter used by ImageListCreateView before the EXISTS one
+        return Image.objects.filter(tags__name__in=names).annotate(
+            tag_count=Count('tags__name')).filter(tag_count=len(names))
+
+    @staticmethod
+    def _measure(build_queryset, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            # Same work as a page of the view: the count and the first 40 rows
+            queryset = build_queryset().order_by('createAt')
+            queryset.count()
+            list(queryset[:40])
+            duration = time.perf_counter() - start
+            best = duration if best is None else min(best, duration)
+        return best
+
+    def _generate(self, image_count, tag_count, tags_per_image):
+        random.seed(0)
+        tags = Tag.objects.bulk_create([Tag(name=f'benchmark-tag-{index}') for index in range(tag_count)])
+        # Skewed popularity, the first tags are on most images
+        weights = [1 / (index + 1) for index in range(tag_count)]
+        through = Image.tags.through
+        for offset in range(0, image_count, 5000):
+            images = Image.objects.bulk_create([
+                Image(title=f'benchmark {index}', type=Constant.IMAGE_TYPE.PICTURE)
+                for index in range(offset, min(offset + 5000, image_count))
+            ])
+            through.objects.bulk_create([
+                through(image_id=image.id, tag_id=tag.id)
+                for image in images
+                for tag in set(random.choices(tags, weights=weights, k=tags_per_image))
+            ])
+        with connection.cursor() as cursor:
+            for model in [Image, through, Tag]:
+                cursor.execute(f'ANALYZE {connection.ops.quote_name(model._meta.db_table)}')
+        return [tag.name for tag in tags]
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        with transaction.atomic():
+            self.stdout.write(f'Generating {options["images"]} images and {options["tags"]} tags')
+            names = self._generate(options['images'], options['tags'], options['tags_per_image'])
+            cases = {
+                'one popular tag': names[:1],
+                'two popular tags': names[:2],
+                'popular and rare tags': [names[0], names[-1]],
+                'three rare tags': names[-3:],
+            }
+            self.stdout.write(f'{"case":<24}{"count()":>12}{"all (exists)":>14}{"any (exists)":>14}')
+            for case, case_names in cases.items():
+                count_duration = self._measure(lambda: self._count_filter(case_names), repeat)
+                all_duration = self._measure(
+                    lambda: filter_images_by_tags(Image.objects.all(), case_names, Constant.TAG_MATCH_MODE.ALL),
+                    repeat
+                )
+                any_duration = self._measure(
+                    lambda: filter_images_by_tags(Image.objects.all(), case_names, Constant.TAG_MATCH_MODE.ANY),
+                    repeat
+                )
+                self.stdout.write(
+                    f'{case:<24}{count_duration * 1000:>10.1f}ms{all_duration * 1000:>12.1f}ms'
+                    f'{any_duration * 1000:>12.1f}ms'
+                )
+            transaction.set_rollback(True)
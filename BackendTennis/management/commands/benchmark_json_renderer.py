@@ -0,0 +1,100 @@
+import random
+import time
+from datetime import date, timedelta
+from io import BytesIO
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from BackendTennis.constant import Constant
+from BackendTennis.models import Image, Tag, Training, User
+from BackendTennis.parsers import ORJSONParser
+from BackendTennis.renderers import ORJSONRenderer
+from BackendTennis.services.static_snapshot_service import get_public_response
+
+# List endpoints compared, on top of the generated rows
+BENCHMARK_PATHS = [
+    '/BackendTennis/image/?page_size=500',
+    '/BackendTennis/training/?page_size=100',
+    '/BackendTennis/tag/?page_size=100',
+    '/BackendTennis/navigation_item/',
+    '/BackendTennis/site_bundle/',
+]
+
+
+class Command(BaseCommand):
+    help = 'Compare the throughput of the DRF JSON renderer and parser with the orjson ones on the list endpoints'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--images', type=int, default=500, help='Number of generated images')
+        parser.add_argument('--trainings', type=int, default=100, help='Number of generated trainings')
+        parser.add_argument('--participants', type=int, default=20, help='Participants of every training')
+        parser.add_argument('--repeat', type=int, default=20, help='Runs of every measure, the best one is kept')
+
+    @staticmethod
+    def _measure(function, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            duration = time.perf_counter() - start
+            best = duration if best is None else min(best, duration)
+        return best
+
+    def _generate(self, image_count, training_count, participant_count):
+        random.seed(0)
+        tags = Tag.objects.bulk_create([Tag(name=f'benchmark-tag-{index}') for index in range(20)])
+        images = Image.objects.bulk_create([
+            Image(title=f'benchmark {index}', type=Constant.IMAGE_TYPE.PICTURE) for index in range(image_count)
+        ])
+        Image.tags.through.objects.bulk_create([
+            Image.tags.through(image_id=image.id, tag_id=tag.id)
+            for image in images
+            for tag in random.sample(tags, 3)
+        ])
+
+        users = User.objects.bulk_create([
+            User(
+                email=f'benchmark-{index}@example.com',
+                first_name='Benchmark',
+                last_name=f'User {index}',
+                birthdate=date(1990, 1, 1)
+            )
+            for index in range(participant_count)
+        ])
+        now = timezone.now()
+        trainings = Training.objects.bulk_create([
+            Training(name=f'benchmark {index}', start=now + timedelta(days=index), end=now + timedelta(days=index, hours=1))
+            for index in range(training_count)
+        ])
+        Training.participants.through.objects.bulk_create([
+            Training.participants.through(training_id=training.id, user_id=user.id)
+            for training in trainings
+            for user in users
+        ])
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        with transaction.atomic():
+            self.stdout.write(f'Generating {options["images"]} images and {options["trainings"]} trainings')
+            self._generate(options['images'], options['trainings'], options['participants'])
+
+            self.stdout.write(
+                f'{"endpoint":<42}{"size":>10}{"render json":>14}{"orjson":>10}{"parse json":>14}{"orjson":>10}'
+            )
+            for path in BENCHMARK_PATHS:
+                data = get_public_response(path, 'http://localhost:8000').data
+                content = JSONRenderer().render(data)
+                render_duration = self._measure(lambda: JSONRenderer().render(data), repeat)
+                orjson_render_duration = self._measure(lambda: ORJSONRenderer().render(data), repeat)
+                parse_duration = self._measure(lambda: JSONParser().parse(BytesIO(content)), repeat)
+                orjson_parse_duration = self._measure(lambda: ORJSONParser().parse(BytesIO(content)), repeat)
+                self.stdout.write(
+                    f'{path:<42}{len(content) / 1024:>8.0f}kB'
+                    f'{render_duration * 1000:>12.2f}ms{orjson_render_duration * 1000:>8.2f}ms'
+                    f'{parse_duration * 1000:>12.2f}ms{orjson_parse_duration * 1000:>8.2f}ms'
+                )
+            transaction.set_rollback(True)
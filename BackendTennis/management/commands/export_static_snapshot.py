@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from BackendTennis.services.static_snapshot_service import export_static_snapshot, get_snapshot_root, \
+    get_snapshot_base_url
+
+
+class Command(BaseCommand):
+    help = 'Export the public GET payloads to immutable JSON files listed in a manifest, see STATIC_SNAPSHOT'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--root', help='Output directory, STATIC_SNAPSHOT ROOT by default')
+        parser.add_argument(
+            '--base-url',
+            help='Scheme and host of the absolute image URLs, STATIC_SNAPSHOT BASE_URL by default'
+        )
+
+    def handle(self, *args, **options):
+        root = options['root'] or get_snapshot_root()
+        if root is None:
+            raise CommandError('No output directory, set STATIC_SNAPSHOT ROOT or use --root')
+        base_url = options['base_url'] or get_snapshot_base_url()
+        if base_url is None:
+            raise CommandError('No image URL host, set STATIC_SNAPSHOT BASE_URL or use --base-url')
+
+        manifest = export_static_snapshot(root, base_url)
+        for snapshot in manifest['files'].values():
+            self.stdout.write(f'{snapshot["path"]:<32}{snapshot["file"]}')
+        self.stdout.write(self.style.SUCCESS(f'{len(manifest["files"])} payloads exported to {root}'))
@@ -0,0 +1,115 @@
+import os
+import shutil
+import tempfile
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import override_settings
+
+from BackendTennis.benchmarks.data import generate_benchmark_data
+from BackendTennis.benchmarks.runner import run_scenario, compare_with_baseline, read_baseline, write_baseline, \
+    get_peak_rss_mb, BenchmarkError
+from BackendTennis.benchmarks.scenarios import SCENARIOS
+from BackendTennis.services.api_key_cache_service import verified_api_keys
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'benchmarks',
+                                'baseline.json')
+
+
+def get_benchmark_caches():
+    """
+    Empty process-local caches for every alias: the generated data is rolled back without any signal, its cached
+    payloads and permissions must not reach the configured (maybe shared) caches.
+    """
+    run_id = uuid.uuid4().hex
+    return {
+        alias: {**config, 'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': f'benchmark-{alias}-{run_id}'}
+        for alias, config in settings.CACHES.items()
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        'Run the API benchmark scenarios on generated data and report latency percentiles, queries per request '
+        'and peak RSS. Fails when a result is worse than the stored baseline.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scenario', action='append', choices=list(SCENARIOS),
+                            help='Scenario to run, may be repeated (all by default)')
+        parser.add_argument('--scale', type=float, default=1, help='Multiplier of the generated row counts')
+        parser.add_argument('--iterations', type=int, default=20, help='Measured runs of every scenario')
+        parser.add_argument('--warmup', type=int, default=2, help='Runs of every scenario before measuring')
+        parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline results file (JSON)')
+        parser.add_argument('--save-baseline', action='store_true', help='Store the results as the new baseline')
+        parser.add_argument('--tolerance', type=float, default=0.25,
+                            help='Allowed growth ratio of the latencies and of the peak RSS over the baseline')
+
+    def _report(self, results):
+        self.stdout.write(
+            f'{"scenario":<20}{"requests":>9}{"req/s":>8}{"p50":>10}{"p95":>10}{"p99":>10}'
+            f'{"queries":>9}{"max":>5}'
+        )
+        for name, result in results['scenarios'].items():
+            self.stdout.write(
+                f'{name:<20}{result["requests"]:>9}{result["requests_per_second"]:>8.1f}'
+                f'{result["p50_ms"]:>8.1f}ms{result["p95_ms"]:>8.1f}ms{result["p99_ms"]:>8.1f}ms'
+                f'{result["queries_per_request"]:>9.1f}{result["max_queries"]:>5}'
+            )
+        self.stdout.write(f'Peak RSS of the run: {results["peak_rss_mb"]:.1f}MiB')
+
+    def handle(self, *args, **options):
+        names = options['scenario'] or list(SCENARIOS)
+        results = {'scale': options['scale'], 'iterations': options['iterations'], 'scenarios': {}}
+        media_root = tempfile.mkdtemp()
+        benchmark_caches = get_benchmark_caches()
+        try:
+            # Everything created by the benchmark is rolled back, the uploads are written in a temporary directory
+            # and the caches are process-local ones dropped at the end
+            with override_settings(MEDIA_ROOT=media_root, ALLOWED_HOSTS=['testserver'], CACHES=benchmark_caches), \
+                    transaction.atomic():
+                try:
+                    self.stdout.write(f'Generating the data set (scale {options["scale"]})')
+                    data = generate_benchmark_data(options['scale'])
+                    for name in names:
+                        self.stdout.write(f'Running {name}')
+                        results['scenarios'][name] = run_scenario(
+                            name, data, options['iterations'], options['warmup']
+                        )
+                    transaction.set_rollback(True)
+                finally:
+                    for alias in benchmark_caches:
+                        caches[alias].clear()
+        except BenchmarkError as e:
+            raise CommandError(str(e))
+        finally:
+            shutil.rmtree(media_root, ignore_errors=True)
+            verified_api_keys.clear()
+        results['peak_rss_mb'] = get_peak_rss_mb()
+
+        self._report(results)
+
+        if options['save_baseline']:
+            write_baseline(options['baseline'], results)
+            self.stdout.write(f'Baseline stored in {options["baseline"]}')
+            return
+
+        baseline = read_baseline(options['baseline'])
+        if baseline is None:
+            self.stdout.write(f'No baseline in {options["baseline"]}, store one with --save-baseline')
+            return
+        if (baseline['scale'], baseline['iterations']) != (results['scale'], results['iterations']):
+            raise CommandError(
+                f'The baseline was run with scale {baseline["scale"]} and {baseline["iterations"]} iterations'
+            )
+
+        regressions = compare_with_baseline(results, baseline, options['tolerance'])
+        for regression in regressions:
+            self.stderr.write(regression)
+        if regressions:
+            raise CommandError(f'{len(regressions)} regression(s) over the baseline')
+        self.stdout.write('No regression over the baseline')
@@ -0,0 +1,46 @@
+import time
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+from BackendTennis.services.metrics_service import get_metrics_setting, record_request_metrics
+from BackendTennis.services.request_timing_service import get_current_request_timing, get_request_timing_setting, \
+    log_request_timing, record_query, request_timing_stats, start_request_timing
+
+
+class RequestTimingMiddleware:
+    """
+    Measure every request of the BackendTennis views: query count and database time, authentication time,
+    serialization time (see SerializationTimingMixin) and rendering time. They are sent back in the Server-Timing header, logged, kept in memory for the percentiles
+    of the request_timing_stats endpoint and added to the Prometheus metrics.
+    """
+
+    def __init__(self, get_response):
+        if not get_request_timing_setting('ENABLED'):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with start_request_timing() as timing, connection.execute_wrapper(record_query):
+            response = self.get_response(request)
+
+        resolver_match = request.resolver_match
+        if resolver_match is None or 'BackendTennis' not in resolver_match.namespaces:
+            return response
+
+        response['Server-Timing'] = timing.get_server_timing_header()
+        log_request_timing(resolver_match.view_name, request.method, response.status_code, timing)
+        request_timing_stats.add(resolver_match.view_name, timing)
+        if get_metrics_setting('ENABLED'):
+            response_size = None if response.streaming else len(response.content)
+            record_request_metrics(resolver_match.view_name, request.method, response.status_code, timing,
+                                   response_size)
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered right after this hook
+        timing = get_current_request_timing()
+        if timing is not None:
+            start = time.perf_counter()
+            response.add_post_render_callback(lambda _: timing.add('render', time.perf_counter() - start))
+        return response
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('BackendTennis', '0036_alter_teammember_fullnames'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='image',
+            name='derivatives',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
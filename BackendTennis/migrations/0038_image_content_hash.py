@@ -0,0 +1,26 @@
+import BackendTennis.utils.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('BackendTennis', '0037_image_derivatives'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='image',
+            name='contentHash',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='image',
+            name='imageUrl',
+            field=models.ImageField(
+                blank=True,
+                db_index=True,
+                null=True,
+                upload_to=BackendTennis.utils.utils.compute_image_url
+            ),
+        ),
+    ]
@@ -0,0 +1,224 @@
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# (page model, m2m field, link model, link page field, link object field)
+PAGE_LINKS = [
+    ('aboutpage', 'clubValues', 'aboutpageclubvalue', 'aboutPage', 'clubValue'),
+    ('aboutpage', 'sponsors', 'aboutpagesponsor', 'aboutPage', 'sponsor'),
+    ('teampage', 'professors', 'teampageprofessor', 'teamPage', 'professor'),
+    ('teampage', 'teamMembers', 'teampageteammember', 'teamPage', 'teamMember'),
+]
+
+
+def copy_links(apps, from_implicit):
+    """
+    Copy the rows between the implicit many to many tables and the link models. The object order is copied on
+    the new links, an order already used in the page (forbidden but never enforced by the database) is left NULL.
+    """
+    for page_model_name, m2m_name, link_model_name, page_field, object_field in PAGE_LINKS:
+        page_model = apps.get_model('BackendTennis', page_model_name)
+        link_model = apps.get_model('BackendTennis', link_model_name)
+        implicit_through = page_model._meta.get_field(m2m_name).remote_field.through
+        implicit_page_field = page_model._meta.model_name
+        implicit_object_field = link_model._meta.get_field(object_field).related_model._meta.model_name
+
+        if from_implicit:
+            used_orders = set()
+            links = []
+            for page_id, object_id, order in implicit_through.objects.values_list(
+                    implicit_page_field, implicit_object_field, f'{implicit_object_field}__order'
+            ).order_by(f'{implicit_object_field}__createAt'):
+                links.append(link_model(**{
+                    f'{page_field}_id': page_id,
+                    f'{object_field}_id': object_id,
+                    'order': order if (page_id, order) not in used_orders else None
+                }))
+                used_orders.add((page_id, order))
+            link_model.objects.bulk_create(links)
+        else:
+            implicit_through.objects.bulk_create([
+                implicit_through(**{f'{implicit_page_field}_id': page_id, f'{implicit_object_field}_id': object_id})
+                for page_id, object_id in link_model.objects.values_list(page_field, object_field)
+            ])
+
+
+def copy_implicit_links(apps, schema_editor):
+    copy_links(apps, from_implicit=True)
+
+
+def copy_links_to_implicit(apps, schema_editor):
+    copy_links(apps, from_implicit=False)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('BackendTennis', '0038_image_content_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AboutPageClubValue',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('order', models.IntegerField(blank=True, null=True)),
+                ('aboutPage', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='club_value_links',
+                    to='BackendTennis.aboutpage'
+                )),
+                ('clubValue', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='about_page_links',
+                    to='BackendTennis.clubvalue'
+                )),
+            ],
+            options={
+                'constraints': [
+                    models.UniqueConstraint(fields=('aboutPage', 'clubValue'), name='unique_about_page_club_value'),
+                    models.UniqueConstraint(
+                        deferrable=models.Deferrable['IMMEDIATE'],
+                        fields=('aboutPage', 'order'),
+                        name='unique_about_page_club_value_order'
+                    ),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name='AboutPageSponsor',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('order', models.IntegerField(blank=True, null=True)),
+                ('aboutPage', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='sponsor_links',
+                    to='BackendTennis.aboutpage'
+                )),
+                ('sponsor', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='about_page_links',
+                    to='BackendTennis.sponsor'
+                )),
+            ],
+            options={
+                'constraints': [
+                    models.UniqueConstraint(fields=('aboutPage', 'sponsor'), name='unique_about_page_sponsor'),
+                    models.UniqueConstraint(
+                        deferrable=models.Deferrable['IMMEDIATE'],
+                        fields=('aboutPage', 'order'),
+                        name='unique_about_page_sponsor_order'
+                    ),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name='TeamPageProfessor',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('order', models.IntegerField(blank=True, null=True)),
+                ('teamPage', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='professor_links',
+                    to='BackendTennis.teampage'
+                )),
+                ('professor', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='team_page_links',
+                    to='BackendTennis.professor'
+                )),
+            ],
+            options={
+                'constraints': [
+                    models.UniqueConstraint(fields=('teamPage', 'professor'), name='unique_team_page_professor'),
+                    models.UniqueConstraint(
+                        deferrable=models.Deferrable['IMMEDIATE'],
+                        fields=('teamPage', 'order'),
+                        name='unique_team_page_professor_order'
+                    ),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name='TeamPageTeamMember',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('order', models.IntegerField(blank=True, null=True)),
+                ('teamPage', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='team_member_links',
+                    to='BackendTennis.teampage'
+                )),
+                ('teamMember', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='team_page_links',
+                    to='BackendTennis.teammember'
+                )),
+            ],
+            options={
+                'constraints': [
+                    models.UniqueConstraint(fields=('teamPage', 'teamMember'), name='unique_team_page_team_member'),
+                    models.UniqueConstraint(
+                        deferrable=models.Deferrable['IMMEDIATE'],
+                        fields=('teamPage', 'order'),
+                        name='unique_team_page_team_member_order'
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(copy_implicit_links, copy_links_to_implicit),
+        migrations.RemoveField(
+            model_name='aboutpage',
+            name='clubValues',
+        ),
+        migrations.RemoveField(
+            model_name='aboutpage',
+            name='sponsors',
+        ),
+        migrations.RemoveField(
+            model_name='teampage',
+            name='professors',
+        ),
+        migrations.RemoveField(
+            model_name='teampage',
+            name='teamMembers',
+        ),
+        migrations.AddField(
+            model_name='aboutpage',
+            name='clubValues',
+            field=models.ManyToManyField(
+                blank=True,
+                related_name='about_pages',
+                through='BackendTennis.AboutPageClubValue',
+                to='BackendTennis.clubvalue'
+            ),
+        ),
+        migrations.AddField(
+            model_name='aboutpage',
+            name='sponsors',
+            field=models.ManyToManyField(
+                blank=True,
+                related_name='about_pages',
+                through='BackendTennis.AboutPageSponsor',
+                to='BackendTennis.sponsor'
+            ),
+        ),
+        migrations.AddField(
+            model_name='teampage',
+            name='professors',
+            field=models.ManyToManyField(
+                related_name='team_pages',
+                through='BackendTennis.TeamPageProfessor',
+                to='BackendTennis.professor'
+            ),
+        ),
+        migrations.AddField(
+            model_name='teampage',
+            name='teamMembers',
+            field=models.ManyToManyField(
+                related_name='team_pages',
+                through='BackendTennis.TeamPageTeamMember',
+                to='BackendTennis.teammember'
+            ),
+        ),
+    ]
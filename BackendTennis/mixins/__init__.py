@@ -1 +1,3 @@
 from .unique_order_validation_mixin import UniqueOrderValidationMixin
+from .dynamic_fields_mixin import DynamicFieldsSerializerMixin, DynamicFieldsViewMixin
+from .streaming_list_mixin import StreamingListMixin
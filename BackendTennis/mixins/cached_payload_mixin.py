@@ -0,0 +1,37 @@
+from rest_framework.response import Response
+
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
+from BackendTennis.services.payload_cache_service import get_or_build_payload
+
+
+class CachedPayloadMixin(ConditionalGetMixin):
+    """
+    Serve GET responses from the precomputed payload of `payload_group`.
+    The payload is rebuilt only after a change on one of the models of the group (see signals),
+    its ETag replaces the updateAt based validator since it also covers the related models.
+    A payload is kept by scheme and host: its absolute URLs (images, pagination links) are the ones of its request.
+    """
+    payload_group = None
+
+    def get_payload_name(self) -> str:
+        if self.is_detail_request():
+            return str(self.kwargs[self.lookup_url_kwarg or self.lookup_field])
+        return 'list'
+
+    def get_payload_key(self) -> str:
+        return f'{self.request.scheme}://{self.request.get_host()}/{self.get_payload_name()}'
+
+    def build_payload_response(self) -> Response:
+        if self.is_detail_request():
+            return self.retrieve(self.request, *self.args, **self.kwargs)
+        return self.list(self.request, *self.args, **self.kwargs)
+
+    def build_payload_data(self):
+        return self.build_payload_response().data
+
+    def get_conditional_validator(self):
+        self._payload = get_or_build_payload(self.payload_group, self.get_payload_key(), self.build_payload_data)
+        return self._payload['etag'], None
+
+    def get_cached_response(self) -> Response:
+        return Response(self._payload['data'])
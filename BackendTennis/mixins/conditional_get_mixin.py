@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connection
+from django.db.models import Count, Func, Max, Sum, Value, BigIntegerField, CharField, DateTimeField, TextField
+from django.db.models.functions import Cast
+from django.utils.http import http_date
+from rest_framework import serializers, status
+from rest_framework.response import Response
+
+from BackendTennis.mixins.serialization_timing_mixin import SerializationTimingMixin
+from BackendTennis.utils.http_utils import compute_etag, is_not_modified
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from typing import Dict, List, Optional, Tuple
+    from django.db.models import Model
+
+
+class _NotModified(Exception):
+    pass
+
+
+def get_rendered_related_models(model: type[Model], fields: Dict[str, serializers.Field]) -> List[type[Model]]:
+    """
+    Models whose rows are rendered by `fields` besides the row of `model`: the models reached by the relations, as
+    primary keys or nested (walked down), and the through models of the many to many ones.
+    A model rendering method fields is included too, they may render any row of its table (e.g. its parents), as is
+    `model` when a relation comes back to it.
+    """
+    related_models = []
+    walked_models = {model}
+
+    def add(related_model):
+        if related_model not in related_models:
+            related_models.append(related_model)
+
+    def collect(current_model, current_fields):
+        for field in current_fields.values():
+            if field.source == '*':
+                if isinstance(field, serializers.SerializerMethodField):
+                    add(current_model)
+                continue
+            try:
+                model_field = current_model._meta.get_field(field.source.split('.')[0])
+            except FieldDoesNotExist:
+                continue
+            related_model = model_field.related_model
+            if related_model is None:
+                continue
+            if model_field.many_to_many:
+                add(model_field.remote_field.through if model_field.concrete else model_field.through)
+            add(related_model)
+            if related_model in walked_models:
+                continue
+            walked_models.add(related_model)
+            nested = field.child if isinstance(field, serializers.ListSerializer) else field
+            if isinstance(nested, serializers.Serializer):
+                collect(related_model, nested.fields)
+
+    collect(model, fields)
+    return related_models
+
+
+def _has_field(model: type[Model], name: str) -> bool:
+    try:
+        model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+def _get_pk_checksum():
+    """
+    Sum of the hashes of the primary keys: for the tables without updateAt (through tables), a link replaced by
+    another one changes it, the count stays the same.
+    """
+    if connection.vendor != 'postgresql':
+        return Value(None, output_field=TextField())
+    return Cast(
+        Sum(Func(Cast('pk', TextField()), Value(0), function='hashtextextended', output_field=BigIntegerField())),
+        TextField()
+    )
+
+
+class ConditionalGetMixin(SerializationTimingMixin):
+    """
+    Answer GET requests with 304 Not Modified before any serialization runs.
+    Lists are validated with max(updateAt) and count over the filtered queryset (and the query string, so every
+    page gets its own ETag), details with the updateAt of the row.
+    Both include max(updateAt) and count of the tables of the related models the serializer renders, and count
+    and checksum of the through tables of its many to many relations, read in one query: a change of a nested row
+    or of a link is a change of the response.
+    Validators are computed after authentication and permission checks.
+    The serialization of the GET views is timed by SerializationTimingMixin.
+    """
+    conditional_field = 'updateAt'
+
+    def get_related_tables_state(self) -> List[Tuple[str, str, int, str]]:
+        """
+        (table, max(updateAt), count, checksum) of every related and through model rendered by the serializer of
+        the request, the checksum of the primary keys for the tables without updateAt.
+        """
+        serializer = self.get_serializer()
+        related_models = get_rendered_related_models(serializer.Meta.model, serializer.fields)
+        querysets = []
+        for related_model in related_models:
+            has_conditional_field = _has_field(related_model, self.conditional_field)
+            querysets.append(
+                related_model.objects.order_by()
+                .annotate(table=Value(related_model._meta.db_table, output_field=CharField()))
+                .values('table')
+                .annotate(
+                    last_update=Max(self.conditional_field) if has_conditional_field
+                    else Value(None, output_field=DateTimeField()),
+                    count=Count('pk'),
+                    checksum=Value(None, output_field=TextField()) if has_conditional_field
+                    else _get_pk_checksum()
+                )
+                .values_list('table', 'last_update', 'count', 'checksum')
+            )
+        if not querysets:
+            return []
+        rows = querysets[0].union(*querysets[1:], all=True) if len(querysets) > 1 else querysets[0]
+        return sorted(
+            (table, str(last_update), count, str(checksum)) for table, last_update, count, checksum in rows
+        )
+
+    def is_detail_request(self) -> bool:
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        return lookup_url_kwarg in self.kwargs
+
+    def get_list_validator(self) -> Tuple[str, Optional[datetime]]:
+        queryset = self.filter_queryset(self.get_queryset())
+        aggregate = queryset.order_by().aggregate(last_update=Max(self.conditional_field), count=Count('pk'))
+        etag = compute_etag(
+            self.__class__.__name__,
+            self.request.get_full_path(),
+            aggregate['last_update'].isoformat() if aggregate['last_update'] else '',
+            aggregate['count'],
+            self.get_related_tables_state()
+        )
+        # No Last-Modified on lists: a deletion does not move max(updateAt)
+        return etag, None
+
+    def get_detail_validator(self) -> Tuple[str, Optional[datetime]]:
+        self._conditional_object = self.get_object()
+        last_update = getattr(self._conditional_object, self.conditional_field)
+        related_tables_state = self.get_related_tables_state()
+        etag = compute_etag(
+            self.__class__.__name__, self._conditional_object.pk, last_update.isoformat(), related_tables_state
+        )
+        # No Last-Modified with related rows: a deletion does not move their max(updateAt)
+        return etag, None if related_tables_state else last_update
+
+    def get_conditional_validator(self) -> Tuple[str, Optional[datetime]]:
+        if self.is_detail_request():
+            return self.get_detail_validator()
+        return self.get_list_validator()
+
+    def get_object(self):
+        if getattr(self, '_conditional_object', None) is not None:
+            return self._conditional_object
+        return super().get_object()
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._conditional_object = None
+        self._conditional_validator = None
+        if request.method in ['GET', 'HEAD']:
+            self._conditional_validator = self.get_conditional_validator()
+            if is_not_modified(request, *self._conditional_validator):
+                raise _NotModified()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, _NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        validator = getattr(self, '_conditional_validator', None)
+        if validator and response.status_code in [status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED]:
+            etag, last_modified = validator
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified.timestamp())
+        return response
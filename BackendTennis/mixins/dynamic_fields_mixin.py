@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from django.db.models.constants import LOOKUP_SEP
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+from BackendTennis.utils.http_utils import compute_etag
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, List, Optional, Set
+    from django.db.models import QuerySet
+
+_NESTED = 'nested'
+_PK = 'pk'
+
+DYNAMIC_FIELDS_PARAMETERS = [
+    OpenApiParameter(name='fields', description='Comma-separated list of the fields to return', required=False,
+                     type=str),
+    OpenApiParameter(name='expand', description='Comma-separated list of the relations to return as objects, the '
+                                                'others are returned as ids', required=False, type=str),
+]
+
+
+def parse_field_names(value: Optional[str]) -> Optional[Set[str]]:
+    """`a,b` -> {'a', 'b'}, None when the query parameter is missing."""
+    if value is None:
+        return None
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+
+def _is_root_serializer(serializer) -> bool:
+    parent = serializer.parent
+    return parent is None or (isinstance(parent, serializers.ListSerializer) and parent.parent is None)
+
+
+class DynamicFieldsSerializerMixin:
+    """
+    Sparse fieldsets for the root serializer, read from the context:
+    - `fields`: only these fields are rendered (unknown names are ignored)
+    - `expand`: only these nested serializers are rendered, the other relations are rendered as primary keys
+    Without these context keys every field is rendered as declared.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not _is_root_serializer(self):
+            return fields
+
+        field_names = self.context.get('fields')
+        if field_names is not None:
+            fields = {name: field for name, field in fields.items() if name in field_names}
+
+        expand = self.context.get('expand')
+        if expand is not None:
+            for name, field in fields.items():
+                if isinstance(field, serializers.BaseSerializer) and name not in expand:
+                    fields[name] = serializers.PrimaryKeyRelatedField(
+                        read_only=True,
+                        source=field.source,
+                        many=isinstance(field, serializers.ListSerializer)
+                    )
+        return fields
+
+
+def get_rendered_relations(fields: Iterable[serializers.Field]) -> Dict[str, str]:
+    """Relation name -> how it is rendered: nested (serializers, method fields) or as primary keys."""
+    relations = {}
+    for field in fields:
+        if isinstance(field, serializers.SerializerMethodField):
+            # Method fields read the relation of the same name
+            relations[field.field_name] = _NESTED
+        elif isinstance(field, serializers.BaseSerializer):
+            relations[field.source.split('.')[0]] = _NESTED
+        elif isinstance(field, (serializers.RelatedField, serializers.ManyRelatedField)):
+            relations[field.source.split('.')[0]] = _PK
+    return relations
+
+
+def _is_many_relation(model, name: str) -> bool:
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return True
+    return field.many_to_many or field.one_to_many
+
+
+def _flatten_select_related(tree: Dict, prefix: str = '') -> List[str]:
+    paths = []
+    for name, children in tree.items():
+        path = f'{prefix}{name}'
+        paths.extend(_flatten_select_related(children, f'{path}{LOOKUP_SEP}') if children else [path])
+    return paths
+
+
+def prune_related_lookups(queryset: QuerySet, fields: Iterable[serializers.Field]) -> QuerySet:
+    """
+    Keep only the select_related / prefetch_related lookups of the relations the serializer renders.
+    A relation rendered as primary keys keeps a plain prefetch of its rows (many relations) or nothing (foreign keys,
+    the id is on the row), a relation which is not rendered is never queried.
+    """
+    relations = get_rendered_relations(fields)
+
+    select_related = queryset.query.select_related
+    if isinstance(select_related, dict):
+        kept_paths = [
+            path for path in _flatten_select_related(select_related)
+            if relations.get(path.split(LOOKUP_SEP)[0]) == _NESTED
+        ]
+        queryset = queryset.select_related(None)
+        if kept_paths:
+            queryset = queryset.select_related(*kept_paths)
+
+    kept_lookups = []
+    for lookup in queryset._prefetch_related_lookups:
+        path = lookup.prefetch_through if isinstance(lookup, Prefetch) else lookup
+        relation = path.split(LOOKUP_SEP)[0]
+        rendering = relations.get(relation)
+        if rendering == _NESTED:
+            kept_lookups.append(lookup)
+        elif rendering == _PK and _is_many_relation(queryset.model, relation) and relation not in kept_lookups:
+            kept_lookups.append(relation)
+    return queryset.prefetch_related(None).prefetch_related(*kept_lookups)
+
+
+class DynamicFieldsViewMixin:
+    """
+    `?fields=` and `?expand=` on GET: the response is rendered by `dynamic_serializer_class` with only the requested
+    fields and nested relations (the others as primary keys), by default all of them when it is already the
+    serializer of the view, none otherwise.
+    The related lookups of the queryset are pruned to the relations rendered by the serializer of the request.
+    """
+    dynamic_serializer_class = None
+
+    def is_dynamic_request(self) -> bool:
+        request = getattr(self, 'request', None)
+        if request is None or request.method not in SAFE_METHODS:
+            return False
+        return 'fields' in request.query_params or 'expand' in request.query_params
+
+    def get_serializer_class(self):
+        if self.is_dynamic_request():
+            return self.dynamic_serializer_class
+        return super().get_serializer_class()
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.is_dynamic_request():
+            expand = parse_field_names(self.request.query_params.get('expand'))
+            if expand is None and self.serializer_class is not self.dynamic_serializer_class:
+                expand = set()
+            context['fields'] = parse_field_names(self.request.query_params.get('fields'))
+            context['expand'] = expand
+        return context
+
+    def get_queryset(self):
+        return prune_related_lookups(super().get_queryset(), self.get_serializer().fields.values())
+
+    def get_detail_validator(self):
+        etag, last_modified = super().get_detail_validator()
+        if self.is_dynamic_request():
+            # Each fieldset of the row is its own representation
+            etag = compute_etag(etag, self.request.get_full_path())
+        return etag, last_modified
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db.models import Count, Max, Prefetch
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.permissions import SAFE_METHODS
+
+from BackendTennis.authentication.request_user import get_request_user
+from BackendTennis.constant import Constant, constant_participants_mode_list
+from BackendTennis.models import User
+from BackendTennis.services.permission_cache_service import has_cached_permission
+from BackendTennis.utils.http_utils import compute_etag
+from BackendTennis.validators import validate_participants_mode
+
+if TYPE_CHECKING:
+    from typing import Optional, Tuple
+    from django.db.models import QuerySet
+
+PARTICIPANTS_MODE_PARAMETERS = [
+    OpenApiParameter(name='participants', description='Participants returned as ids (default), as ids and display '
+                                                      'names (compact) or as users (full, users allowed to view '
+                                                      'the users only)',
+                     required=False, type=str, enum=constant_participants_mode_list),
+]
+
+
+class ParticipantsModeViewMixin:
+    """
+    `?participants=compact` or `?participants=full` on GET: the response is rendered by `compact_serializer_class`
+    (ids and display names of the participants) or `detail_serializer_class` (users with the ids of their children),
+    by the serializer of the view otherwise.
+    The participants, and their children in full mode, are prefetched: the query count does not grow with the rows.
+    The full mode renders the personal data of the users: on top of the permissions of the view, it requires an
+    authenticated user with `full_participants_permission`, the API key alone is not enough.
+    """
+    participants_query_param = 'participants'
+    compact_serializer_class = None
+    detail_serializer_class = None
+    full_participants_permission = 'BackendTennis.view_user'
+
+    def get_participants_mode(self) -> Optional[str]:
+        """The mode of a GET request, None for the other methods."""
+        request = getattr(self, 'request', None)
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+        mode = request.query_params.get(self.participants_query_param, Constant.PARTICIPANTS_MODE.IDS)
+        validate_participants_mode(mode)
+        return mode
+
+    def check_permissions(self, request):
+        super().check_permissions(request)
+        if self.get_participants_mode() == Constant.PARTICIPANTS_MODE.FULL:
+            user = get_request_user(request)
+            if user is None or not has_cached_permission(user, self.full_participants_permission):
+                self.permission_denied(request, message='Full participants are restricted to users allowed to view '
+                                                        'the users.')
+
+    def get_serializer_class(self):
+        mode = self.get_participants_mode()
+        if mode == Constant.PARTICIPANTS_MODE.COMPACT:
+            return self.compact_serializer_class
+        if mode == Constant.PARTICIPANTS_MODE.FULL:
+            return self.detail_serializer_class
+        return super().get_serializer_class()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        mode = self.get_participants_mode()
+        if mode == Constant.PARTICIPANTS_MODE.FULL:
+            participants = User.objects.prefetch_related('children')
+        elif mode == Constant.PARTICIPANTS_MODE.COMPACT:
+            participants = User.objects.only('id', 'first_name', 'last_name')
+        elif mode == Constant.PARTICIPANTS_MODE.IDS:
+            participants = User.objects.only('id')
+        else:
+            return queryset
+        return queryset.prefetch_related(Prefetch('participants', queryset=participants))
+
+    def get_participants_state(self, queryset: QuerySet) -> Tuple[str, int]:
+        """max(updateAt) and count of the participants of the rows of `queryset`."""
+        aggregate = queryset.order_by().aggregate(
+            last_update=Max('participants__updateAt'), count=Count('participants')
+        )
+        return aggregate['last_update'].isoformat() if aggregate['last_update'] else '', aggregate['count']
+
+    def get_list_validator(self):
+        etag, last_modified = super().get_list_validator()
+        mode = self.get_participants_mode()
+        if mode != Constant.PARTICIPANTS_MODE.IDS:
+            # The users rendered by the mode are part of the response
+            etag = compute_etag(etag, mode, self.get_participants_state(self.filter_queryset(self.get_queryset())))
+        return etag, last_modified
+
+    def get_detail_validator(self):
+        etag, last_modified = super().get_detail_validator()
+        mode = self.get_participants_mode()
+        if mode != Constant.PARTICIPANTS_MODE.IDS:
+            # Each mode of the row is its own representation, with the users it renders
+            participants_state = self.get_participants_state(
+                self.get_queryset().filter(pk=self._conditional_object.pk)
+            )
+            etag = compute_etag(etag, mode, participants_state)
+        return etag, last_modified
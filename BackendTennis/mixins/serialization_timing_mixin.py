@@ -0,0 +1,16 @@
+from BackendTennis.services.request_timing_service import timed_step
+
+
+class SerializationTimingMixin:
+    """
+    Add the list and retrieve actions to the `serialize` step of the request timing: the serializer data, with the
+    page or the row it reads. Their queries are also in the `db` step, as the ones of the authentication.
+    """
+
+    def list(self, request, *args, **kwargs):
+        with timed_step('serialize'):
+            return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        with timed_step('serialize'):
+            return super().retrieve(request, *args, **kwargs)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from django.http import StreamingHttpResponse
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.exceptions import ValidationError
+
+from BackendTennis.permissions.admin_permissions import AdminPermissions
+from BackendTennis.renderers import ORJSONRenderer
+
+if TYPE_CHECKING:
+    from typing import Iterator
+    from django.db.models import QuerySet
+
+STREAM_CONTENT_TYPES = {
+    'json': 'application/json',
+    'ndjson': 'application/x-ndjson',
+}
+
+STREAMING_LIST_PARAMETERS = [
+    OpenApiParameter(name='stream', description='Staff users only, return every row, unpaginated, as a streamed JSON '
+                                                'array (json) or one JSON object per line (ndjson)',
+                     required=False, type=str, enum=list(STREAM_CONTENT_TYPES)),
+]
+
+
+class StreamingListMixin:
+    """
+    `?stream=json` or `?stream=ndjson` on a list: every row of the filtered queryset is returned without pagination,
+    read with a server-side cursor `stream_chunk_size` rows at a time (prefetches included) and serialized chunk by
+    chunk into a StreamingHttpResponse, so the memory used does not grow with the table.
+    A whole table is an export: on top of the permissions of the view, the request must pass
+    `stream_permission_classes` (staff users by default), the API key alone is not enough.
+    """
+    stream_query_param = 'stream'
+    stream_chunk_size = 500
+    stream_permission_classes = [AdminPermissions]
+
+    def get_stream_format(self):
+        stream_format = self.request.query_params.get(self.stream_query_param)
+        if stream_format is not None and stream_format not in STREAM_CONTENT_TYPES:
+            raise ValidationError({self.stream_query_param: f'Must be one of {", ".join(STREAM_CONTENT_TYPES)}.'})
+        return stream_format
+
+    def check_permissions(self, request):
+        super().check_permissions(request)
+        if request.method == 'GET' and self.get_stream_format() is not None:
+            for permission in [permission_class() for permission_class in self.stream_permission_classes]:
+                if not permission.has_permission(request, self):
+                    self.permission_denied(request, message='Streamed lists are restricted to staff users.')
+
+    def iter_serialized_chunks(self, queryset: QuerySet) -> Iterator[list]:
+        rows = queryset.iterator(chunk_size=self.stream_chunk_size)
+        while chunk := list(islice(rows, self.stream_chunk_size)):
+            yield self.get_serializer(chunk, many=True).data
+
+    def stream_json(self, queryset: QuerySet) -> Iterator[bytes]:
+        renderer = ORJSONRenderer()
+        yield b'['
+        separator = b''
+        for data in self.iter_serialized_chunks(queryset):
+            # The items of the chunk, without the brackets of its array
+            yield separator + renderer.render(data)[1:-1]
+            separator = b','
+        yield b']'
+
+    def stream_ndjson(self, queryset: QuerySet) -> Iterator[bytes]:
+        renderer = ORJSONRenderer()
+        for data in self.iter_serialized_chunks(queryset):
+            yield b''.join(renderer.render(item) + b'\n' for item in data)
+
+    def list(self, request, *args, **kwargs):
+        stream_format = self.get_stream_format()
+        if stream_format is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        stream = self.stream_json(queryset) if stream_format == 'json' else self.stream_ndjson(queryset)
+        return StreamingHttpResponse(stream, content_type=STREAM_CONTENT_TYPES[stream_format])
@@ -3,10 +3,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from django.core.exceptions import ValidationError
-
-from BackendTennis.utils.string_utils import string_list_to_camel_case
+from django.db import IntegrityError, transaction
+from django.db.models import Count, OuterRef, Subquery
 
 if TYPE_CHECKING:
+    from typing import Iterable, Optional, Tuple
+    from uuid import UUID
+    from django.db.models import Model
     from ..models import AboutPage, Sponsor, ClubValue, TeamPage
 
 import logging
@@ -15,22 +18,99 @@ logger = logging.getLogger('BackendTennis.UniqueOrderValidationMixin')
 
 
 class UniqueOrderValidationMixin:
-    def validate_unique_order(self: Sponsor | ClubValue, page: AboutPage | TeamPage) -> None:
+    """
+    The order of an object must be unique in each page it belongs to. The order is copied on the page link
+    (see BasePageLink) where a unique (page, order) constraint enforces it, even under concurrent writes.
+    The validations below are pre-checks turning a conflict into a readable ValidationError.
+    """
+    # Name of the reverse many to many relation from the object to its pages
+    page_relation_name: str = None
+
+    @classmethod
+    def _get_page_link(cls) -> Tuple[type[Model], str, str]:
+        """Return the link (through) model, its page field name and its object field name."""
+        relation = cls._meta.get_field(cls.page_relation_name)
+        return relation.through, relation.field.m2m_field_name(), relation.field.m2m_reverse_field_name()
+
+    @classmethod
+    def _raise_order_already_used(cls, object_id: UUID, order: int, page_model: type[Model], page_id: UUID) -> None:
+        page_name_type = page_model._meta.verbose_name.capitalize()
+        model_name = cls._meta.object_name
+        error_message = (f'Order [{order}] of {model_name} [{object_id}] already used by another {model_name}'
+                         f' in the {page_name_type} "{page_id}".')
+        logger.error(error_message)
+        raise ValidationError(
+            {
+                'order': error_message
+            }
+        )
+
+    def validate_unique_order(self: Sponsor | ClubValue, page: Optional[AboutPage | TeamPage] = None) -> None:
         """
-        Validates that the unique order is valid.
+        Validates that the order is not used by another object of the page, of any page of the object
+        when no page is given. Single query on the page links.
         param: page: AboutPage
         """
-        page_name_type = page._meta.verbose_name.capitalize()
-        prop_name_in_page_model = string_list_to_camel_case(self._meta.verbose_name.split(' '))
-        model_name = self._meta.object_name
-
-        related_objects = getattr(page, prop_name_in_page_model + 's')
-        if related_objects.filter(order=self.order).exclude(id=self.id).exists():
-            error_message = (f'Order [{self.order}] of {model_name} [{self.id}] already used by another {model_name}'
-                             f' in the {page_name_type} "{page.id}".')
-            logger.error(error_message)
-            raise ValidationError(
-                {
-                    'order': error_message
-                }
-            )
+        link_model, page_field, object_field = self._get_page_link()
+        links = link_model.objects.filter(order=self.order).exclude(**{object_field: self.id})
+        if page is not None:
+            links = links.filter(**{page_field: page})
+        else:
+            links = links.filter(**{
+                f'{page_field}__in': link_model.objects.filter(**{object_field: self.id}).values(page_field)
+            })
+        page_id = links.values_list(page_field, flat=True).first()
+        if page_id is not None:
+            page_model = link_model._meta.get_field(page_field).related_model
+            self._raise_order_already_used(self.id, self.order, page_model, page_id)
+
+    @classmethod
+    def validate_unique_orders(cls, page_ids: Iterable[UUID], object_ids: Iterable[UUID]) -> None:
+        """
+        Bulk version of validate_unique_order for objects already linked to the pages (m2m post_add).
+        The orders used more than once in a page are found with one grouped query (GROUP BY page, order
+        HAVING count > 1), the objects holding them are only loaded on a conflict.
+        param: page_ids: ids of the pages
+        param: object_ids: ids of the objects to validate
+        """
+        link_model, page_field, object_field = cls._get_page_link()
+        links = link_model.objects.filter(**{f'{page_field}__in': page_ids})
+        duplicated_orders = set(links.values(page_field, f'{object_field}__order').annotate(
+            order_count=Count('id')
+        ).filter(order_count__gt=1).values_list(page_field, f'{object_field}__order'))
+        if not duplicated_orders:
+            return
+
+        # Oldest object first, as validate_unique_order called on each object in creation order would report
+        for page_id, object_id, order in links.filter(**{f'{object_field}__in': object_ids}).order_by(
+                f'{object_field}__createAt', object_field
+        ).values_list(page_field, object_field, f'{object_field}__order'):
+            if (page_id, order) in duplicated_orders:
+                page_model = link_model._meta.get_field(page_field).related_model
+                cls._raise_order_already_used(object_id, order, page_model, page_id)
+
+    @classmethod
+    def store_page_orders(cls, object_ids: Iterable[UUID], page_ids: Optional[Iterable[UUID]] = None) -> None:
+        """
+        Copy the order of the objects on their page links (of the given pages only), in one UPDATE.
+        A conflict left by a concurrent write is reported by the unique constraint and turned into the
+        ValidationError of the pre-check.
+        """
+        link_model, page_field, object_field = cls._get_page_link()
+        links = link_model.objects.filter(**{f'{object_field}__in': object_ids})
+        if page_ids is not None:
+            links = links.filter(**{f'{page_field}__in': page_ids})
+        try:
+            with transaction.atomic():
+                links.update(order=Subquery(cls.objects.filter(pk=OuterRef(object_field)).values('order')[:1]))
+        except IntegrityError:
+            affected_page_ids = page_ids if page_ids is not None else links.values_list(page_field, flat=True)
+            cls.validate_unique_orders(list(affected_page_ids), object_ids)
+            raise
+
+    @classmethod
+    def validate_and_store_added_links(cls, instance: Model, pk_set: Iterable[UUID], reverse: bool) -> None:
+        """m2m post_add receiver body, `instance` being the page, or the object for a reverse add."""
+        page_ids, object_ids = (pk_set, [instance.pk]) if reverse else ([instance.pk], pk_set)
+        cls.validate_unique_orders(page_ids, object_ids)
+        cls.store_page_orders(object_ids, page_ids)
@@ -1,11 +1,13 @@
 import uuid
 
-from django.db import models
+from django.db import models, transaction
 
 from ..mixins import UniqueOrderValidationMixin
 
 
 class ClubValue(models.Model, UniqueOrderValidationMixin):
+    page_relation_name = 'about_pages'
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=255)
     description = models.TextField()
@@ -29,9 +31,12 @@ class ClubValue(models.Model, UniqueOrderValidationMixin):
         app_label = 'BackendTennis'
 
     def clean(self):
-        for about_page in self.about_pages.all():
-            self.validate_unique_order(about_page)
+        self.validate_unique_order()
 
+    @transaction.atomic
     def save(self, *args, **kwargs):
+        adding = self._state.adding
         self.full_clean()
         super().save(*args, **kwargs)
+        if not adding:
+            self.store_page_orders([self.id])
@@ -1,8 +1,8 @@
 import uuid
 
-from django.db import models
+from django.db import models, transaction
 
-from BackendTennis.utils.utils import compute_image_url
+from BackendTennis.utils.utils import compute_image_url, compute_content_hash, lock_image_blobs, store_image_blob
 from BackendTennis.validators import validate_image_type
 
 
@@ -14,7 +14,10 @@ class Image(models.Model):
         related_name='images'
     )
     type = models.CharField(max_length=100, validators=[validate_image_type])
-    imageUrl = models.ImageField(upload_to=compute_image_url, blank=True, null=True)
+    imageUrl = models.ImageField(upload_to=compute_image_url, blank=True, null=True, db_index=True)
+    contentHash = models.CharField(max_length=64, blank=True, default='', db_index=True)
+    # {format: {width: storage name}}, filled by the derivative workers
+    derivatives = models.JSONField(default=dict, blank=True)
     createAt = models.DateTimeField(auto_now_add=True)
     updateAt = models.DateTimeField(auto_now=True)
 
@@ -25,10 +28,31 @@ class Image(models.Model):
             'tags': self.tags,
             'type': self.type,
             'imageUrl': self.imageUrl,
+            'contentHash': self.contentHash,
+            'derivatives': self.derivatives,
             'createAt': self.createAt,
             'updateAt': self.updateAt
         }
         return '%s' % to_return
 
+    def save(self, *args, **kwargs):
+        if self.imageUrl and not self.imageUrl._committed:
+            with transaction.atomic():
+                # The blob can not be deleted by its last reference until this row is committed
+                self.contentHash = compute_content_hash(self.imageUrl.file)
+                lock_image_blobs([self.contentHash])
+                # A reused blob already has its derivatives, only new files need to be processed
+                self._image_uploaded = not store_image_blob(self, self.imageUrl.file)
+                if not self._image_uploaded:
+                    self.derivatives = self.get_blob_derivatives()
+                super().save(*args, **kwargs)
+            return
+        super().save(*args, **kwargs)
+
+    def get_blob_derivatives(self):
+        derivatives = Image.objects.filter(imageUrl=self.imageUrl.name).exclude(derivatives={}) \
+            .values_list('derivatives', flat=True).first()
+        return derivatives or {}
+
     class Meta:
         app_label = 'BackendTennis'
@@ -6,10 +6,11 @@ from typing import TYPE_CHECKING
 
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Value
 
 if TYPE_CHECKING:
-    from ..models import Render, PageRender
-    from typing import Dict
+    from ..models import PageRender
+    from typing import Dict, List, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -74,28 +75,79 @@ class NavigationItem(models.Model):
         app_label = 'BackendTennis'
 
     def _clean(self):
+        # Every order used around the item is loaded by a few grouped queries, conflicts are then found in memory
+        parents = list(self.parent_navigation_items.values_list('id', 'title'))
+        page_renders = list(self.pageRenders.select_related('render'))
+        children = self._get_children_orders()
+        sibling_orders = self._get_sibling_orders([parent_id for parent_id, _ in parents]) \
+            if self.navBarRender or page_renders else {'navBarRender': set(), 'pageRenders': set()}
+
         if self.navBarRender:
-            if not self.parent_navigation_items.exists():
-                self._validate_navBarRender_order_for_root_items()
+            if not parents:
+                self._validate_navBarRender_order_for_root_items(sibling_orders['navBarRender'])
             else:
-                self._validate_navBarRender_order_for_child_items()
-        self._validate_navBarRender_order_for_children_navigation_item()
+                self._validate_navBarRender_order_for_child_items(parents, sibling_orders['navBarRender'])
+        self._validate_navBarRender_order_for_children_navigation_item(children)
 
-        if self.pageRenders:
-            self._validate_same_type_page_renders()
-            if not self.parent_navigation_items.exists():
-                self._validate_pageRenders_order_for_root_items()
-            else:
-                self._validate_pageRenders_order_for_child_items()
-            self._validate_pageRender_order_for_children_navigation_item()
+        self._validate_same_type_page_renders(page_renders)
+        if not parents:
+            self._validate_pageRenders_order_for_root_items(page_renders, sibling_orders['pageRenders'])
+        else:
+            self._validate_pageRenders_order_for_child_items(parents, page_renders, sibling_orders['pageRenders'])
+        self._validate_pageRender_order_for_children_navigation_item(children)
+
+    def _get_sibling_orders(self, parent_ids: List[uuid.UUID]) -> Dict[str, Set[Tuple]]:
+        """
+        Return the orders used by the other items sharing a parent with this one (the other root items without parent),
+        in a single query: {'navBarRender': {(parent_id, order, position)}, 'pageRenders': {(parent_id, type, order)}}.
+        The parent id is None for root items.
+        """
+        if parent_ids:
+            siblings = NavigationItem.childrenNavigationItems.through.objects.filter(
+                from_navigationitem_id__in=parent_ids
+            ).exclude(to_navigationitem_id=self.id).values_list(
+                'from_navigationitem_id',
+                'to_navigationitem__navBarRender__order',
+                'to_navigationitem__navBarRender__navBarPosition',
+                'to_navigationitem__pageRenders__render__type',
+                'to_navigationitem__pageRenders__render__order'
+            )
+        else:
+            siblings = NavigationItem.objects.filter(parent_navigation_items=None).exclude(id=self.id).annotate(
+                parent_id=Value(None, output_field=models.UUIDField())
+            ).values_list(
+                'parent_id',
+                'navBarRender__order',
+                'navBarRender__navBarPosition',
+                'pageRenders__render__type',
+                'pageRenders__render__order'
+            )
 
-    def _validate_navBarRender_order_for_root_items(self):
+        orders = {'navBarRender': set(), 'pageRenders': set()}
+        for parent_id, nav_bar_order, nav_bar_position, page_type, page_order in siblings:
+            if nav_bar_order is not None:
+                orders['navBarRender'].add((parent_id, nav_bar_order, nav_bar_position))
+            if page_type is not None:
+                orders['pageRenders'].add((parent_id, page_type, page_order))
+        return orders
+
+    def _get_children_orders(self) -> List[Dict]:
+        """
+        Return the navBarRender and pageRenders orders of the children in a single query,
+        one row per child and page render: [{'title', 'navBarRender__order', ...}].
+        """
+        return list(self.childrenNavigationItems.order_by('createAt', 'id').values(
+            'id',
+            'title',
+            'navBarRender__order',
+            'navBarRender__navBarPosition',
+            'pageRenders__render__type',
+            'pageRenders__render__order'
+        ))
+
+    def _validate_navBarRender_order_for_root_items(self, sibling_orders: Set[Tuple]):
         """Validate the order for root items (without a parent)."""
-        if NavigationItem.objects.filter(
-                parent_navigation_items=None,
-                navBarRender__order=self.navBarRender.order,
-                navBarRender__navBarPosition=self.navBarRender.navBarPosition
-        ).exclude(id=self.id).exists():
+        if (None, self.navBarRender.order, self.navBarRender.navBarPosition) in sibling_orders:
             logger.debug(f'(root_items) [{self.id}] Several elements use the same order [{self.navBarRender.order}] '
                          f'for navBarRender')
             raise ValidationError({
@@ -103,27 +155,19 @@ class NavigationItem(models.Model):
                                 f' [{self.navBarRender.order}] for navBarRender'
             })
 
-    def _validate_pageRenders_order_for_root_items(self):
+    def _validate_pageRenders_order_for_root_items(self, page_renders: List[PageRender], sibling_orders: Set[Tuple]):
         """Validate the pageRenders order for root items (without a parent)."""
-        for page_render in self.pageRenders.all():
-            if NavigationItem.objects.filter(
-                    parent_navigation_items=None,
-                    pageRenders__render__type=page_render.render.type,
-                    pageRenders__render__order=page_render.render.order
-            ).exclude(id=self.id).exists():
+        for page_render in page_renders:
+            if (None, page_render.render.type, page_render.render.order) in sibling_orders:
                 raise ValidationError({
                     'pageRenders': f'(root_items) Several elements use the same order'
                                    f' [{page_render.render.order}] for pageRenders of type [{page_render.render.type}]'
                 })
 
-    def _validate_navBarRender_order_for_child_items(self):
+    def _validate_navBarRender_order_for_child_items(self, parents: List[Tuple], sibling_orders: Set[Tuple]):
         """Validate the order for items with a parent."""
-        for parent in self.parent_navigation_items.all():
-            if NavigationItem.objects.filter(
-                    parent_navigation_items=parent,
-                    navBarRender__order=self.navBarRender.order,
-                    navBarRender__navBarPosition=self.navBarRender.navBarPosition
-            ).exclude(id=self.id).exists():
+        for parent_id, _ in parents:
+            if (parent_id, self.navBarRender.order, self.navBarRender.navBarPosition) in sibling_orders:
                 logger.debug(
                     f'(root_items) [{self.id}] Several elements use the same order [{self.navBarRender.order}] '
                     f'for navBarRender')
@@ -132,55 +176,42 @@ class NavigationItem(models.Model):
                                     f' [{self.navBarRender.order}] for navBarRender'
                 })
 
-    def _validate_pageRenders_order_for_child_items(self):
+    def _validate_pageRenders_order_for_child_items(
+            self,
+            parents: List[Tuple],
+            page_renders: List[PageRender],
+            sibling_orders: Set[Tuple]
+    ):
         """Validate the order for items with a parent."""
-        for parent in self.parent_navigation_items.all():
-            for page_render in self.pageRenders.all():
-                if NavigationItem.objects.filter(
-                        parent_navigation_items=parent,
-                        pageRenders__render__type=page_render.render.type,
-                        pageRenders__render__order=page_render.render.order
-                ).exclude(id=self.id).exists():
+        for parent_id, parent_title in parents:
+            for page_render in page_renders:
+                if (parent_id, page_render.render.type, page_render.render.order) in sibling_orders:
                     raise ValidationError({
                         'pageRenders': f'(child_items) Several elements use the same order'
                                        f' [{page_render.render.order}] for pageRenders of type [{page_render.render.type}]'
-                                       f' for parent [{parent.title}]'
+                                       f' for parent [{parent_title}]'
                     })
 
     def _validate_order_for_children_navigation_item(
             self,
             prop_name: str,
-            prop_value: Render | PageRender,
+            ordered_by_value: str,
             child_title: str,
             order: int,
             children_orders_by: Dict,
             error_message_template: callable
     ) -> None:
-        """Validate each item's children to detect order conflicts."""
-        if prop_name == 'childrenNavigationItems':
-            ordered_by_value = prop_value.navBarPosition
-        else:
-            ordered_by_value = prop_value.render.type
+        """Add the child to the orders already used by its brothers, fail on the first order conflict."""
+        children_with_same_order = children_orders_by.setdefault(ordered_by_value, {}).setdefault(order, [])
+        children_with_same_order.append(child_title)
 
-        if ordered_by_value not in children_orders_by:
-            children_orders_by[ordered_by_value] = {}
-
-        children_by_order = children_orders_by[ordered_by_value]
-        if order not in children_by_order:
-            children_by_order[order] = []
-        children_by_order[order].append(child_title)
-
-        error_messages = []
-        for ordered_by_value, children_by_order in children_orders_by.items():
-            for order, children_with_same_order in children_by_order.items():
-                if len(children_with_same_order) > 1:
-                    error_messages.append(
-                        error_message_template(prop_name, order, ordered_by_value, self.title, children_with_same_order)
-                    )
-        if error_messages:
-            logger.debug('\n'.join(error_messages))
+        if len(children_with_same_order) > 1:
+            error_message = error_message_template(
+                prop_name, order, ordered_by_value, self.title, children_with_same_order
+            )
+            logger.debug(error_message)
             raise ValidationError(
-                {'childrenNavigationItems': '\n'.join(error_messages)}
+                {'childrenNavigationItems': error_message}
             )
 
     @staticmethod
@@ -198,44 +229,47 @@ class NavigationItem(models.Model):
                 f' for parent [{parent_title}] : [{', '.join(children_with_same_order)}]'
             )
 
-    def _validate_navBarRender_order_for_children_navigation_item(self):
+    def _validate_navBarRender_order_for_children_navigation_item(self, children: List[Dict]):
         children_orders_by = {}
         prop_name = 'childrenNavigationItems'
         error_message_template = self._get_validation_for_children_error_message_template(prop_name)
-        for child in self.childrenNavigationItems.all():
-            if child.navBarRender is None:
+        seen_children = set()
+        for child in children:
+            # A child has one row per page render
+            if child['navBarRender__order'] is None or child['id'] in seen_children:
                 continue
+            seen_children.add(child['id'])
             self._validate_order_for_children_navigation_item(
                 prop_name,
-                child.navBarRender,
-                child.title,
-                child.navBarRender.order,
+                child['navBarRender__navBarPosition'],
+                child['title'],
+                child['navBarRender__order'],
                 children_orders_by,
                 error_message_template
             )
 
-    def _validate_pageRender_order_for_children_navigation_item(self):
+    def _validate_pageRender_order_for_children_navigation_item(self, children: List[Dict]):
         """Validate each item's children to detect order conflicts."""
         children_orders_by = {}
         prop_name = 'pageRenders'
         error_message_template = self._get_validation_for_children_error_message_template(prop_name)
-        for child in self.childrenNavigationItems.all():
-            if child.pageRenders is None:
+        for child in children:
+            if child['pageRenders__render__type'] is None:
                 continue
-            for page_render in child.pageRenders.all():
-                self._validate_order_for_children_navigation_item(
-                    prop_name,
-                    page_render,
-                    child.title,
-                    page_render.render.order,
-                    children_orders_by,
-                    error_message_template
-                )
+            self._validate_order_for_children_navigation_item(
+                prop_name,
+                child['pageRenders__render__type'],
+                child['title'],
+                child['pageRenders__render__order'],
+                children_orders_by,
+                error_message_template
+            )
 
-    def _validate_same_type_page_renders(self):
+    @staticmethod
+    def _validate_same_type_page_renders(page_renders: List[PageRender]):
         """Validate the order for page renders."""
         page_renders_id_by_type = {}
-        for page in self.pageRenders.all():
+        for page in page_renders:
             page_type = page.render.type
             if page_type not in page_renders_id_by_type:
                 page_renders_id_by_type[page_type] = []
@@ -1,10 +1,12 @@
-from django.db import models
+from django.db import models, transaction
 
 from BackendTennis.mixins import UniqueOrderValidationMixin
 from BackendTennis.models.base_model.BaseMember import BaseMember
 
 
 class Professor(BaseMember, UniqueOrderValidationMixin):
+    page_relation_name = 'team_pages'
+
     fullName = models.CharField(max_length=255, unique=True)
     image = models.ForeignKey(
         'BackendTennis.Image',
@@ -36,9 +38,12 @@ class Professor(BaseMember, UniqueOrderValidationMixin):
         app_label = 'BackendTennis'
 
     def clean(self):
-        for team_page in self.team_pages.all():
-            self.validate_unique_order(team_page)
+        self.validate_unique_order()
 
+    @transaction.atomic
     def save(self, *args, **kwargs):
+        adding = self._state.adding
         self.full_clean()
         super().save(*args, **kwargs)
+        if not adding:
+            self.store_page_orders([self.id])
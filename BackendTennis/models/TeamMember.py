@@ -1,11 +1,13 @@
 from django.contrib.postgres.fields import ArrayField
-from django.db import models
+from django.db import models, transaction
 
 from BackendTennis.mixins import UniqueOrderValidationMixin
 from BackendTennis.models.base_model.BaseMember import BaseMember
 
 
 class TeamMember(BaseMember, UniqueOrderValidationMixin):
+    page_relation_name = 'team_pages'
+
     fullNames = ArrayField(models.CharField(max_length=255), blank=True, default=list)
     images = models.ManyToManyField(
         'BackendTennis.Image',
@@ -31,9 +33,12 @@ class TeamMember(BaseMember, UniqueOrderValidationMixin):
         app_label = 'BackendTennis'
 
     def clean(self):
-        for team_page in self.team_pages.all():
-            self.validate_unique_order(team_page)
+        self.validate_unique_order()
 
+    @transaction.atomic
     def save(self, *args, **kwargs):
+        adding = self._state.adding
         self.full_clean()
         super().save(*args, **kwargs)
+        if not adding:
+            self.store_page_orders([self.id])
@@ -18,7 +18,11 @@ from .Tournament import Tournament
 from .Training import Training
 from .User import User
 from .page_model.AboutPage import AboutPage
+from .page_model.AboutPageClubValue import AboutPageClubValue
+from .page_model.AboutPageSponsor import AboutPageSponsor
 from .page_model.HomePage import HomePage
 from .page_model.PricingPage import PricingPage
 from .page_model.TeamPage import TeamPage
+from .page_model.TeamPageProfessor import TeamPageProfessor
+from .page_model.TeamPageTeamMember import TeamPageTeamMember
 # from .UserManager import UserManager
@@ -0,0 +1,16 @@
+import uuid
+
+from django.db import models
+
+
+class BasePageLink(models.Model):
+    """
+    Link between a page and one of its ordered objects. The object order is copied on the link so the database can
+    enforce a unique order per page, see UniqueOrderValidationMixin.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Filled right after the link is added, NULL never conflicts
+    order = models.IntegerField(null=True, blank=True)
+
+    class Meta:
+        abstract = True
@@ -19,6 +19,7 @@ class AboutPage(models.Model):
     clubValueTitle = models.CharField(max_length=255, null=True, blank=True)
     clubValues = models.ManyToManyField(
         'BackendTennis.ClubValue',
+        through='BackendTennis.AboutPageClubValue',
         related_name='about_pages',
         blank=True
     )
@@ -26,6 +27,7 @@ class AboutPage(models.Model):
     sponsorTitle = models.CharField(max_length=255, null=True, blank=True)
     sponsors = models.ManyToManyField(
         'BackendTennis.Sponsor',
+        through='BackendTennis.AboutPageSponsor',
         related_name='about_pages',
         blank=True
     )
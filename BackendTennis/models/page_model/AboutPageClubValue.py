@@ -0,0 +1,20 @@
+from django.db import models
+
+from BackendTennis.models.base_model.BasePageLink import BasePageLink
+
+
+class AboutPageClubValue(BasePageLink):
+    aboutPage = models.ForeignKey('BackendTennis.AboutPage', on_delete=models.CASCADE, related_name='club_value_links')
+    clubValue = models.ForeignKey('BackendTennis.ClubValue', on_delete=models.CASCADE, related_name='about_page_links')
+
+    class Meta:
+        app_label = 'BackendTennis'
+        constraints = [
+            models.UniqueConstraint(fields=['aboutPage', 'clubValue'], name='unique_about_page_club_value'),
+            # Deferrable so a transaction can swap orders with SET CONSTRAINTS ... DEFERRED
+            models.UniqueConstraint(
+                fields=['aboutPage', 'order'],
+                name='unique_about_page_club_value_order',
+                deferrable=models.Deferrable.IMMEDIATE
+            ),
+        ]
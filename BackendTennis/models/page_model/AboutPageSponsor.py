@@ -0,0 +1,20 @@
+from django.db import models
+
+from BackendTennis.models.base_model.BasePageLink import BasePageLink
+
+
+class AboutPageSponsor(BasePageLink):
+    aboutPage = models.ForeignKey('BackendTennis.AboutPage', on_delete=models.CASCADE, related_name='sponsor_links')
+    sponsor = models.ForeignKey('BackendTennis.Sponsor', on_delete=models.CASCADE, related_name='about_page_links')
+
+    class Meta:
+        app_label = 'BackendTennis'
+        constraints = [
+            models.UniqueConstraint(fields=['aboutPage', 'sponsor'], name='unique_about_page_sponsor'),
+            # Deferrable so a transaction can swap orders with SET CONSTRAINTS ... DEFERRED
+            models.UniqueConstraint(
+                fields=['aboutPage', 'order'],
+                name='unique_about_page_sponsor_order',
+                deferrable=models.Deferrable.IMMEDIATE
+            ),
+        ]
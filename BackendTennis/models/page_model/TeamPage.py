@@ -9,9 +9,17 @@ class TeamPage(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     professorsTitle = models.CharField(max_length=255, null=True, blank=True)
     professorsDescription = models.TextField(null=True, blank=True)
-    professors = models.ManyToManyField(Professor, related_name='team_pages')
+    professors = models.ManyToManyField(
+        Professor,
+        through='BackendTennis.TeamPageProfessor',
+        related_name='team_pages'
+    )
     teamMembersTitle = models.CharField(max_length=255, null=True, blank=True)
-    teamMembers = models.ManyToManyField(TeamMember, related_name='team_pages')
+    teamMembers = models.ManyToManyField(
+        TeamMember,
+        through='BackendTennis.TeamPageTeamMember',
+        related_name='team_pages'
+    )
     dataCounter = models.JSONField(default=list, null=True, blank=True)
     createAt = models.DateTimeField(auto_now_add=True)
     updateAt = models.DateTimeField(auto_now=True)
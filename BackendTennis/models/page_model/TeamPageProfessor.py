@@ -0,0 +1,20 @@
+from django.db import models
+
+from BackendTennis.models.base_model.BasePageLink import BasePageLink
+
+
+class TeamPageProfessor(BasePageLink):
+    teamPage = models.ForeignKey('BackendTennis.TeamPage', on_delete=models.CASCADE, related_name='professor_links')
+    professor = models.ForeignKey('BackendTennis.Professor', on_delete=models.CASCADE, related_name='team_page_links')
+
+    class Meta:
+        app_label = 'BackendTennis'
+        constraints = [
+            models.UniqueConstraint(fields=['teamPage', 'professor'], name='unique_team_page_professor'),
+            # Deferrable so a transaction can swap orders with SET CONSTRAINTS ... DEFERRED
+            models.UniqueConstraint(
+                fields=['teamPage', 'order'],
+                name='unique_team_page_professor_order',
+                deferrable=models.Deferrable.IMMEDIATE
+            ),
+        ]
@@ -0,0 +1,20 @@
+from django.db import models
+
+from BackendTennis.models.base_model.BasePageLink import BasePageLink
+
+
+class TeamPageTeamMember(BasePageLink):
+    teamPage = models.ForeignKey('BackendTennis.TeamPage', on_delete=models.CASCADE, related_name='team_member_links')
+    teamMember = models.ForeignKey('BackendTennis.TeamMember', on_delete=models.CASCADE, related_name='team_page_links')
+
+    class Meta:
+        app_label = 'BackendTennis'
+        constraints = [
+            models.UniqueConstraint(fields=['teamPage', 'teamMember'], name='unique_team_page_team_member'),
+            # Deferrable so a transaction can swap orders with SET CONSTRAINTS ... DEFERRED
+            models.UniqueConstraint(
+                fields=['teamPage', 'order'],
+                name='unique_team_page_team_member_order',
+                deferrable=models.Deferrable.IMMEDIATE
+            ),
+        ]
@@ -1,25 +1,96 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+
+from django.db import connection
+from rest_framework.pagination import PageNumberPagination, CursorPagination
 from rest_framework.response import Response
 
 
-def _get_paginated_response(element, data):
+def _get_paginated_response(count, next_link, previous_link, data):
     return Response({
         'status': 'success',
-        'count': element.page.paginator.count,
+        'count': count,
         'links': {
-            'next': element.get_next_link(),
-            'previous': element.get_previous_link()
+            'next': next_link,
+            'previous': previous_link
         },
         'data': data
     })
 
 
+def get_estimated_count(queryset):
+    """
+    Planner estimate of the queryset size: pg_class.reltuples for a whole table, the EXPLAIN row estimate otherwise.
+    Fall back to an exact count when the table was never analyzed or the database is not PostgreSQL.
+    """
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+
+    if not queryset.query.where and not queryset.query.distinct:
+        with connection.cursor() as cursor:
+            # Quoted, the table names are mixed case
+            table = connection.ops.quote_name(queryset.model._meta.db_table)
+            cursor.execute('SELECT reltuples FROM pg_class WHERE oid = %s::regclass', [table])
+            row = cursor.fetchone()
+        if row is not None and row[0] >= 0:
+            return int(row[0])
+        return queryset.count()
+
+    plan = json.loads(queryset.order_by().explain(format='json'))
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination on the ordering of the queryset (or of the model), `ordering` otherwise.
+    The primary key is appended to the ordering so rows sharing the same position keep a stable order.
+    """
+    ordering = ('-createAt', '-id')
+
+    def get_ordering(self, request, queryset, view):
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        ordering = tuple(field for field in ordering if isinstance(field, str)) or self.ordering
+        if not any(field.lstrip('-') in ['id', 'pk'] for field in ordering):
+            ordering += ('-id' if ordering[0].startswith('-') else 'id',)
+        return ordering
+
+
 class CustomPagination(PageNumberPagination):
+    """
+    Page number pagination, or keyset pagination when the request has a `cursor` parameter (empty for the first page).
+    The cursor mode skips the OFFSET scan, and with `exact_count = False` its count is a planner estimate.
+    """
     page_size_query_param = 'page_size'
-    max_page_size = None
+    max_page_size = 500
+    cursor_query_param = 'cursor'
+    exact_count = True
+    keyset_paginator = None
+
+    def is_cursor_request(self, request):
+        return self.cursor_query_param in request.query_params
+
+    def get_keyset_paginator(self, request):
+        keyset_paginator = KeysetPagination()
+        keyset_paginator.page_size = self.get_page_size(request)
+        keyset_paginator.cursor_query_param = self.cursor_query_param
+        return keyset_paginator
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_cursor_request(request):
+            return super().paginate_queryset(queryset, request, view)
+
+        self.keyset_paginator = self.get_keyset_paginator(request)
+        self.count = queryset.count() if self.exact_count else get_estimated_count(queryset)
+        return self.keyset_paginator.paginate_queryset(queryset, request, view)
 
     def get_paginated_response(self, data):
-        return _get_paginated_response(self, data)
+        if self.keyset_paginator is not None:
+            return _get_paginated_response(
+                self.count,
+                self.keyset_paginator.get_next_link(),
+                self.keyset_paginator.get_previous_link(),
+                data
+            )
+        return _get_paginated_response(self.page.paginator.count, self.get_next_link(), self.get_previous_link(), data)
 
 
 class BookingPagination(CustomPagination):
@@ -36,6 +107,7 @@ class EventPagination(CustomPagination):
 
 class ImagePagination(CustomPagination):
     page_size = 40
+    exact_count = False
 
 
 class NewsPagination(CustomPagination):
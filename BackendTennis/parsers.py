@@ -0,0 +1,24 @@
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from BackendTennis.renderers import ORJSONRenderer
+
+
+class ORJSONParser(JSONParser):
+    """JSONParser decoding with orjson, NaN and Infinity are refused as with STRICT_JSON."""
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            content = stream.read()
+            # orjson reads UTF-8 bytes, other charsets are decoded first
+            if encoding.lower().replace('-', '') != 'utf8':
+                content = content.decode(encoding)
+            return orjson.loads(content)
+        except ValueError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
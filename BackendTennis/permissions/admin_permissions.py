@@ -0,0 +1,11 @@
+from rest_framework import permissions
+
+from BackendTennis.authentication.request_user import get_request_user
+
+
+class AdminPermissions(permissions.BasePermission):
+    """Staff users only, whatever the method, the user being read from the request JWT."""
+
+    def has_permission(self, request, view):
+        user = get_request_user(request)
+        return bool(user is not None and user.is_authenticated and user.is_staff)
@@ -1,40 +1,33 @@
 from rest_framework import permissions
-from rest_framework.exceptions import AuthenticationFailed
-from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from BackendTennis.authentication.request_user import get_request_user
+from BackendTennis.services.permission_cache_service import has_cached_permission
 
 
 class BasePermissions(permissions.BasePermission):
     model_name = None
+    # Methods allowed to every request having passed the API key authentication
+    anonymous_methods = permissions.SAFE_METHODS
+
+    def get_required_permission(self, method):
+        model_perms = {
+            'POST': f'add_{self.model_name}',
+            'PUT': f'change_{self.model_name}',
+            'PATCH': f'change_{self.model_name}',
+            'DELETE': f'delete_{self.model_name}',
+        }
+        return model_perms.get(method, None)
 
     def has_permission(self, request, view):
-        if request.method in permissions.SAFE_METHODS:
+        if request.method in self.anonymous_methods:
             return True
 
-        jwt_auth = JWTAuthentication()
-        try:
-            user_auth_tuple = jwt_auth.authenticate(request)
-            if user_auth_tuple is not None:
-                request.user, _ = user_auth_tuple  # Unpack user and token data
-            else:
-                return False
-        except AuthenticationFailed:
+        perm = self.get_required_permission(request.method)
+        if perm is None:
             return False
 
-        if request.method in ['POST', 'PUT', 'PATCH', 'DELETE']:
-            if not request.user.is_authenticated:
-                return False
-
-            model_perms = {
-                'POST': f'add_{self.model_name}',
-                'PUT': f'change_{self.model_name}',
-                'PATCH': f'change_{self.model_name}',
-                'DELETE': f'delete_{self.model_name}',
-            }
-
-            perm = model_perms.get(request.method, None)
-            if perm and request.user.has_perm(f'BackendTennis.{perm}'):
-                return True
-            if request.user.is_superuser:
-                return True
+        user = get_request_user(request)
+        if user is None or not user.is_authenticated:
+            return False
 
-        return False
+        return has_cached_permission(user, f'BackendTennis.{perm}')
@@ -1,39 +1,10 @@
 from rest_framework import permissions
-from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework.exceptions import AuthenticationFailed
 
+from BackendTennis.models import Booking
+from BackendTennis.permissions.base_permission.base_permission import BasePermissions
 
-class BookingPermissions(permissions.BasePermission):
-    def has_permission(self, request, view):
-        if request.method in permissions.SAFE_METHODS:
-            return True
 
-        if request.method == "POST":
-            return True
-
-        jwt_auth = JWTAuthentication()
-        try:
-            user_auth_tuple = jwt_auth.authenticate(request)
-            if user_auth_tuple is not None:
-                request.user, _ = user_auth_tuple  # Unpack user and token data
-            else:
-                return False
-        except AuthenticationFailed:
-            return False
-
-        if request.method in ['PUT', 'PATCH', 'DELETE']:
-            if not request.user.is_authenticated:
-                return False
-
-            model_perms = {
-                'PUT': 'change_booking',
-                'PATCH': 'change_booking',
-                'DELETE': 'delete_booking',
-            }
-            perm = model_perms.get(request.method, None)
-            if perm and request.user.has_perm(f'BackendTennis.{perm}'):
-                return True
-            if request.user.is_superuser:
-                return True
-
-        return False
+class BookingPermissions(BasePermissions):
+    model_name = Booking.__name__.lower()
+    # Anyone with the API key can book
+    anonymous_methods = (*permissions.SAFE_METHODS, 'POST')
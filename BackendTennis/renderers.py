@@ -0,0 +1,57 @@
+import datetime
+
+import orjson
+from rest_framework.fields import DateTimeField, DateField, TimeField
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings, ISO_8601
+from rest_framework.utils.encoders import JSONEncoder
+
+_ENCODER = JSONEncoder()
+
+
+def _default(obj):
+    """Types orjson does not encode natively, converted the same way as the DRF JSONEncoder or serializer fields."""
+    if isinstance(obj, datetime.datetime):
+        return DateTimeField().to_representation(obj)
+    if isinstance(obj, datetime.date):
+        return DateField().to_representation(obj)
+    if isinstance(obj, datetime.time):
+        return TimeField().to_representation(obj)
+    # Decimal, lazy translation strings, querysets, ...
+    return _ENCODER.default(obj)
+
+
+def get_orjson_options() -> int:
+    """
+    Native UUIDs and ISO 8601 datetimes match the DRF JSONEncoder output ('Z' for UTC). Datetimes are only passed
+    to `_default` when REST_FRAMEWORK sets another DATETIME_FORMAT, so raw values match the serializer fields.
+    """
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    formats = [api_settings.DATETIME_FORMAT, api_settings.DATE_FORMAT, api_settings.TIME_FORMAT]
+    if any(output_format not in [None, ISO_8601] for output_format in formats):
+        options |= orjson.OPT_PASSTHROUGH_DATETIME
+    return options
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer encoding with orjson: UUIDs, datetimes and dicts are encoded in C, the output is the same bytes
+    as JSONRenderer. Indented output (browsable API, `; indent=` media type parameter) and values orjson refuses
+    (integers over 64 bits, ...) fall back to JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_default, option=get_orjson_options())
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same escaping as JSONRenderer, the output stays a strict javascript subset
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
@@ -1,7 +1,9 @@
 from rest_framework import serializers
 
+from BackendTennis.mixins.dynamic_fields_mixin import DynamicFieldsSerializerMixin
 from BackendTennis.models import Image, Tag
 from BackendTennis.serializers import TagSerializer
+from BackendTennis.services.image_derivative_service import get_image_derivative_urls
 from BackendTennis.validators import validate_image_type
 
 
@@ -12,6 +14,8 @@ class ImageSerializer(serializers.ModelSerializer):
     type = serializers.CharField(max_length=100, validators=[validate_image_type], required=True)
     imageUrl = serializers.ImageField(required=True)
     imageUrlLink = serializers.SerializerMethodField(read_only=True)
+    derivatives = serializers.SerializerMethodField(read_only=True)
+    contentHash = serializers.CharField(read_only=True)
     createAt = serializers.DateTimeField(read_only=True)
     updateAt = serializers.DateTimeField(read_only=True)
 
@@ -25,6 +29,9 @@ class ImageSerializer(serializers.ModelSerializer):
             return obj.imageUrl.url
         return None
 
+    def get_derivatives(self, obj):
+        return get_image_derivative_urls(obj, self.context.get('request'))
+
     def create(self, validated_data):
         tags_data = validated_data.pop('tags', [])
         image = Image.objects.create(**validated_data)
@@ -41,9 +48,18 @@ class ImageSerializer(serializers.ModelSerializer):
         return instance
 
 
-class ImageDetailSerializer(serializers.ModelSerializer):
+class BulkImageSerializer(ImageSerializer):
+    """Metadata validation of the bulk upload, the files are decoded afterwards by the upload workers."""
+    imageUrl = serializers.FileField(required=True)
+
+
+class ImageDetailSerializer(DynamicFieldsSerializerMixin, serializers.ModelSerializer):
     tags = TagSerializer(many=True)
+    derivatives = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
         model = Image
         fields = '__all__'
+
+    def get_derivatives(self, obj):
+        return get_image_derivative_urls(obj, self.context.get('request'))
@@ -1,9 +1,19 @@
+from django.db import models
 from rest_framework import serializers
 
 from BackendTennis.constant import Constant
+from BackendTennis.mixins.dynamic_fields_mixin import DynamicFieldsSerializerMixin
 from BackendTennis.models import NavigationItem, Route, Image, Render, PageRender
 from BackendTennis.serializers import RouteSerializer, ImageDetailSerializer, RenderSerializer, \
     PageRenderDetailSerializer
+from BackendTennis.services.navigation_item_tree_service import prefetch_navigation_item_tree, \
+    prefetch_navigation_item_ancestors
+
+
+class NavigationItemListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        return super().to_representation(prefetch_navigation_item_ancestors(iterable))
 
 
 class NavigationItemSerializer(serializers.ModelSerializer):
@@ -29,6 +39,7 @@ class NavigationItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = NavigationItem
         fields = '__all__'
+        list_serializer_class = NavigationItemListSerializer
 
     @staticmethod
     def get_parent_navigation_items(obj):
@@ -74,7 +85,15 @@ class NavigationItemSerializer(serializers.ModelSerializer):
         return instance
 
 
-class NavigationItemDetailSerializer(serializers.ModelSerializer):
+class NavigationItemTreeListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        if 'childrenNavigationItems' in self.child.fields:
+            iterable = prefetch_navigation_item_tree(iterable)
+        return super().to_representation(iterable)
+
+
+class NavigationItemDetailSerializer(DynamicFieldsSerializerMixin, serializers.ModelSerializer):
     image = ImageDetailSerializer()
     navBarRender = RenderSerializer()
     pageRenders = PageRenderDetailSerializer(many=True)
@@ -84,6 +103,13 @@ class NavigationItemDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = NavigationItem
         fields = '__all__'
+        list_serializer_class = NavigationItemTreeListSerializer
+
+    def to_representation(self, instance):
+        # Skipped when the `fields` of the context leave the children out
+        if 'childrenNavigationItems' in self.fields:
+            prefetch_navigation_item_tree([instance])
+        return super().to_representation(instance)
 
     @staticmethod
     def get_childrenNavigationItems(obj):
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from BackendTennis.mixins.dynamic_fields_mixin import DynamicFieldsSerializerMixin
 from BackendTennis.models import Image, Pricing
 from BackendTennis.serializers import ImageDetailSerializer
 from BackendTennis.validators import validate_pricing_type
@@ -43,7 +44,7 @@ class PricingSerializer(serializers.ModelSerializer):
         return instance
 
 
-class PricingDetailSerializer(serializers.ModelSerializer):
+class PricingDetailSerializer(DynamicFieldsSerializerMixin, serializers.ModelSerializer):
     image = ImageDetailSerializer()
 
     class Meta:
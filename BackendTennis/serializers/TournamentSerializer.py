@@ -1,7 +1,7 @@
 from rest_framework import serializers
 
 from BackendTennis.models import User, Tournament
-from BackendTennis.serializers.UserSerializer import UserSerializer
+from BackendTennis.serializers.UserSerializer import UserSerializer, UserCompactSerializer
 
 
 class TournamentSerializer(serializers.ModelSerializer):
@@ -54,3 +54,11 @@ class TournamentDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = Tournament
         fields = '__all__'
+
+
+class TournamentCompactSerializer(serializers.ModelSerializer):
+    participants = UserCompactSerializer(many=True)
+
+    class Meta:
+        model = Tournament
+        fields = '__all__'
@@ -1,7 +1,7 @@
 from rest_framework import serializers
 
 from BackendTennis.models import Training, User
-from BackendTennis.serializers.UserSerializer import UserSerializer
+from BackendTennis.serializers.UserSerializer import UserSerializer, UserCompactSerializer
 
 
 class TrainingSerializer(serializers.ModelSerializer):
@@ -54,3 +54,11 @@ class TrainingDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = Training
         fields = '__all__'
+
+
+class TrainingCompactSerializer(serializers.ModelSerializer):
+    participants = UserCompactSerializer(many=True)
+
+    class Meta:
+        model = Training
+        fields = '__all__'
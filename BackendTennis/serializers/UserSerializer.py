@@ -1,10 +1,19 @@
 from django.core.validators import RegexValidator
-from django.db import transaction
+from django.db import models, transaction
+from django.db.models import prefetch_related_objects
 from phonenumber_field.serializerfields import PhoneNumberField
 from rest_framework import serializers
 from BackendTennis.models import User
 
 
+class UserListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        # The children of every user in one query, unless they are already prefetched
+        users = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        prefetch_related_objects(users, 'children')
+        return super().to_representation(users)
+
+
 class UserSerializer(serializers.ModelSerializer):
     id = serializers.UUIDField(read_only=True)
     first_name = serializers.CharField(max_length=255)
@@ -91,3 +100,17 @@ class UserSerializer(serializers.ModelSerializer):
             'updateAt'
         )
         read_only_fields = ('createAt', 'updateAt')
+        list_serializer_class = UserListSerializer
+
+
+class UserCompactSerializer(serializers.ModelSerializer):
+    id = serializers.UUIDField(read_only=True)
+    displayName = serializers.SerializerMethodField(read_only=True)
+
+    class Meta:
+        model = User
+        fields = ('id', 'displayName')
+
+    @staticmethod
+    def get_displayName(obj):
+        return f'{obj.first_name} {obj.last_name}'.strip()
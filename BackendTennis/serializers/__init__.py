@@ -2,7 +2,7 @@
 from .BookingSerializer import BookingSerializer
 from .CategorySerializer import CategorySerializer
 from .TagSerializer import TagSerializer
-from .ImageSerializer import ImageSerializer, ImageDetailSerializer
+from .ImageSerializer import ImageSerializer, ImageDetailSerializer, BulkImageSerializer
 from .SponsorSerializer import SponsorSerializer, SponsorDetailSerializer
 from .PricingSerializer import PricingSerializer, PricingDetailSerializer
 from .EventSerializer import EventSerializer, EventDetailSerializer
@@ -10,8 +10,9 @@ from .NewsSerializer import NewsSerializer, NewsDetailSerializer
 from .ProfessorSerializer import ProfessorSerializer, ProfessorDetailSerializer
 from .TeamMemberSerializer import TeamMemberSerializer, TeamMemberDetailSerializer
 from .page_serializer.TeamPageSerializer import TeamPageSerializer, TeamPageDetailSerializer
-from .TournamentSerializer import TournamentSerializer, TournamentDetailSerializer
-from .TrainingSerializer import TrainingSerializer, TrainingDetailSerializer
+from .TournamentSerializer import TournamentSerializer, TournamentDetailSerializer, TournamentCompactSerializer
+from .TrainingSerializer import TrainingSerializer, TrainingDetailSerializer, TrainingCompactSerializer
+from .UserSerializer import UserSerializer, UserCompactSerializer
 from .ClubValueSerializer import ClubValueSerializer
 from .page_serializer.AboutPageSerializer import AboutPageSerializer, AboutPageDetailSerializer
 from .RouteSerializer import RouteSerializer
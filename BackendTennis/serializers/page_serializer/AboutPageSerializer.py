@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from BackendTennis.constant import Constant
+from BackendTennis.mixins.dynamic_fields_mixin import DynamicFieldsSerializerMixin
 from BackendTennis.models import Image, ClubValue, Sponsor, AboutPage
 from BackendTennis.serializers import ImageDetailSerializer, \
     ClubValueSerializer, SponsorDetailSerializer
@@ -70,7 +71,7 @@ class AboutPageSerializer(serializers.ModelSerializer):
         return instance
 
 
-class AboutPageDetailSerializer(serializers.ModelSerializer):
+class AboutPageDetailSerializer(DynamicFieldsSerializerMixin, serializers.ModelSerializer):
     clubImage = ImageDetailSerializer()
     clubValues = ClubValueSerializer(many=True)
     sponsors = SponsorDetailSerializer(many=True)
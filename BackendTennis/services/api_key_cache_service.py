@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import caches
+
+from BackendTennis.services.metrics_service import record_api_key_cache_lookup
+
+if TYPE_CHECKING:
+    from typing import Optional, Tuple
+    from django.core.cache.backends.base import BaseCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_KEY_CACHE_SETTINGS = {
+    'MAX_SIZE': 1024,
+    'TIMEOUT': 60,
+    'SHARED_CACHE_ALIAS': None,
+}
+
+
+def _get_setting(name: str):
+    return getattr(settings, 'API_KEY_CACHE', {}).get(name, DEFAULT_API_KEY_CACHE_SETTINGS[name])
+
+
+def get_key_prefix(key: str) -> str:
+    prefix, _, _ = key.partition('.')
+    return prefix
+
+
+def get_key_digest(key: str) -> str:
+    """Fast digest of the presented key, the raw key is never kept in memory or in the shared cache."""
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class VerifiedAPIKeyCache:
+    """
+    Bounded LRU cache of the API keys already verified by the password hasher, each entry expiring after `timeout`
+    seconds. Entries are keyed by the key digest and remember the key prefix so a revocation can purge them.
+    """
+
+    def __init__(self, max_size: int, timeout: float):
+        self.max_size = max_size
+        self.timeout = timeout
+        self._entries: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, digest: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return False
+            if entry[1] <= time.monotonic():
+                del self._entries[digest]
+                return False
+            self._entries.move_to_end(digest)
+            return True
+
+    def set(self, digest: str, prefix: str) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[digest] = (prefix, time.monotonic() + self.timeout)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def purge_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for digest in [digest for digest, entry in self._entries.items() if entry[0] == prefix]:
+                del self._entries[digest]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+verified_api_keys = VerifiedAPIKeyCache(_get_setting('MAX_SIZE'), _get_setting('TIMEOUT'))
+
+
+def get_shared_cache() -> Optional[BaseCache]:
+    alias = _get_setting('SHARED_CACHE_ALIAS')
+    return caches[alias] if alias else None
+
+
+def _get_shared_key(prefix: str) -> str:
+    # Keyed by prefix (unique per APIKey) so a revocation can delete the entry without knowing the raw key
+    return f'api_key:{prefix}'
+
+
+def is_verified_api_key(key: str) -> bool:
+    """Return True when the key was verified recently, in this process or in the shared cache."""
+    digest = get_key_digest(key)
+    if verified_api_keys.get(digest):
+        record_api_key_cache_lookup('hit')
+        return True
+
+    shared_cache = get_shared_cache()
+    if shared_cache is None:
+        record_api_key_cache_lookup('miss')
+        return False
+    prefix = get_key_prefix(key)
+    shared_digest = shared_cache.get(_get_shared_key(prefix))
+    if shared_digest is None or not hmac.compare_digest(shared_digest, digest):
+        record_api_key_cache_lookup('miss')
+        return False
+    verified_api_keys.set(digest, prefix)
+    record_api_key_cache_lookup('shared_hit')
+    return True
+
+
+def remember_verified_api_key(key: str) -> None:
+    digest = get_key_digest(key)
+    prefix = get_key_prefix(key)
+    verified_api_keys.set(digest, prefix)
+    shared_cache = get_shared_cache()
+    if shared_cache is not None:
+        shared_cache.set(_get_shared_key(prefix), digest, timeout=_get_setting('TIMEOUT'))
+
+
+def purge_api_key(prefix: str) -> None:
+    """
+    Forget every cached verification of the key with the given prefix.
+    Other processes only see it through the shared cache, their local entries expire after TIMEOUT.
+    """
+    verified_api_keys.purge_prefix(prefix)
+    shared_cache = get_shared_cache()
+    if shared_cache is not None:
+        shared_cache.delete(_get_shared_key(prefix))
+    logger.debug(f'[ {prefix} ] API Key purged from the verification cache')
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import get_error_detail
+
+from BackendTennis.models import Image
+from BackendTennis.serializers import BulkImageSerializer
+from BackendTennis.services.image_derivative_service import schedule_image_derivatives
+from BackendTennis.services.metrics_service import record_image_uploads
+from BackendTennis.trads.image_message import IMAGES_MESSAGES
+from BackendTennis.utils.serializer_utils import SerializerUtils
+from BackendTennis.utils.utils import compute_content_hash, image_blob_exists, is_image_file_shared, \
+    lock_image_blobs, store_image_blob
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Tuple
+    from django.core.files.uploadedfile import UploadedFile
+
+logger = logging.getLogger(__name__)
+
+
+def _validate_image_file(file: UploadedFile) -> UploadedFile:
+    return serializers.ImageField().run_validation(file)
+
+
+def _check_image_file(instance: Image, file: UploadedFile) -> Optional[str]:
+    """
+    Hash the upload, then decode and verify it with Pillow unless the same content was already uploaded.
+    Runs in the upload workers.
+
+    :return: the error message, None when the file is valid
+    """
+    try:
+        instance.contentHash = compute_content_hash(file)
+        if not image_blob_exists(instance, file):
+            _validate_image_file(file)
+    except (ValidationError, DjangoValidationError) as e:
+        details = e.detail if isinstance(e, ValidationError) else get_error_detail(e)
+        return '\n'.join(f'Error on key "imageUrl", code [{error.code}] : {str(error)}' for error in details)
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def _store_image_file(instance: Image, file: UploadedFile) -> Optional[str]:
+    """
+    Store the upload as a content addressed blob, or reuse the blob of the same content. Runs in the transaction
+    holding the lock of the blob: a blob deleted since _check_image_file is written again, its content was valid.
+
+    :return: the error message, None when the file is stored
+    """
+    try:
+        # Temporary uploads are renamed, not copied
+        instance._image_uploaded = not store_image_blob(instance, file)
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def _delete_image_file(instance: Image) -> None:
+    if instance.imageUrl and instance._image_uploaded and not is_image_file_shared(instance):
+        instance.imageUrl.delete(save=False)
+
+
+def _save_images(instances: List[Image], tags_by_image: Dict[Image, list]) -> List[Tuple[Image, Optional[str]]]:
+    """
+    Insert the images and their tag links with bulk_create. When the batch fails, every image is saved in its
+    own transaction so one bad row only rejects itself.
+    """
+    through = Image.tags.through
+    try:
+        with transaction.atomic():
+            Image.objects.bulk_create(instances)
+            through.objects.bulk_create([
+                through(image_id=instance.id, tag_id=tag.id)
+                for instance in instances
+                for tag in tags_by_image[instance]
+            ])
+        return [(instance, None) for instance in instances]
+    except Exception as e:
+        logger.debug(f'Bulk image insert failed, saving images one by one : {e}')
+
+    results = []
+    for instance in instances:
+        try:
+            with transaction.atomic():
+                instance.save(force_insert=True)
+                instance.tags.set(tags_by_image[instance])
+            results.append((instance, None))
+        except Exception as e:
+            _delete_image_file(instance)
+            results.append((instance, IMAGES_MESSAGES['ERROR']['SAVE_ERROR'].format(error=str(e))))
+    return results
+
+
+def bulk_upload_images(images_data: List[dict], files) -> Tuple[List[Image], List[dict], List[str]]:
+    """
+    Create the images described by `images_data`, the file of each one being `image_<index>` in `files`.
+    Metadata are validated first, files are then decoded and stored by a pool of workers, and the valid
+    images are inserted with bulk_create. Derivatives are generated after the commit.
+
+    :return: created images (in the `images_data` order), rejected image data and error messages
+    """
+    start = time.perf_counter()
+    errors = []
+    error_images = []
+    pending: List[Tuple[dict, Image, UploadedFile, list]] = []
+
+    for image in images_data:
+        image_index = image.get('index')
+        if image_index is None:
+            errors.append(
+                IMAGES_MESSAGES['ERROR']['NO_INDEX_ON_IMAGE'].format(image_title=image.get('title', 'no title'))
+            )
+            continue
+
+        file_from_image = files.get(f'image_{image_index}')
+        if not file_from_image:
+            errors.append(IMAGES_MESSAGES['ERROR']['FILE_NOT_FOUND'].format(image_index=image_index))
+            continue
+
+        serializer = BulkImageSerializer(data={**image, 'imageUrl': file_from_image})
+        if not serializer.is_valid():
+            error_images.append({**image, 'imageUrl': file_from_image.name})
+            errors.append(
+                IMAGES_MESSAGES['ERROR']['SAVE_ERROR'].format(error=SerializerUtils.get_error_message(serializer))
+            )
+            continue
+
+        validated_data = dict(serializer.validated_data)
+        tags = validated_data.pop('tags', [])
+        validated_data.pop('imageUrl')
+        pending.append((image, Image(**validated_data), file_from_image, tags))
+
+    with ThreadPoolExecutor(max_workers=settings.IMAGE_BULK_UPLOAD_WORKERS) as executor:
+        check_errors = list(executor.map(
+            _check_image_file,
+            [instance for _, instance, _, _ in pending],
+            [file for _, _, file, _ in pending]
+        ))
+
+    def reject(image: dict, file: UploadedFile, error: str) -> None:
+        error_images.append({**image, 'imageUrl': file.name})
+        errors.append(IMAGES_MESSAGES['ERROR']['SAVE_ERROR'].format(error=error))
+
+    checked = []
+    for (image, instance, file, tags), check_error in zip(pending, check_errors):
+        if check_error is None:
+            checked.append((image, instance, file, tags))
+        else:
+            reject(image, file, check_error)
+
+    created_images = []
+    with transaction.atomic():
+        # Held until the commit: a blob reused here can not be deleted by its last reference in the meantime
+        lock_image_blobs([instance.contentHash for _, instance, _, _ in checked])
+
+        instances = []
+        tags_by_image = {}
+        image_data_by_instance = {}
+        file_size_by_instance = {}
+        for image, instance, file, tags in checked:
+            store_error = _store_image_file(instance, file)
+            if store_error is not None:
+                reject(image, file, store_error)
+                continue
+            if not instance._image_uploaded:
+                instance.derivatives = instance.get_blob_derivatives()
+            instances.append(instance)
+            tags_by_image[instance] = tags
+            image_data_by_instance[instance] = {**image, 'imageUrl': file.name}
+            file_size_by_instance[instance] = file.size
+
+        for instance, save_error in _save_images(instances, tags_by_image):
+            if save_error is None:
+                created_images.append(instance)
+            else:
+                error_images.append(image_data_by_instance[instance])
+                errors.append(save_error)
+
+    record_image_uploads(
+        'batch',
+        time.perf_counter() - start,
+        [file_size_by_instance[instance] for instance in created_images],
+        len(error_images)
+    )
+
+    new_blob_ids = [instance.pk for instance in created_images if instance._image_uploaded]
+    if new_blob_ids:
+        transaction.on_commit(lambda: schedule_image_derivatives(new_blob_ids))
+    return created_images, error_images, errors
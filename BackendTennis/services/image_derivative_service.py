@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+from PIL import Image as PilImage, ImageOps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.utils import timezone
+
+from BackendTennis.models import Image
+from BackendTennis.services.payload_cache_service import invalidate_payloads_for_model
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from typing import Dict, List, Optional
+    from uuid import UUID
+    from rest_framework.request import Request
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IMAGE_DERIVATIVES_SETTINGS = {
+    'WIDTHS': [320, 640, 1280],
+    'FORMATS': ['webp'],
+    'QUALITY': 80,
+    'WORKERS': 2,
+}
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_setting(name: str):
+    return getattr(settings, 'IMAGE_DERIVATIVES', {}).get(name, DEFAULT_IMAGE_DERIVATIVES_SETTINGS[name])
+
+
+def get_pil_format(image_format: str) -> Optional[str]:
+    """Return the Pillow format able to write `image_format` (webp, avif, ...), None when not supported."""
+    pil_format = PilImage.registered_extensions().get(f'.{image_format.lower()}')
+    return pil_format if pil_format in PilImage.SAVE else None
+
+
+def get_derivative_name(original_name: str, width: int, image_format: str) -> str:
+    return f'{os.path.splitext(original_name)[0]}_{width}w.{image_format.lower()}'
+
+
+def _convert_for_format(pil_image: PilImage.Image, pil_format: str) -> PilImage.Image:
+    if pil_format == 'JPEG':
+        return pil_image.convert('RGB')
+    if pil_image.mode not in ['RGB', 'RGBA']:
+        return pil_image.convert('RGBA')
+    return pil_image
+
+
+def generate_image_derivatives(image: Image) -> Dict[str, Dict[str, str]]:
+    """
+    Write a resized copy of the image for every configured width and format next to the original,
+    then store their names in `Image.derivatives`. Widths larger than the original are not generated.
+
+    :return: the new derivatives, {format: {width: storage name}}
+    """
+    if not image.imageUrl:
+        return {}
+
+    storage = image.imageUrl.storage
+    delete_image_derivatives(image)
+
+    with image.imageUrl.open('rb') as file:
+        original = ImageOps.exif_transpose(PilImage.open(file))
+        original.load()
+
+    derivatives: Dict[str, Dict[str, str]] = {}
+    widths = sorted({width for width in _get_setting('WIDTHS') if width < original.width}, reverse=True)
+    for image_format in _get_setting('FORMATS'):
+        pil_format = get_pil_format(image_format)
+        if pil_format is None:
+            logger.warning(f'[ {image.id} ] Image format {image_format} not supported by Pillow, skipped')
+            continue
+
+        source = _convert_for_format(original, pil_format)
+        format_derivatives: Dict[str, str] = {}
+        # Each width is resized from the previous (larger) one, much cheaper than from the original
+        for width in widths:
+            height = max(1, round(source.height * width / source.width))
+            source = source.resize((width, height), PilImage.LANCZOS, reducing_gap=3.0)
+            buffer = BytesIO()
+            source.save(buffer, format=pil_format, quality=_get_setting('QUALITY'))
+            name = storage.save(
+                get_derivative_name(image.imageUrl.name, width, image_format),
+                ContentFile(buffer.getvalue())
+            )
+            format_derivatives[str(width)] = name
+        if format_derivatives:
+            derivatives[image_format.lower()] = format_derivatives
+
+    # Every Image sharing the blob gets the derivatives, update() avoids sending post_save again,
+    # the related payloads are invalidated by hand
+    Image.objects.filter(imageUrl=image.imageUrl.name).update(derivatives=derivatives, updateAt=timezone.now())
+    image.derivatives = derivatives
+    invalidate_payloads_for_model(Image)
+    logger.debug(f'[ {image.id} ] {sum(len(names) for names in derivatives.values())} image derivatives generated')
+    return derivatives
+
+
+def delete_image_derivatives(image: Image) -> None:
+    storage = image.imageUrl.storage
+    for names in (image.derivatives or {}).values():
+        for name in names.values():
+            storage.delete(name)
+
+
+def get_image_derivative_urls(image: Image, request: Optional[Request] = None) -> Dict[str, Dict[str, str]]:
+    """Return the derivatives as a srcset-style map: {format: {'<width>w': url}}, smallest width first."""
+    storage = image.imageUrl.storage
+    derivative_urls = {}
+    for image_format, names in (image.derivatives or {}).items():
+        urls = {}
+        for width, name in sorted(names.items(), key=lambda item: int(item[0])):
+            url = storage.url(name)
+            urls[f'{width}w'] = request.build_absolute_uri(url) if request is not None else url
+        derivative_urls[image_format] = urls
+    return derivative_urls
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_get_setting('WORKERS'),
+                thread_name_prefix='image-derivatives'
+            )
+    return _executor
+
+
+def _generate_image_derivatives_task(image_id: UUID) -> None:
+    try:
+        image = Image.objects.filter(pk=image_id).first()
+        if image is not None:
+            generate_image_derivatives(image)
+    except Exception as e:
+        logger.error(f'[ {image_id} ] Image derivatives generation failed : {e}')
+    finally:
+        # Every worker thread opens its own connection
+        connection.close()
+
+
+def schedule_image_derivatives(image_ids: List[UUID]) -> List[Future]:
+    """Generate the derivatives of the given images in the worker pool, off the request path."""
+    executor = _get_executor()
+    return [executor.submit(_generate_image_derivatives_task, image_id) for image_id in image_ids]
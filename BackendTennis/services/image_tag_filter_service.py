@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db.models import Exists, OuterRef
+
+from BackendTennis.constant import Constant
+from BackendTennis.models import Image, Tag
+
+if TYPE_CHECKING:
+    from typing import Iterable, List
+    from uuid import UUID
+    from django.db.models import QuerySet
+
+
+def resolve_tag_ids(names: Iterable[str]) -> List[UUID]:
+    """
+    Return the ids of the given tag names, unknown names are left out. A single query on the unique index of
+    the name: nothing is cached, so a renamed or deleted tag is seen at once by every worker.
+    """
+    return list(Tag.objects.filter(name__in=set(names)).values_list('id', flat=True))
+
+
+def filter_images_by_tags(
+        queryset: QuerySet[Image],
+        names: Iterable[str],
+        mode: str = Constant.TAG_MATCH_MODE.ALL
+) -> QuerySet[Image]:
+    """
+    Keep the images having all (or any) of the tag names. Each tag is an EXISTS subquery on the
+    image/tag link table answered by its (image_id, tag_id) unique index, so no row is duplicated
+    and no GROUP BY is needed.
+    """
+    names = set(names)
+    tag_ids = resolve_tag_ids(names)
+    if not tag_ids or (mode == Constant.TAG_MATCH_MODE.ALL and len(tag_ids) < len(names)):
+        return queryset.none()
+
+    links = Image.tags.through.objects.filter(image_id=OuterRef('pk'))
+    if mode == Constant.TAG_MATCH_MODE.ANY:
+        return queryset.filter(Exists(links.filter(tag_id__in=tag_ids)))
+    for tag_id in tag_ids:
+        queryset = queryset.filter(Exists(links.filter(tag_id=tag_id)))
+    return queryset
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from prometheus_client import CollectorRegistry, Counter, Histogram, REGISTRY, generate_latest, multiprocess
+
+if TYPE_CHECKING:
+    from typing import List, Optional
+    from BackendTennis.services.request_timing_service import RequestTiming
+
+DEFAULT_METRICS_SETTINGS = {
+    'ENABLED': True,
+    'TOKEN': None,
+    'PUBLIC': False,
+}
+
+# Multiprocess mode is chosen by prometheus_client when the metrics are created, from this environment variable
+MULTIPROCESS_DIR_ENV = 'PROMETHEUS_MULTIPROC_DIR'
+
+REQUESTS = Counter(
+    'backendtennis_requests_total',
+    'Requests of the BackendTennis views',
+    ['view', 'method', 'status']
+)
+REQUEST_DURATION = Histogram(
+    'backendtennis_request_duration_seconds',
+    'Response time of the BackendTennis views',
+    ['view', 'method'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+RESPONSE_SIZE = Histogram(
+    'backendtennis_response_size_bytes',
+    'Body size of the (not streamed) responses of the BackendTennis views',
+    ['view', 'method'],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+)
+DB_QUERIES = Histogram(
+    'backendtennis_db_queries',
+    'Database queries run by a request of the BackendTennis views',
+    ['view', 'method'],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200)
+)
+DB_DURATION = Histogram(
+    'backendtennis_db_duration_seconds',
+    'Database time of a request of the BackendTennis views',
+    ['view', 'method'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+)
+API_KEY_CACHE_LOOKUPS = Counter(
+    'backendtennis_api_key_cache_lookups_total',
+    'Lookups of the verified API key cache: hit (worker memory), shared_hit (shared cache) or miss',
+    ['result']
+)
+IMAGE_UPLOADS = Counter(
+    'backendtennis_image_uploads_total',
+    'Uploaded image files',
+    ['result']
+)
+IMAGE_UPLOAD_BYTES = Counter(
+    'backendtennis_image_upload_bytes_total',
+    'Size of the stored image uploads'
+)
+IMAGE_UPLOAD_DURATION = Histogram(
+    'backendtennis_image_upload_duration_seconds',
+    'Processing time of an image upload request (validation, storage and insertion of all its files)',
+    ['endpoint'],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+)
+
+
+def get_metrics_setting(name: str):
+    return getattr(settings, 'METRICS', {}).get(name, DEFAULT_METRICS_SETTINGS[name])
+
+
+def record_request_metrics(view_name: str, method: str, status_code: int, timing: RequestTiming,
+                           response_size: Optional[int]) -> None:
+    REQUESTS.labels(view_name, method, str(status_code)).inc()
+    REQUEST_DURATION.labels(view_name, method).observe(timing.total)
+    DB_QUERIES.labels(view_name, method).observe(timing.query_count)
+    DB_DURATION.labels(view_name, method).observe(timing.durations['db'])
+    if response_size is not None:
+        RESPONSE_SIZE.labels(view_name, method).observe(response_size)
+
+
+def record_api_key_cache_lookup(result: str) -> None:
+    API_KEY_CACHE_LOOKUPS.labels(result).inc()
+
+
+def record_image_uploads(endpoint: str, duration: float, stored_sizes: List[int], rejected_count: int) -> None:
+    """Throughput of an upload request: the sizes of its stored files and the count of the rejected ones."""
+    IMAGE_UPLOADS.labels('stored').inc(len(stored_sizes))
+    IMAGE_UPLOADS.labels('rejected').inc(rejected_count)
+    IMAGE_UPLOAD_BYTES.inc(sum(stored_sizes))
+    IMAGE_UPLOAD_DURATION.labels(endpoint).observe(duration)
+
+
+def is_multiprocess_mode() -> bool:
+    return bool(os.environ.get(MULTIPROCESS_DIR_ENV))
+
+
+def render_metrics() -> bytes:
+    """
+    Metrics in the Prometheus text format. With several workers (PROMETHEUS_MULTIPROC_DIR set) every process writes
+    its values to its own files of the shared directory, they are summed here at each scrape.
+    """
+    if not is_multiprocess_mode():
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
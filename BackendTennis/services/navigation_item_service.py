@@ -1,7 +1,25 @@
-from django.core.exceptions import ObjectDoesNotExist
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from BackendTennis.models import NavigationItem, Render
+from BackendTennis.services.payload_cache_service import invalidate_payloads_for_model
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Set, Tuple
+    from uuid import UUID
+
+logger = logging.getLogger(__name__)
 
-from BackendTennis.models import NavigationItem
+# Updates only made of these keys are applied by reorder_navigation_items
+REORDER_FIELDS = {'id', 'order', 'enabled', 'parent'}
 
 
 @transaction.atomic
@@ -20,3 +38,262 @@ def update_multiple_navigation_items(navigation_items_updates: list[dict]):
         update_data.pop('id', None)
 
         nav_item.save(**update_data)
+
+
+def is_reorder_update(navigation_items_updates: list[dict]) -> bool:
+    return all(set(update_data) <= REORDER_FIELDS for update_data in navigation_items_updates)
+
+
+class _NavigationTreeState:
+    """
+    In memory copy of the navigation tree orders: navBarRender (order, position), pageRenders (type, order)
+    and parent links of every item, loaded with three queries. A Render can be the navBarRender of several items.
+    """
+
+    def __init__(self):
+        self.titles: Dict[UUID, str] = {}
+        self.nav_bar_orders: Dict[UUID, Optional[Tuple[int, str]]] = {}
+        self.nav_bar_render_items: Dict[UUID, List[UUID]] = defaultdict(list)
+        for item_id, title, render_id, order, position in NavigationItem.objects.values_list(
+                'id', 'title', 'navBarRender_id', 'navBarRender__order', 'navBarRender__navBarPosition'
+        ):
+            self.titles[item_id] = title
+            self.nav_bar_orders[item_id] = (order, position) if order is not None else None
+            if render_id is not None:
+                self.nav_bar_render_items[render_id].append(item_id)
+
+        self.page_orders: Dict[UUID, Set[Tuple[str, int]]] = defaultdict(set)
+        for item_id, page_type, order in NavigationItem.pageRenders.through.objects.values_list(
+                'navigationitem_id', 'pagerender__render__type', 'pagerender__render__order'
+        ):
+            self.page_orders[item_id].add((page_type, order))
+
+        self.parents: Dict[UUID, Set[UUID]] = defaultdict(set)
+        for parent_id, child_id in NavigationItem.childrenNavigationItems.through.objects.values_list(
+                'from_navigationitem_id', 'to_navigationitem_id'
+        ):
+            self.parents[child_id].add(parent_id)
+
+    def get_siblings(self, parent_id: Optional[UUID]) -> List[UUID]:
+        if parent_id is None:
+            return [item_id for item_id in self.titles if not self.parents[item_id]]
+        return [item_id for item_id in self.titles if parent_id in self.parents[item_id]]
+
+    def has_ancestor(self, item_id: UUID, ancestor_id: UUID) -> bool:
+        seen = set()
+        to_visit = list(self.parents[item_id])
+        while to_visit:
+            parent_id = to_visit.pop()
+            if parent_id == ancestor_id:
+                return True
+            if parent_id not in seen:
+                seen.add(parent_id)
+                to_visit.extend(self.parents[parent_id])
+        return False
+
+    def validate_orders(self, item_id: UUID) -> None:
+        """Same rules as NavigationItem._clean, checked against the brothers of the item in every parent."""
+        for parent_id in self.parents[item_id] or [None]:
+            scope = 'root_items' if parent_id is None else 'child_items'
+            brothers = [brother_id for brother_id in self.get_siblings(parent_id) if brother_id != item_id]
+
+            nav_bar_order = self.nav_bar_orders[item_id]
+            if nav_bar_order is not None and any(self.nav_bar_orders[brother_id] == nav_bar_order
+                                                 for brother_id in brothers):
+                raise ValidationError({
+                    'navBarRender': f'({scope}) Several elements use the same order'
+                                    f' [{nav_bar_order[0]}] for navBarRender'
+                })
+
+            brothers_page_orders = set().union(*(self.page_orders[brother_id] for brother_id in brothers))
+            for page_type, order in sorted(self.page_orders[item_id] & brothers_page_orders):
+                message = f'({scope}) Several elements use the same order [{order}] for pageRenders of type [{page_type}]'
+                if parent_id is not None:
+                    message += f' for parent [{self.titles[parent_id]}]'
+                raise ValidationError({'pageRenders': message})
+
+
+def _get_order(item_id: str, order) -> int:
+    # bool is an int, and int() would truncate a float or raise a TypeError on null
+    if isinstance(order, bool) or not isinstance(order, (int, str)):
+        raise ValueError(f'NavigationItem with ID {item_id} : order must be an integer.')
+    try:
+        return int(order)
+    except ValueError:
+        raise ValueError(f'NavigationItem with ID {item_id} : order must be an integer.')
+
+
+@transaction.atomic
+def reorder_navigation_items(navigation_items_updates: list[dict]) -> None:
+    """
+    Apply the order (navBarRender order), enabled and parent changes of many NavigationItems at once.
+    The items are locked, the changes are applied to an in memory copy of the tree which is validated
+    in a single pass, then written with bulk_update and a single diff of the parent links.
+    A `parent` set to null makes the item a root item, the old and new parents of a moved item get a new updateAt
+    as their children change. The order of a navBarRender is also the order of the
+    other items sharing it: they are validated too, and a batch can not give one Render two orders.
+
+    :param navigation_items_updates: list[dict] of {'id', 'order', 'enabled', 'parent'}
+    """
+    updates_by_id = {str(update_data['id']): update_data for update_data in navigation_items_updates}
+    items = {
+        str(item.id): item
+        for item in NavigationItem.objects.select_for_update(of=('self',)).select_related('navBarRender').filter(
+            id__in=list(updates_by_id)
+        )
+    }
+    for item_id in updates_by_id:
+        if item_id not in items:
+            raise ValueError(f'NavigationItem with ID {item_id} not found.')
+
+    tree = _NavigationTreeState()
+    known_ids = {str(known_id): known_id for known_id in tree.titles}
+    now = timezone.now()
+    changed_items, moved_item_ids = [], []
+    # The childrenNavigationItems of the old and new parents change with a move
+    moved_parent_ids: Set[UUID] = set()
+    changed_renders: Dict[UUID, Render] = {}
+    for item_id, update_data in updates_by_id.items():
+        item = items[item_id]
+        if set(update_data) != {'id'}:
+            item.updateAt = now
+            changed_items.append(item)
+        if 'enabled' in update_data:
+            if not isinstance(update_data['enabled'], bool):
+                raise ValueError(f'NavigationItem with ID {item_id} : enabled must be a boolean.')
+            item.enabled = update_data['enabled']
+        if 'order' in update_data:
+            if item.navBarRender is None:
+                raise ValueError(f'NavigationItem with ID {item_id} has no navBarRender to order.')
+            order = _get_order(item_id, update_data['order'])
+            render = changed_renders.setdefault(item.navBarRender_id, item.navBarRender)
+            if render is not item.navBarRender and render.order != order:
+                raise ValueError(f'Render with ID {render.id} can not get the orders [{render.order}] and [{order}].')
+            render.order = order
+            render.updateAt = now
+            for shared_item_id in tree.nav_bar_render_items[render.id]:
+                tree.nav_bar_orders[shared_item_id] = (order, render.navBarPosition)
+        if 'parent' in update_data:
+            parent_id = update_data['parent']
+            parent = known_ids.get(str(parent_id)) if parent_id is not None else None
+            if parent_id is not None and parent is None:
+                raise ValueError(f'NavigationItem with ID {parent_id} not found.')
+            if parent is not None and (parent == item.id or tree.has_ancestor(parent, item.id)):
+                raise ValueError(f'NavigationItem with ID {item_id} can not be moved under its own descendant.')
+            moved_parent_ids |= tree.parents[item.id]
+            tree.parents[item.id] = {parent} if parent is not None else set()
+            moved_parent_ids |= tree.parents[item.id]
+            moved_item_ids.append(item.id)
+
+    validated_ids = [item.id for item in items.values()]
+    validated_ids += [
+        shared_item_id for render_id in changed_renders for shared_item_id in tree.nav_bar_render_items[render_id]
+    ]
+    for item_id in dict.fromkeys(validated_ids):
+        tree.validate_orders(item_id)
+
+    changed_item_ids = {item.id for item in changed_items}
+    parents = [item for item in items.values() if item.id in moved_parent_ids - changed_item_ids]
+    other_parent_ids = moved_parent_ids - {item.id for item in items.values()}
+    if other_parent_ids:
+        parents += NavigationItem.objects.select_for_update(of=('self',)).filter(id__in=other_parent_ids)
+    for parent in parents:
+        parent.updateAt = now
+    NavigationItem.objects.bulk_update(changed_items + parents, ['enabled', 'updateAt'])
+    Render.objects.bulk_update(list(changed_renders.values()), ['order', 'updateAt'])
+    if moved_item_ids:
+        through = NavigationItem.childrenNavigationItems.through
+        through.objects.filter(to_navigationitem_id__in=moved_item_ids).delete()
+        through.objects.bulk_create([
+            through(from_navigationitem_id=parent_id, to_navigationitem_id=item_id)
+            for item_id in moved_item_ids
+            for parent_id in tree.parents[item_id]
+        ])
+
+    # bulk_update and the raw link changes send no signal
+    for model in [NavigationItem, Render]:
+        invalidate_payloads_for_model(model)
+    logger.debug(f'{len(items)} NavigationItems reordered')
+
+
+def validate_render_update(render: Render) -> None:
+    """
+    Check the NavigationItems using `render` (as navBarRender or through a PageRender) still have orders distinct
+    from their brothers once the render is saved. Nothing is checked when order, navBarPosition and type are
+    unchanged, otherwise the brothers of the affected items, in their current parents, are loaded in one query.
+    Raise the same ValidationError as NavigationItem._clean.
+    """
+    if render._state.adding:
+        return
+    previous = Render.objects.filter(pk=render.pk).values_list('order', 'navBarPosition', 'type').first()
+    if previous is None or previous == (render.order, render.navBarPosition, render.type):
+        return
+
+    affected_parents: Dict[UUID, Set[Optional[UUID]]] = defaultdict(set)
+    nav_bar_item_ids: Set[UUID] = set()
+    page_render_item_ids: Set[UUID] = set()
+    for item_id, parent_id, nav_bar_render_id, page_render_render_id in NavigationItem.objects.filter(
+            Q(navBarRender=render) | Q(pageRenders__render=render)
+    ).values_list('id', 'parent_navigation_items', 'navBarRender_id', 'pageRenders__render_id'):
+        affected_parents[item_id].add(parent_id)
+        if nav_bar_render_id == render.pk:
+            nav_bar_item_ids.add(item_id)
+        if page_render_render_id == render.pk:
+            page_render_item_ids.add(item_id)
+    if not affected_parents:
+        return
+
+    parent_ids = {parent_id for parents in affected_parents.values() for parent_id in parents}
+    brothers_filter = Q(parent_navigation_items__in=[parent_id for parent_id in parent_ids if parent_id is not None])
+    if None in parent_ids:
+        brothers_filter |= Q(parent_navigation_items=None)
+
+    titles: Dict[UUID, str] = {}
+    nav_bar_orders: Dict[Tuple[Optional[UUID], Tuple[int, str]], Set[UUID]] = defaultdict(set)
+    page_orders: Dict[Tuple[Optional[UUID], Tuple[str, int]], Set[UUID]] = defaultdict(set)
+    page_renders_by_type: Dict[Tuple[UUID, str], Set[UUID]] = defaultdict(set)
+    for row in NavigationItem.objects.filter(brothers_filter).values_list(
+            'id', 'title', 'parent_navigation_items', 'parent_navigation_items__title',
+            'navBarRender_id', 'navBarRender__order', 'navBarRender__navBarPosition',
+            'pageRenders__id', 'pageRenders__render_id', 'pageRenders__render__type', 'pageRenders__render__order'
+    ):
+        item_id, title, parent_id, parent_title, nav_bar_render_id, nav_bar_order, nav_bar_position, \
+            page_render_id, page_render_render_id, page_type, page_order = row
+        titles[item_id] = title
+        if parent_id is not None:
+            titles[parent_id] = parent_title
+        # The database still has the previous values of the render being saved
+        if nav_bar_render_id == render.pk:
+            nav_bar_order, nav_bar_position = render.order, render.navBarPosition
+        if page_render_render_id == render.pk:
+            page_type, page_order = render.type, render.order
+        if nav_bar_render_id is not None:
+            nav_bar_orders[(parent_id, (nav_bar_order, nav_bar_position))].add(item_id)
+        if page_render_id is not None:
+            page_orders[(parent_id, (page_type, page_order))].add(item_id)
+            page_renders_by_type[(item_id, page_type)].add(page_render_id)
+
+    nav_bar_order = (render.order, render.navBarPosition)
+    page_order = (render.type, render.order)
+    for item_id, parents in affected_parents.items():
+        same_type_page_renders = page_renders_by_type[(item_id, render.type)]
+        if item_id in page_render_item_ids and len(same_type_page_renders) > 1:
+            page_render_ids = ', '.join(sorted(str(page_render_id) for page_render_id in same_type_page_renders))
+            raise ValidationError({
+                'pageRenders': f'Too many PageRender with same type [{render.type}] : [{page_render_ids}]'
+            })
+
+        for parent_id in parents:
+            scope = 'root_items' if parent_id is None else 'child_items'
+            if item_id in nav_bar_item_ids and len(nav_bar_orders[(parent_id, nav_bar_order)]) > 1:
+                logger.debug(f'({scope}) [{item_id}] Several elements use the same order [{render.order}] '
+                             f'for navBarRender')
+                raise ValidationError({
+                    'navBarRender': f'({scope}) Several elements use the same order [{render.order}] for navBarRender'
+                })
+            if item_id in page_render_item_ids and len(page_orders[(parent_id, page_order)]) > 1:
+                message = f'({scope}) Several elements use the same order [{render.order}] for pageRenders' \
+                          f' of type [{render.type}]'
+                if parent_id is not None:
+                    message += f' for parent [{titles[parent_id]}]'
+                raise ValidationError({'pageRenders': message})
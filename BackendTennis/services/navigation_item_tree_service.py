@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import connection
+from django.db.models import Prefetch, prefetch_related_objects
+
+from BackendTennis.models import NavigationItem, PageRender
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, List, Tuple
+    from uuid import UUID
+
+CHILDREN_CACHE_NAME = 'childrenNavigationItems'
+PARENTS_CACHE_NAME = 'parent_navigation_items'
+
+NAVIGATION_ITEM_TREE_PREFETCHES = (
+    'image__tags',
+    'route',
+    'navBarRender',
+    Prefetch('pageRenders', queryset=PageRender.objects.select_related('route', 'render')),
+)
+
+
+def _is_prefetched(navigation_item: NavigationItem, cache_name: str) -> bool:
+    return cache_name in getattr(navigation_item, '_prefetched_objects_cache', {})
+
+
+def _fetch_edges(item_ids: List[UUID], ancestors: bool = False) -> List[Tuple[UUID, UUID]]:
+    """
+    Return every (parent_id, child_id) edge reachable from the given items with a single recursive query,
+    going down to the descendants or up to the `ancestors`.
+    UNION (instead of UNION ALL) stops the recursion on cyclic menus.
+    """
+    through = NavigationItem.childrenNavigationItems.through
+    from_field = through._meta.get_field('from_navigationitem')
+    to_field = through._meta.get_field('to_navigationitem')
+    pk_field = NavigationItem._meta.pk
+    quote_name = connection.ops.quote_name
+
+    table = quote_name(through._meta.db_table)
+    edge_id = quote_name(through._meta.pk.column)
+    from_column = quote_name(from_field.column)
+    to_column = quote_name(to_field.column)
+    placeholders = ', '.join(['%s'] * len(item_ids))
+    # Column of the given items in the first edges, then joined on the next end of the previous edges
+    item_column, next_column = (to_column, 'parent_id') if ancestors else (from_column, 'child_id')
+
+    sql = (
+        f'WITH RECURSIVE tree (edge_id, parent_id, child_id) AS ('
+        f' SELECT {edge_id}, {from_column}, {to_column} FROM {table} WHERE {item_column} IN ({placeholders})'
+        f' UNION'
+        f' SELECT edge.{edge_id}, edge.{from_column}, edge.{to_column} FROM {table} edge'
+        f' INNER JOIN tree ON edge.{item_column} = tree.{next_column}'
+        f') SELECT parent_id, child_id FROM tree ORDER BY edge_id'
+    )
+    params = [pk_field.get_db_prep_value(item_id, connection) for item_id in item_ids]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [(pk_field.to_python(parent_id), pk_field.to_python(child_id)) for parent_id, child_id in cursor]
+
+
+def _load_missing_items(items_by_id: Dict[UUID, NavigationItem], item_ids: Iterable[UUID]) -> None:
+    missing_ids = {item_id for item_id in item_ids if item_id not in items_by_id}
+    if missing_ids:
+        for navigation_item in NavigationItem.objects.filter(id__in=missing_ids):
+            items_by_id[navigation_item.id] = navigation_item
+
+
+def _set_prefetched(navigation_item: NavigationItem, cache_name: str, related_items: List[NavigationItem]) -> None:
+    """Store the related items the same way prefetch_related does, so `<cache_name>.all()` hits no query."""
+    if not hasattr(navigation_item, '_prefetched_objects_cache'):
+        navigation_item._prefetched_objects_cache = {}
+    queryset = getattr(navigation_item, cache_name).get_queryset()
+    queryset._result_cache = related_items
+    queryset._prefetch_done = True
+    navigation_item._prefetched_objects_cache[cache_name] = queryset
+
+
+def prefetch_navigation_item_tree(navigation_items: Iterable[NavigationItem]) -> List[NavigationItem]:
+    """
+    Load the whole NavigationItem graph below the given items in a fixed number of queries:
+    one recursive query for the edges, one for the missing items and one per related prefetch
+    (image, image tags, route, navBarRender, pageRenders with their route and render).
+    The tree is assembled in memory, so serializing it afterwards does not hit the database.
+
+    :param navigation_items: roots of the trees to load
+    :return: the given items, with their whole tree prefetched
+    """
+    navigation_items = list(navigation_items)
+    roots = [
+        navigation_item for navigation_item in navigation_items
+        if not _is_prefetched(navigation_item, CHILDREN_CACHE_NAME)
+    ]
+    if not roots:
+        return navigation_items
+
+    items_by_id: Dict[UUID, NavigationItem] = {navigation_item.id: navigation_item for navigation_item in roots}
+    edges = _fetch_edges(list(items_by_id))
+    _load_missing_items(items_by_id, (child_id for _, child_id in edges))
+
+    children_by_parent_id: Dict[UUID, List[NavigationItem]] = {item_id: [] for item_id in items_by_id}
+    for parent_id, child_id in edges:
+        children_by_parent_id[parent_id].append(items_by_id[child_id])
+
+    tree_items = list(items_by_id.values())
+    prefetch_related_objects(tree_items, *NAVIGATION_ITEM_TREE_PREFETCHES)
+    for navigation_item in tree_items:
+        _set_prefetched(navigation_item, CHILDREN_CACHE_NAME, children_by_parent_id[navigation_item.id])
+
+    return navigation_items
+
+
+def prefetch_navigation_item_ancestors(navigation_items: Iterable[NavigationItem]) -> List[NavigationItem]:
+    """
+    Load every ancestor of the given items in a fixed number of queries (one recursive query for the edges, one for
+    the missing items, one for the pageRenders and one for the children), with the ids serialized by
+    NavigationItemSerializer, so its nested `parent_navigation_items` do not hit the database.
+
+    :param navigation_items: items whose ancestors are loaded
+    :return: the given items, with their ancestors prefetched
+    """
+    navigation_items = list(navigation_items)
+    items = [
+        navigation_item for navigation_item in navigation_items
+        if not _is_prefetched(navigation_item, PARENTS_CACHE_NAME)
+    ]
+    if not items:
+        return navigation_items
+
+    items_by_id: Dict[UUID, NavigationItem] = {navigation_item.id: navigation_item for navigation_item in items}
+    edges = _fetch_edges(list(items_by_id), ancestors=True)
+    _load_missing_items(items_by_id, (parent_id for parent_id, _ in edges))
+
+    parents_by_child_id: Dict[UUID, List[NavigationItem]] = {item_id: [] for item_id in items_by_id}
+    for parent_id, child_id in edges:
+        parents_by_child_id[child_id].append(items_by_id[parent_id])
+
+    tree_items = list(items_by_id.values())
+    prefetch_related_objects(tree_items, 'pageRenders', CHILDREN_CACHE_NAME)
+    for navigation_item in tree_items:
+        _set_prefetched(navigation_item, PARENTS_CACHE_NAME, parents_by_child_id[navigation_item.id])
+
+    return navigation_items
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.dispatch import Signal
+from rest_framework.utils.encoders import JSONEncoder
+
+from BackendTennis.constant import Constant
+from BackendTennis.models import NavigationBar, NavigationItem, Render, PageRender, Route, Image, Tag, HomePage, \
+    AboutPage, ClubValue, Sponsor, TeamPage, Professor, TeamMember, PricingPage, Pricing, Event, News, Category
+from BackendTennis.utils.http_utils import compute_etag
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, Tuple
+    from django.core.cache.backends.base import BaseCache
+    from django.db.models import Model
+
+logger = logging.getLogger(__name__)
+
+# Models whose changes alter the payloads of a group, related models included because SET_NULL
+# and cascade deletions update the page rows without sending any signal for them.
+PAYLOAD_GROUP_DEPENDENCIES: Dict[str, Tuple[type[Model], ...]] = {
+    Constant.PAYLOAD_GROUP.NAVIGATION_BAR: (NavigationBar, NavigationItem, Render, PageRender, Route, Image, Tag),
+    Constant.PAYLOAD_GROUP.HOME_PAGE: (HomePage, NavigationItem, Render, PageRender, Route, Image, Tag),
+    Constant.PAYLOAD_GROUP.SITE_BUNDLE: (
+        HomePage, NavigationBar, NavigationItem, Render, PageRender, Route, Image, Tag, AboutPage, ClubValue, Sponsor,
+        TeamPage, Professor, TeamMember, PricingPage, Pricing, Event, News, Category
+    ),
+}
+
+
+# Sent with the `group` name once its payloads are invalidated
+payload_group_invalidated = Signal()
+
+
+def get_payload_cache() -> BaseCache:
+    return caches[settings.PAYLOAD_CACHE_ALIAS]
+
+
+def _get_bundle_key(group: str) -> str:
+    return f'payload:{group}'
+
+
+def _get_version_key(group: str) -> str:
+    return f'payload:{group}:version'
+
+
+def _bump_version(cache: BaseCache, group: str) -> int:
+    try:
+        return cache.incr(_get_version_key(group))
+    except ValueError:
+        cache.set(_get_version_key(group), 1, timeout=None)
+        return 1
+
+
+def get_or_build_payload(group: str, name: str, build_data: Callable[[], Any]) -> Dict:
+    """
+    Return the payload `name` of `group`, building and storing it on a cache miss.
+    All the payloads of a group are kept in a single cache entry so a hit costs one lookup.
+
+    :return: dict with the serialized `data`, its `etag` and the group `version` it was built for
+    """
+    cache = get_payload_cache()
+    bundle = cache.get(_get_bundle_key(group))
+    if bundle is not None and name in bundle['payloads']:
+        return bundle['payloads'][name]
+
+    version = cache.get(_get_version_key(group), 0)
+    data = build_data()
+    payload = {
+        'data': data,
+        'etag': compute_etag(group, name, version, json.dumps(data, cls=JSONEncoder)),
+        'version': version,
+    }
+
+    # Do not store a payload built while the group was being invalidated
+    if cache.get(_get_version_key(group), 0) == version:
+        if bundle is None or bundle['version'] != version:
+            bundle = {'version': version, 'payloads': {}}
+        bundle['payloads'][name] = payload
+        cache.set(_get_bundle_key(group), bundle)
+    return payload
+
+
+def _invalidate_payload_group(group: str) -> None:
+    cache = get_payload_cache()
+    version = _bump_version(cache, group)
+    cache.delete(_get_bundle_key(group))
+    logger.debug(f'[ {group} ] Payloads invalidated, new version : {version}')
+
+
+def invalidate_payload_group(group: str) -> None:
+    """
+    Invalidate the payloads of `group` at once, and again after the commit of the current transaction:
+    a concurrent request may rebuild them from the rows read before the commit.
+    """
+    _invalidate_payload_group(group)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _invalidate_payload_group(group))
+    payload_group_invalidated.send(sender=invalidate_payload_group, group=group)
+
+
+def invalidate_payloads_for_model(model: type[Model]) -> None:
+    for group, dependencies in PAYLOAD_GROUP_DEPENDENCIES.items():
+        if model in dependencies:
+            invalidate_payload_group(group)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+
+if TYPE_CHECKING:
+    from typing import FrozenSet, Optional
+    from django.core.cache.backends.base import BaseCache
+    from BackendTennis.models import User
+
+logger = logging.getLogger(__name__)
+
+_VERSION_KEY = 'permissions:version'
+
+
+def get_permission_cache() -> BaseCache:
+    return caches[settings.PERMISSION_CACHE_ALIAS]
+
+
+def _get_user_timeout(cache: BaseCache) -> Optional[float]:
+    """A process-local cache does not share the version: its sets only live LOCAL_TIMEOUT seconds."""
+    local_timeout = settings.PERMISSION_CACHE['LOCAL_TIMEOUT']
+    if isinstance(cache, LocMemCache) and (cache.default_timeout is None or cache.default_timeout > local_timeout):
+        return local_timeout
+    return cache.default_timeout
+
+
+def _get_user_key(version: int, user_id) -> str:
+    return f'permissions:{version}:{user_id}'
+
+
+def get_user_permissions(user: User) -> FrozenSet[str]:
+    """
+    Return the 'app_label.codename' permissions of the user, own and group ones, as ModelBackend resolves them.
+    The set is cached per user for the current permissions version, so write requests skip the two permission queries.
+    """
+    if not user.is_active:
+        return frozenset()
+
+    cache = get_permission_cache()
+    version = cache.get(_VERSION_KEY, 0)
+    user_key = _get_user_key(version, user.pk)
+    user_permissions = cache.get(user_key)
+    if user_permissions is None:
+        user_permissions = frozenset(user.get_all_permissions())
+        cache.set(user_key, user_permissions, timeout=_get_user_timeout(cache))
+    return user_permissions
+
+
+def has_cached_permission(user: User, perm: str) -> bool:
+    return user.is_active and (user.is_superuser or perm in get_user_permissions(user))
+
+
+def invalidate_permissions() -> None:
+    """
+    Outdate every cached permission set: a group or permission change may concern any user.
+    Old entries are never read again and expire with the cache TIMEOUT.
+    With a process-local cache, the other workers keep their sets until LOCAL_TIMEOUT.
+    """
+    cache = get_permission_cache()
+    try:
+        version = cache.incr(_VERSION_KEY)
+    except ValueError:
+        version = 1
+        cache.set(_VERSION_KEY, version, timeout=None)
+    logger.debug(f'Permissions invalidated, new version : {version}')
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+
+if TYPE_CHECKING:
+    from typing import Deque, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REQUEST_TIMING_SETTINGS = {
+    'ENABLED': True,
+    'WINDOW': 500,
+}
+
+# Steps measured inside a request, in the Server-Timing header order
+TIMING_STEPS = ('db', 'auth', 'serialize', 'render')
+PERCENTILES = (50, 90, 99)
+
+_current_timing: ContextVar[Optional[RequestTiming]] = ContextVar('request_timing', default=None)
+
+
+def get_request_timing_setting(name: str):
+    return getattr(settings, 'REQUEST_TIMING', {}).get(name, DEFAULT_REQUEST_TIMING_SETTINGS[name])
+
+
+class RequestTiming:
+    """Query count and time (seconds) spent in every step of one request, the steps may overlap (auth queries)."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.total = None
+        self.query_count = 0
+        self.durations: Dict[str, float] = defaultdict(float)
+
+    def add(self, step: str, duration: float) -> None:
+        self.durations[step] += duration
+
+    def stop(self) -> None:
+        self.total = time.perf_counter() - self.start
+
+    def as_milliseconds(self) -> Dict[str, float]:
+        values = {step: self.durations[step] * 1000 for step in TIMING_STEPS}
+        values['total'] = (self.total or 0) * 1000
+        return values
+
+    def get_server_timing_header(self) -> str:
+        values = self.as_milliseconds()
+        metrics = [f'db;dur={values["db"]:.1f};desc="{self.query_count} queries"']
+        metrics += [f'{step};dur={values[step]:.1f}' for step in [*TIMING_STEPS[1:], 'total']]
+        return ', '.join(metrics)
+
+
+@contextmanager
+def start_request_timing() -> Iterator[RequestTiming]:
+    """Measure the current request, the queries of the default connection are counted by `record_query`."""
+    timing = RequestTiming()
+    token = _current_timing.set(timing)
+    try:
+        yield timing
+    finally:
+        timing.stop()
+        _current_timing.reset(token)
+
+
+def get_current_request_timing() -> Optional[RequestTiming]:
+    return _current_timing.get()
+
+
+@contextmanager
+def timed_step(step: str) -> Iterator[None]:
+    """Add the time spent in the block (or the decorated function) to `step` of the measured request, if any."""
+    timing = _current_timing.get()
+    if timing is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.add(step, time.perf_counter() - start)
+
+
+def record_query(execute, sql, params, many, context):
+    """Database execute wrapper counting the queries of the measured request and their time."""
+    timing = _current_timing.get()
+    if timing is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timing.add('db', time.perf_counter() - start)
+        timing.query_count += 1
+
+
+def get_percentile(sorted_values: List[float], percentile: int) -> float:
+    """Nearest rank percentile of values sorted in ascending order."""
+    index = max(0, -(-len(sorted_values) * percentile // 100) - 1)
+    return round(sorted_values[index], 2)
+
+
+class RollingTimingStats:
+    """Timings of the last `window` requests of every view, kept in memory for their percentiles."""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._timings: Dict[str, Deque[Dict[str, float]]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, view_name: str, timing: RequestTiming) -> None:
+        values = {**timing.as_milliseconds(), 'queries': timing.query_count}
+        with self._lock:
+            self._timings.setdefault(view_name, deque(maxlen=self.window)).append(values)
+
+    def get_stats(self) -> Dict[str, Dict]:
+        with self._lock:
+            timings = {view_name: list(values) for view_name, values in self._timings.items()}
+
+        stats = {}
+        for view_name, values in sorted(timings.items()):
+            stats[view_name] = {'count': len(values)}
+            for metric in ['total', *TIMING_STEPS, 'queries']:
+                sorted_values = sorted(value[metric] for value in values)
+                stats[view_name][metric] = {
+                    f'p{percentile}': get_percentile(sorted_values, percentile) for percentile in PERCENTILES
+                }
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._timings.clear()
+
+
+request_timing_stats = RollingTimingStats(get_request_timing_setting('WINDOW'))
+
+
+def log_request_timing(view_name: str, method: str, status_code: int, timing: RequestTiming) -> None:
+    values = timing.as_milliseconds()
+    logger.info(
+        f'view={view_name} method={method} status={status_code} queries={timing.query_count} '
+        + ' '.join(f'{metric}_ms={value:.1f}' for metric, value in values.items())
+    )
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import logging
+from datetime import date
+from typing import TYPE_CHECKING
+
+from django.db.models import Prefetch
+
+from BackendTennis.models import HomePage, NavigationBar, AboutPage, TeamPage, PricingPage, Event, News, Sponsor, \
+    Professor, Pricing, Image
+from BackendTennis.pagination import EventPagination, NewsPagination
+from BackendTennis.serializers import HomePageDetailSerializer, NavigationBarDetailSerializer, \
+    AboutPageDetailSerializer, TeamPageDetailSerializer, PricingPageDetailSerializer, EventDetailSerializer, \
+    NewsDetailSerializer
+from BackendTennis.services.navigation_item_tree_service import prefetch_navigation_item_tree
+
+if TYPE_CHECKING:
+    from typing import Dict
+    from rest_framework.request import Request
+
+logger = logging.getLogger(__name__)
+
+_IMAGES_WITH_TAGS = Image.objects.prefetch_related('tags')
+
+
+def _get_home_pages():
+    home_pages = list(HomePage.objects.prefetch_related('navigationItems'))
+    # One tree load for the navigation items of every home page
+    prefetch_navigation_item_tree(
+        navigation_item for home_page in home_pages for navigation_item in home_page.navigationItems.all()
+    )
+    return home_pages
+
+
+def _get_upcoming_events(today: date):
+    # Same rows as the first page of event/?mode=future_event
+    return Event.objects.filter(end__gte=today).order_by('start').select_related('category').prefetch_related(
+        Prefetch('image', queryset=_IMAGES_WITH_TAGS)
+    )[:EventPagination.page_size]
+
+
+def _get_latest_news():
+    return News.objects.order_by('-createAt').select_related('category').prefetch_related(
+        Prefetch('images', queryset=_IMAGES_WITH_TAGS)
+    )[:NewsPagination.page_size]
+
+
+def build_site_bundle(request: Request, today: date) -> Dict:
+    """
+    Serialize every page of the public site (home, navigation bar, about, team and pricing pages) with the upcoming
+    events and the latest news, as returned by their detail serializers.
+    Related objects are prefetched per relation for all the pages at once, images with their tags.
+    """
+    context = {'request': request}
+    bundle = {
+        'homePages': HomePageDetailSerializer(_get_home_pages(), many=True, context=context).data,
+        'navigationBars': NavigationBarDetailSerializer(
+            NavigationBar.objects.select_related('routeLogo').prefetch_related(
+                Prefetch('logo', queryset=_IMAGES_WITH_TAGS),
+                'navigationItems'
+            ),
+            many=True,
+            context=context
+        ).data,
+        'aboutPages': AboutPageDetailSerializer(
+            AboutPage.objects.prefetch_related(
+                Prefetch('clubImage', queryset=_IMAGES_WITH_TAGS),
+                'clubValues',
+                Prefetch('sponsors', queryset=Sponsor.objects.prefetch_related(
+                    Prefetch('image', queryset=_IMAGES_WITH_TAGS)
+                ))
+            ),
+            many=True,
+            context=context
+        ).data,
+        'teamPages': TeamPageDetailSerializer(
+            TeamPage.objects.prefetch_related(
+                Prefetch('professors', queryset=Professor.objects.prefetch_related(
+                    Prefetch('image', queryset=_IMAGES_WITH_TAGS)
+                )),
+                Prefetch('teamMembers__images', queryset=_IMAGES_WITH_TAGS)
+            ),
+            many=True,
+            context=context
+        ).data,
+        'pricingPages': PricingPageDetailSerializer(
+            PricingPage.objects.prefetch_related(
+                Prefetch('pricing', queryset=Pricing.objects.prefetch_related(
+                    Prefetch('image', queryset=_IMAGES_WITH_TAGS)
+                ))
+            ),
+            many=True,
+            context=context
+        ).data,
+        'upcomingEvents': EventDetailSerializer(_get_upcoming_events(today), many=True, context=context).data,
+        'latestNews': NewsDetailSerializer(_get_latest_news(), many=True, context=context).data,
+    }
+    logger.debug(f'Site bundle built for {today}')
+    return bundle
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import connection
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from django.utils import timezone
+from rest_framework.permissions import AllowAny
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from typing import Dict, Optional, Set
+    from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATIC_SNAPSHOT_SETTINGS = {
+    'ROOT': None,
+    'BASE_URL': None,
+    'REBUILD_DELAY': 5,
+}
+
+MANIFEST_NAME = 'manifest.json'
+
+# Snapshot name: url name of the public GET endpoint. The site bundle is left out: its upcoming events change with
+# the day, an immutable file rebuilt on content changes only would go stale.
+SNAPSHOT_URL_NAMES = {
+    'home_page': 'home_page_list_create',
+    'navigation_bar': 'navigation_bar_list_create',
+    'about_page': 'about_page_list_create',
+    'team_page': 'team_page_list_create',
+    'pricing_page': 'pricing_page_list_create',
+    'route': 'route_list_create',
+}
+
+_SNAPSHOT_FILE_PATTERN = re.compile(rf'^({"|".join(SNAPSHOT_URL_NAMES)})\.[0-9a-f]{{16}}\.json$')
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_rebuild_lock = threading.Lock()
+_rebuild_pending = False
+
+
+def _get_setting(name: str):
+    return getattr(settings, 'STATIC_SNAPSHOT', {}).get(name, DEFAULT_STATIC_SNAPSHOT_SETTINGS[name])
+
+
+def get_snapshot_root() -> Optional[str]:
+    return _get_setting('ROOT')
+
+
+def get_snapshot_base_url() -> Optional[str]:
+    return _get_setting('BASE_URL')
+
+
+def get_public_response(path: str, base_url: str) -> Response:
+    """
+    Run the GET view of the API endpoint `path` (query string included) without authentication, the response
+    is not rendered yet. `base_url` gives the host of the absolute image URLs.
+    """
+    base = urlsplit(base_url)
+    request = RequestFactory().get(
+        path,
+        HTTP_HOST=base.netloc,
+        HTTP_ACCEPT='application/json',
+        secure=base.scheme == 'https'
+    )
+    view_class = resolve(urlsplit(path).path).func.view_class
+    view = view_class.as_view(authentication_classes=[], permission_classes=[AllowAny])
+    return view(request)
+
+
+def render_snapshot_response(path: str, base_url: str) -> Response:
+    """
+    Render the GET response of the API endpoint `path` as its clients receive it, the payloads are public.
+    Its ETag header is the one of the API.
+    """
+    response = get_public_response(path, base_url)
+    if response.status_code != 200:
+        raise RuntimeError(f'[ {path} ] Snapshot rendering failed with status {response.status_code}')
+    return response.render()
+
+
+def _write_file(file_path: str, content: bytes) -> None:
+    """Write through a temporary file renamed over `file_path`, readers never see a partial file."""
+    file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix='.tmp')
+    try:
+        with os.fdopen(file_descriptor, 'wb') as temp_file:
+            temp_file.write(content)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def read_manifest(root: str) -> Optional[Dict]:
+    try:
+        with open(os.path.join(root, MANIFEST_NAME)) as manifest_file:
+            return json.load(manifest_file)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _get_manifest_files(manifest: Optional[Dict]) -> Set[str]:
+    return {snapshot['file'] for snapshot in (manifest or {}).get('files', {}).values()}
+
+
+def export_static_snapshot(root: Optional[str] = None, base_url: Optional[str] = None) -> Dict:
+    """
+    Render every public GET payload to `root`/<name>.<hash>.json and list them in `root`/manifest.json,
+    with the API path each file answers and the ETag the API returns for it, so a client can switch between the
+    snapshot and the API with conditional requests. A file is never rewritten once created, so a proxy can
+    serve it as immutable. Files of the previous manifest are kept for the clients still using it, older ones
+    are removed.
+
+    :return: the new manifest
+    """
+    root = root or get_snapshot_root()
+    base_url = base_url or get_snapshot_base_url()
+    if root is None:
+        raise ValueError('STATIC_SNAPSHOT ROOT is not configured.')
+    if base_url is None:
+        raise ValueError('STATIC_SNAPSHOT BASE_URL is not configured.')
+    os.makedirs(root, exist_ok=True)
+    previous_manifest = read_manifest(root)
+
+    files = {}
+    for name, url_name in SNAPSHOT_URL_NAMES.items():
+        path = reverse(f'BackendTennis:{url_name}')
+        response = render_snapshot_response(path, base_url)
+        # Named after the content, not the ETag: the content also depends on base_url
+        file_name = f'{name}.{hashlib.sha256(response.content).hexdigest()[:16]}.json'
+        if not os.path.exists(os.path.join(root, file_name)):
+            _write_file(os.path.join(root, file_name), response.content)
+        files[name] = {'path': path, 'file': file_name, 'etag': response['ETag']}
+
+    manifest = {'createAt': timezone.now().isoformat(), 'files': files}
+    _write_file(os.path.join(root, MANIFEST_NAME), json.dumps(manifest, indent=2).encode())
+
+    kept_files = _get_manifest_files(manifest) | _get_manifest_files(previous_manifest)
+    for file_name in os.listdir(root):
+        if _SNAPSHOT_FILE_PATTERN.match(file_name) and file_name not in kept_files:
+            os.unlink(os.path.join(root, file_name))
+
+    logger.info(f'Static snapshot exported to {root} : {", ".join(files)}')
+    return manifest
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # A single worker, rebuilds never overlap
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='static-snapshot')
+    return _executor
+
+
+def _rebuild_static_snapshot_task() -> None:
+    global _rebuild_pending
+    # Changes made while waiting are covered by this rebuild
+    time.sleep(_get_setting('REBUILD_DELAY'))
+    with _rebuild_lock:
+        _rebuild_pending = False
+    try:
+        export_static_snapshot()
+    except Exception as e:
+        logger.error(f'Static snapshot rebuild failed : {e}')
+    finally:
+        # The worker thread opens its own connection
+        connection.close()
+
+
+def schedule_static_snapshot_rebuild() -> Optional[Future]:
+    """
+    Rebuild the static snapshot in the background, off the request path. A burst of changes triggers a single
+    rebuild: nothing is scheduled while a rebuild is still waiting to start. No-op when ROOT is not configured.
+    """
+    global _rebuild_pending
+    if get_snapshot_root() is None:
+        return None
+    with _rebuild_lock:
+        if _rebuild_pending:
+            return None
+        _rebuild_pending = True
+    return _get_executor().submit(_rebuild_static_snapshot_task)
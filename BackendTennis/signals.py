@@ -1,10 +1,20 @@
 import logging
 
-from django.core.exceptions import ValidationError
-from django.db.models.signals import pre_save, m2m_changed
+from django.contrib.auth.models import Group, Permission
+from django.db import transaction
+from django.db.models.signals import pre_save, m2m_changed, post_save, post_delete
 from django.dispatch import receiver
+from rest_framework_api_key.models import APIKey
 
-from BackendTennis.models import Render, NavigationItem, AboutPage, Sponsor, ClubValue, Professor, TeamPage, TeamMember
+from BackendTennis.models import Render, AboutPage, Sponsor, ClubValue, Professor, TeamPage, TeamMember, \
+    User, Image
+from BackendTennis.services.api_key_cache_service import purge_api_key
+from BackendTennis.services.image_derivative_service import schedule_image_derivatives, delete_image_derivatives
+from BackendTennis.services.navigation_item_service import validate_render_update
+from BackendTennis.services.payload_cache_service import invalidate_payloads_for_model, payload_group_invalidated
+from BackendTennis.services.permission_cache_service import invalidate_permissions
+from BackendTennis.services.static_snapshot_service import schedule_static_snapshot_rebuild
+from BackendTennis.utils.utils import is_image_file_shared
 
 logger = logging.getLogger('BackendTennis.SIGNALS')
 
@@ -16,61 +26,84 @@ def _log_function_start_info(sender, instance):
 @receiver(pre_save, sender=Render)
 def validate_navigation_items_on_render_update(sender, instance, **kwargs):
     _log_function_start_info(sender, instance)
-    related_navigation_items = NavigationItem.objects.filter(navBarRender__id=instance.id)
-    for nav_item in related_navigation_items:
-        try:
-            nav_item.save(navBarRender=instance)
-        except ValidationError as e:
-            raise e
+    validate_render_update(instance)
 
 
 @receiver(m2m_changed, sender=AboutPage.sponsors.through)
 def validate_sponsor_order(sender, instance, action, **kwargs):
     _log_function_start_info(sender, instance)
     if action == 'post_add':
-        sponsor_ids = kwargs.get('pk_set', [])
-        sponsors = Sponsor.objects.filter(id__in=sponsor_ids)
-        for sponsor in sponsors:
-            try:
-                sponsor.validate_unique_order(instance)
-            except ValidationError as e:
-                raise e
+        Sponsor.validate_and_store_added_links(instance, kwargs.get('pk_set', []), kwargs.get('reverse', False))
 
 
 @receiver(m2m_changed, sender=AboutPage.clubValues.through)
 def validate_club_values_order(sender, instance, action, **kwargs):
     _log_function_start_info(sender, instance)
     if action == 'post_add':
-        club_value_ids = kwargs.get('pk_set', [])
-        club_values = ClubValue.objects.filter(id__in=club_value_ids)
-        for club_value in club_values:
-            try:
-                club_value.validate_unique_order(instance)
-            except ValidationError as e:
-                raise e
+        ClubValue.validate_and_store_added_links(instance, kwargs.get('pk_set', []), kwargs.get('reverse', False))
 
 
 @receiver(m2m_changed, sender=TeamPage.professors.through)
 def validate_professors_order(sender, instance, action, **kwargs):
     _log_function_start_info(sender, instance)
     if action == 'post_add':
-        professors_id = kwargs.get('pk_set', [])
-        professors = Professor.objects.filter(id__in=professors_id)
-        for professor in professors:
-            try:
-                professor.validate_unique_order(instance)
-            except ValidationError as e:
-                raise e
+        Professor.validate_and_store_added_links(instance, kwargs.get('pk_set', []), kwargs.get('reverse', False))
 
 
 @receiver(m2m_changed, sender=TeamPage.teamMembers.through)
 def validate_team_members_order(sender, instance, action, **kwargs):
     _log_function_start_info(sender, instance)
     if action == 'post_add':
-        team_members_id = kwargs.get('pk_set', [])
-        team_members = TeamMember.objects.filter(id__in=team_members_id)
-        for team_member in team_members:
-            try:
-                team_member.validate_unique_order(instance)
-            except ValidationError as e:
-                raise e
+        TeamMember.validate_and_store_added_links(instance, kwargs.get('pk_set', []), kwargs.get('reverse', False))
+
+
+@receiver([post_save, post_delete])
+def invalidate_payloads_on_model_change(sender, **kwargs):
+    invalidate_payloads_for_model(sender)
+
+
+@receiver(m2m_changed)
+def invalidate_payloads_on_relation_change(sender, instance, action, model, **kwargs):
+    if action in ['post_add', 'post_remove', 'post_clear']:
+        invalidate_payloads_for_model(type(instance))
+        invalidate_payloads_for_model(model)
+
+
+@receiver(payload_group_invalidated)
+def rebuild_static_snapshot_on_invalidation(sender, group, **kwargs):
+    transaction.on_commit(schedule_static_snapshot_rebuild)
+
+
+@receiver([post_save, post_delete], sender=APIKey)
+def purge_api_key_on_change(sender, instance, **kwargs):
+    purge_api_key(instance.prefix)
+
+
+@receiver([post_save, post_delete], sender=User)
+@receiver([post_save, post_delete], sender=Group)
+@receiver([post_save, post_delete], sender=Permission)
+def invalidate_permissions_on_change(sender, **kwargs):
+    invalidate_permissions()
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+@receiver(m2m_changed, sender=Group.permissions.through)
+def invalidate_permissions_on_relation_change(sender, action, **kwargs):
+    if action in ['post_add', 'post_remove', 'post_clear']:
+        invalidate_permissions()
+
+
+@receiver(post_save, sender=Image)
+def generate_image_derivatives_on_upload(sender, instance, **kwargs):
+    # Set by Image.save when a new blob is stored
+    if getattr(instance, '_image_uploaded', False):
+        instance._image_uploaded = False
+        transaction.on_commit(lambda: schedule_image_derivatives([instance.pk]))
+
+
+@receiver(post_delete, sender=Image)
+def delete_image_derivatives_on_delete(sender, instance, **kwargs):
+    # Derivatives belong to the blob, they go with its last reference
+    if not is_image_file_shared(instance):
+        delete_image_derivatives(instance)
@@ -0,0 +1,240 @@
+"""
+Query budgets of the views: the maximum count of SQL queries a view may run for an HTTP method, checked on a small
+and on a large fixture set. A count growing with the data (an N+1 in a serializer) fails even under the budget.
+"""
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from typing import TYPE_CHECKING, NamedTuple
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from BackendTennis.constant import Constant
+from BackendTennis.models import AboutPage, Booking, Category, ClubValue, Event, HomePage, Image, NavigationBar, \
+    NavigationItem, News, PageRender, Pricing, PricingPage, Professor, Render, Route, Sponsor, Tag, TeamMember, \
+    TeamPage, Tournament, Training, User
+from BackendTennis.services.api_key_cache_service import verified_api_keys
+
+if TYPE_CHECKING:
+    from typing import Callable, Dict, Optional
+
+
+class QueryBudget(NamedTuple):
+    view: type
+    method: str
+    budget: int
+    # Fixture whose id is passed as the `id` of a detail view
+    lookup: Optional[str] = None
+    data: Optional[Callable[[Dict], Dict]] = None
+    format: Optional[str] = 'json'
+    query_params: str = ''
+    # For the views without authentication classes, the user is set on the request
+    force_authentication: bool = False
+
+    @property
+    def name(self) -> str:
+        detail = ' detail' if self.lookup else ''
+        return f'{self.view.__name__}{detail} {self.method.upper()}{self.query_params}'
+
+
+def _datetime(days: int) -> datetime:
+    return datetime.combine(date.today(), datetime.min.time(), tzinfo=dt_timezone.utc) + timedelta(days=days)
+
+
+def _create_users(size: int):
+    users = [
+        User.objects.create_user(
+            email=f'query-budget-{size}-{index}@example.com',
+            password='password',
+            first_name='Query',
+            last_name=f'Budget {index}',
+            birthdate=date(1990, 1, 1)
+        )
+        for index in range(size)
+    ]
+    for user in users:
+        user.children.set([child for child in users if child != user])
+    return users
+
+
+def _create_images(size: int):
+    tags = [Tag.objects.create(name=f'query-budget-{index}') for index in range(size)]
+    images = []
+    for index in range(size):
+        image = Image.objects.create(title=f'Image {index}', type=Constant.IMAGE_TYPE.PICTURE)
+        image.tags.set(tags)
+        images.append(image)
+    return tags, images
+
+
+def _create_navigation(size: int, images, routes):
+    """`size` root items of the home page and the navigation bar, each one with `size` children."""
+    def create_item(title, order):
+        item = NavigationItem.objects.create(
+            title=title,
+            image=images[0],
+            route=routes[0],
+            navBarRender=Render.objects.create(navBarPosition='left', type='nav_bar', order=order)
+        )
+        # A single PageRender of each type per item
+        item.pageRenders.add(PageRender.objects.create(
+            route=routes[-1],
+            render=Render.objects.create(navBarPosition='left', type='home_page', order=order)
+        ))
+        return item
+
+    roots = []
+    for root_index in range(size):
+        root = create_item(f'Root {root_index}', root_index)
+        root.childrenNavigationItems.set(
+            create_item(f'Child {root_index}-{index}', (root_index + 1) * size + index) for index in range(size)
+        )
+        roots.append(root)
+
+    home_page = HomePage.objects.create(title='Home')
+    home_page.navigationItems.set(roots)
+    navigation_bar = NavigationBar.objects.create(logo=images[0], routeLogo=routes[0])
+    navigation_bar.navigationItems.set(roots)
+    return roots, home_page, navigation_bar
+
+
+def create_query_budget_fixtures(size: int) -> Dict:
+    """
+    Create `size` rows of every model, each one linked to `size` rows of every related model.
+
+    :return: the first row of every model, by name
+    """
+    users = _create_users(size)
+    tags, images = _create_images(size)
+    category = Category.objects.create(name='Category', icon='icon.svg')
+    routes = [Route.objects.create(name=f'Route {index}', protocol='https', domainUrl='test.com')
+              for index in range(size)]
+    roots, home_page, navigation_bar = _create_navigation(size, images, routes)
+
+    events = [
+        Event.objects.create(
+            title=f'Event {index}',
+            description='Description',
+            dateType='single-day',
+            start=_datetime(index + 1),
+            end=_datetime(index + 2),
+            image=images[index],
+            category=category
+        )
+        for index in range(size)
+    ]
+    news = []
+    for index in range(size):
+        news.append(News.objects.create(title=f'News {index}', content='Content', subtitle='Subtitle',
+                                        category=category))
+        news[-1].images.set(images)
+
+    pricings = [
+        Pricing.objects.create(title=f'Pricing {index}', image=images[index], price=100 + index,
+                               type=Constant.PRICING_TYPE.ADULT)
+        for index in range(size)
+    ]
+    pricing_page = PricingPage.objects.create(title='Pricing')
+    pricing_page.pricing.set(pricings)
+
+    club_values = [ClubValue.objects.create(title=f'Value {index}', description='Description', order=index)
+                   for index in range(size)]
+    sponsors = [Sponsor.objects.create(brandName=f'Sponsor {index}', image=images[index], order=index)
+                for index in range(size)]
+    about_page = AboutPage.objects.create(clubTitle='About', clubImage=images[0])
+    about_page.clubValues.add(*club_values)
+    about_page.sponsors.add(*sponsors)
+
+    professors = [
+        Professor.objects.create(fullName=f'Professor {index}', image=images[index], role='Coach', diploma='DE',
+                                 best_rank='15/1', year_experience='10 ans', order=index)
+        for index in range(size)
+    ]
+    team_members = []
+    for index in range(size):
+        team_members.append(TeamMember.objects.create(fullNames=[f'Member {index}'], role='Member',
+                                                      description='Description', order=index))
+        team_members[-1].images.set(images)
+    team_page = TeamPage.objects.create(professorsTitle='Professors')
+    team_page.professors.add(*professors)
+    team_page.teamMembers.add(*team_members)
+
+    activities = {}
+    for model in (Training, Tournament):
+        for index in range(size):
+            activity = model.objects.create(name=f'{model.__name__} {index}', start=_datetime(index),
+                                            end=_datetime(index) + timedelta(hours=1))
+            activity.participants.set(users)
+            activities.setdefault(model, activity)
+
+    bookings = [
+        Booking.objects.create(clientFirstName=f'Client {index}', clientLastName='Doe',
+                               clientEmail='client@example.com', clientPhoneNumber='0600000000',
+                               start=date(2025, 1, 1) + timedelta(days=index),
+                               end=date(2025, 1, 2) + timedelta(days=index))
+        for index in range(size)
+    ]
+
+    return {
+        'user': users[0],
+        'users': users,
+        'tag': tags[0],
+        'image': images[0],
+        'images': images,
+        'category': category,
+        'route': routes[0],
+        'render': roots[0].navBarRender,
+        'page_render': roots[0].pageRenders.first(),
+        'navigation_item': roots[0],
+        'home_page': home_page,
+        'navigation_bar': navigation_bar,
+        'event': events[0],
+        'news': news[0],
+        'pricing': pricings[0],
+        'pricing_page': pricing_page,
+        'club_value': club_values[0],
+        'sponsor': sponsors[0],
+        'about_page': about_page,
+        'professor': professors[0],
+        'team_member': team_members[0],
+        'team_page': team_page,
+        'training': activities[Training],
+        'tournament': activities[Tournament],
+        'booking': bookings[0],
+    }
+
+
+def count_view_queries(query_budget: QueryBudget, fixtures: Dict, headers: Dict, user: User) -> int:
+    """
+    Send the request of `query_budget` straight to its view, with cold caches, and count its queries.
+    The changes of the request are rolled back.
+
+    :raise AssertionError: when the view does not answer with a success
+    """
+    factory = APIRequestFactory()
+    data = query_budget.data(fixtures) if query_budget.data else None
+    request = getattr(factory, query_budget.method)(
+        f'/query-budget/{uuid.uuid4()}/{query_budget.query_params}',
+        data,
+        format=query_budget.format if data is not None else None,
+        **headers
+    )
+    if query_budget.force_authentication:
+        force_authenticate(request, user)
+    kwargs = {'id': fixtures[query_budget.lookup].id} if query_budget.lookup else {}
+    view = query_budget.view.as_view()
+
+    verified_api_keys.clear()
+    with transaction.atomic():
+        with CaptureQueriesContext(connection) as context:
+            response = view(request, **kwargs)
+            if hasattr(response, 'render'):
+                response.render()
+        transaction.set_rollback(True)
+
+    if response.status_code >= 400:
+        raise AssertionError(f'{query_budget.name} answered {response.status_code}: {response.content[:500]!r}')
+    return len(context.captured_queries)
@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.test import override_settings
+from django.test.runner import DiscoverRunner
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Run the tests with the payload and permission caches replaced by DummyCache: test cases are rolled back
+    without any signal, cached payloads and permissions would outlive their data.
+    The tests needing a real cache override CACHES with their own LocMemCache.
+    """
+    dummy_cache_aliases = ('payload', 'permission')
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._caches_override = override_settings(CACHES={
+            **settings.CACHES,
+            **{alias: {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'} for alias in self.dummy_cache_aliases}
+        })
+        self._caches_override.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._caches_override.disable()
+        super().teardown_test_environment(**kwargs)
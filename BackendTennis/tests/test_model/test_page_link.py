@@ -0,0 +1,186 @@
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+
+from BackendTennis.constant import Constant
+from BackendTennis.models import AboutPage, AboutPageClubValue, AboutPageSponsor, ClubValue, Image, Professor, \
+    Sponsor, TeamMember, TeamPage, TeamPageProfessor, TeamPageTeamMember
+
+
+class PageLinkTestsMixin:
+    """
+    Same tests for every page link model (see BasePageLink): `create_page` and `create_object` build the page and
+    its ordered objects, `link_model`, `page_field`, `object_field` and `order_constraint` describe the link.
+    """
+    link_model = None
+    page_field = None
+    object_field = None
+    object_relation_name = None
+    order_constraint = None
+
+    def create_page(self):
+        raise NotImplementedError
+
+    def create_object(self, index, order):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.page = self.create_page()
+        self.object = self.create_object(1, 0)
+        self.object_2 = self.create_object(2, 1)
+        getattr(self.page, self.object_relation_name).add(self.object, self.object_2)
+
+    def _get_link_orders(self):
+        return dict(self.link_model.objects.filter(**{self.page_field: self.page}).values_list(
+            f'{self.object_field}_id', 'order'
+        ))
+
+    def test_added_links_store_order(self):
+        self.assertEqual({self.object.id: 0, self.object_2.id: 1}, self._get_link_orders())
+
+    def test_order_update_is_stored_on_links(self):
+        self.object.order = 5
+        self.object.save()
+
+        self.assertEqual({self.object.id: 5, self.object_2.id: 1}, self._get_link_orders())
+
+    def test_duplicated_link_order_is_rejected_by_database(self):
+        object_3 = self.create_object(3, 0)
+
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                self.link_model.objects.create(**{self.page_field: self.page, self.object_field: object_3, 'order': 0})
+
+    def test_store_page_orders_conflict_raises_validation_error(self):
+        """ Test an order changed without the pre-check, as by a concurrent write, is reported as a ValidationError """
+        type(self.object).objects.filter(pk=self.object.pk).update(order=1)
+
+        with self.assertRaises(ValidationError) as _exception:
+            type(self.object).store_page_orders([self.object.id])
+        self.assertIn(f'Order [1] of {type(self.object).__name__} [', _exception.exception.message_dict['order'][0])
+        self.assertEqual({self.object.id: 0, self.object_2.id: 1}, self._get_link_orders())
+
+    def test_link_orders_can_be_swapped_with_deferred_constraint(self):
+        links = self.link_model.objects.filter(**{self.page_field: self.page})
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(f'SET CONSTRAINTS {self.order_constraint} DEFERRED')
+            links.filter(**{self.object_field: self.object}).update(order=1)
+            links.filter(**{self.object_field: self.object_2}).update(order=0)
+            with connection.cursor() as cursor:
+                cursor.execute(f'SET CONSTRAINTS {self.order_constraint} IMMEDIATE')
+
+        self.assertEqual({self.object.id: 1, self.object_2.id: 0}, self._get_link_orders())
+
+
+class AboutPageSponsorTests(PageLinkTestsMixin, TestCase):
+    link_model = AboutPageSponsor
+    page_field = 'aboutPage'
+    object_field = 'sponsor'
+    object_relation_name = 'sponsors'
+    order_constraint = 'unique_about_page_sponsor_order'
+
+    def create_page(self):
+        return AboutPage.objects.create()
+
+    def create_object(self, index, order):
+        image = Image.objects.create(title='Sponsor Image', type=Constant.IMAGE_TYPE.SPONSOR)
+        return Sponsor.objects.create(brandName=f'Sponsor {index}', image=image, order=order)
+
+
+class AboutPageClubValueTests(PageLinkTestsMixin, TestCase):
+    link_model = AboutPageClubValue
+    page_field = 'aboutPage'
+    object_field = 'clubValue'
+    object_relation_name = 'clubValues'
+    order_constraint = 'unique_about_page_club_value_order'
+
+    def create_page(self):
+        return AboutPage.objects.create()
+
+    def create_object(self, index, order):
+        return ClubValue.objects.create(title=f'ClubValue {index}', description='description', order=order)
+
+
+class TeamPageProfessorTests(PageLinkTestsMixin, TestCase):
+    link_model = TeamPageProfessor
+    page_field = 'teamPage'
+    object_field = 'professor'
+    object_relation_name = 'professors'
+    order_constraint = 'unique_team_page_professor_order'
+
+    def create_page(self):
+        return TeamPage.objects.create()
+
+    def create_object(self, index, order):
+        image = Image.objects.create(title='Professor Image', type=Constant.IMAGE_TYPE.PROFESSOR)
+        return Professor.objects.create(
+            fullName=f'Professor {index}',
+            image=image,
+            role='Professor',
+            year_experience='5 ans',
+            diploma='E',
+            best_rank='6',
+            order=order
+        )
+
+
+class TeamPageTeamMemberTests(PageLinkTestsMixin, TestCase):
+    link_model = TeamPageTeamMember
+    page_field = 'teamPage'
+    object_field = 'teamMember'
+    object_relation_name = 'teamMembers'
+    order_constraint = 'unique_team_page_team_member_order'
+
+    def create_page(self):
+        return TeamPage.objects.create()
+
+    def create_object(self, index, order):
+        return TeamMember.objects.create(
+            fullNames=[f'Team Member {index}'],
+            role='Team Member',
+            description='description',
+            order=order
+        )
+
+
+class PageLinksMigrationTests(TransactionTestCase):
+    """ Data step of 0039_page_links: the implicit many to many rows are copied on the link models """
+    migrate_from = [('BackendTennis', '0038_image_content_hash')]
+    migrate_to = [('BackendTennis', '0039_page_links')]
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_from)
+        self.old_apps = executor.loader.project_state(self.migrate_from).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_duplicated_orders_are_copied_as_null(self):
+        sponsor_model = self.old_apps.get_model('BackendTennis', 'Sponsor')
+        about_page = self.old_apps.get_model('BackendTennis', 'AboutPage').objects.create()
+        first = sponsor_model.objects.create(brandName='First', order=3)
+        duplicate = sponsor_model.objects.create(brandName='Duplicate', order=3)
+        other = sponsor_model.objects.create(brandName='Other', order=4)
+        about_page.sponsors.add(first, duplicate, other)
+        other_page = self.old_apps.get_model('BackendTennis', 'AboutPage').objects.create()
+        other_page.sponsors.add(duplicate)
+
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.migrate_to)
+        new_apps = executor.loader.project_state(self.migrate_to).apps
+
+        links = new_apps.get_model('BackendTennis', 'AboutPageSponsor').objects
+        self.assertEqual(
+            {first.id: 3, duplicate.id: None, other.id: 4},
+            dict(links.filter(aboutPage_id=about_page.id).values_list('sponsor_id', 'order'))
+        )
+        # The order is only a duplicate within a page
+        self.assertEqual({duplicate.id: 3}, dict(links.filter(aboutPage_id=other_page.id).values_list(
+            'sponsor_id', 'order'
+        )))
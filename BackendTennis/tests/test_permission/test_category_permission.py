@@ -1,12 +1,28 @@
+import time
 from datetime import date
+from unittest import mock
 
-from django.contrib.auth.models import Permission
+from django.conf import settings
+from django.contrib.auth.models import Permission, Group
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 from rest_framework_api_key.models import APIKey
 from rest_framework_simplejwt.tokens import AccessToken
 
 from BackendTennis.models import User, Category
+from BackendTennis.services.permission_cache_service import get_permission_cache, get_user_permissions
+
+PERMISSION_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'payload': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+    'permission': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'test-category-permission',
+    },
+}
 
 
 class CategoryPermissionsTests(APITestCase):
@@ -134,3 +150,85 @@ class CategoryPermissionsTests(APITestCase):
             HTTP_API_KEY=self.key
         )
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+
+@override_settings(CACHES=PERMISSION_CACHES)
+class CategoryPermissionsCacheTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='testuser@example.com',
+            password='testpassword',
+            first_name='Test',
+            last_name='User',
+            birthdate=date(1990, 1, 1)
+        )
+        cls.token = str(AccessToken.for_user(cls.user))
+        cls.api_key, cls.key = APIKey.objects.create_key(name="test-api-key")
+
+        cls.category = Category.objects.create(name="Existing Category", icon="category_icon.png")
+        cls.detail_url = f'/BackendTennis/category/{cls.category.id}/'
+
+    def setUp(self):
+        get_permission_cache().clear()
+
+    def _patch_category(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.patch(
+                self.detail_url,
+                data={'name': 'Updated Category'},
+                HTTP_AUTHORIZATION=f'Bearer {self.token}',
+                HTTP_API_KEY=self.key
+            )
+        permission_queries = [query for query in context.captured_queries if 'auth_permission' in query['sql']]
+        return response, len(permission_queries)
+
+    def test_permissions_are_cached(self):
+        self.user.user_permissions.add(Permission.objects.get(codename='change_category'))
+        response, permission_queries = self._patch_category()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(permission_queries, 2)
+
+        response, permission_queries = self._patch_category()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(permission_queries, 0)
+
+    def test_permission_removal_invalidates_cache(self):
+        permission = Permission.objects.get(codename='change_category')
+        self.user.user_permissions.add(permission)
+        response, _ = self._patch_category()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.user.user_permissions.remove(permission)
+        response, _ = self._patch_category()
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_group_permission_change_invalidates_cache(self):
+        group = Group.objects.create(name='Category')
+        self.user.groups.add(group)
+        response, _ = self._patch_category()
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        group.permissions.add(Permission.objects.get(codename='change_category'))
+        response, _ = self._patch_category()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_revocation_from_another_worker_expires_with_local_timeout(self):
+        permission = Permission.objects.get(codename='change_category')
+        self.user.user_permissions.add(permission)
+        response, _ = self._patch_category()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # The invalidation of another worker does not reach a LocMemCache, as a removal without signal
+        self.user.user_permissions.through.objects.filter(user=self.user, permission=permission).delete()
+        self.assertIn('BackendTennis.change_category', get_user_permissions(User.objects.get(pk=self.user.pk)))
+
+        expired = time.time() + settings.PERMISSION_CACHE['LOCAL_TIMEOUT'] + 1
+        with mock.patch('django.core.cache.backends.locmem.time.time', return_value=expired):
+            self.assertNotIn('BackendTennis.change_category',
+                             get_user_permissions(User.objects.get(pk=self.user.pk)))
+
+    def test_invalid_token_on_safe_method(self):
+        response = self.client.get(self.detail_url, HTTP_AUTHORIZATION='Bearer invalid', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
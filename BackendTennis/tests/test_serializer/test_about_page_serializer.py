@@ -1,6 +1,9 @@
 import uuid
 
+from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from BackendTennis.constant import Constant
 from BackendTennis.models import AboutPage, Image, ClubValue, Sponsor
@@ -246,3 +249,28 @@ class AboutPageSerializerTests(TestCase):
         about_page = serializer.save()
 
         self.assertEqual(about_page.sponsors.count(), 2)
+
+    def _count_add_sponsors_queries(self, count):
+        about_page = AboutPage.objects.create()
+        sponsors = Sponsor.objects.bulk_create([
+            Sponsor(brandName=f'Sponsor {index}', image=self.sponsor_image, order=100 + index)
+            for index in range(count)
+        ])
+        with CaptureQueriesContext(connection) as context:
+            about_page.sponsors.add(*sponsors)
+        return len(context.captured_queries)
+
+    def test_add_sponsors_order_validation_query_count(self):
+        self.assertEqual(self._count_add_sponsors_queries(2), self._count_add_sponsors_queries(30))
+
+    def test_add_sponsors_with_same_order(self):
+        about_page = AboutPage.objects.create()
+        about_page.sponsors.add(self.sponsor)
+        sponsor_3 = Sponsor.objects.create(brandName='Sponsor 3', image=self.sponsor_image, order=0)
+
+        with self.assertRaises(ValidationError) as _exception:
+            about_page.sponsors.add(self.sponsor_2, sponsor_3)
+        self.assertEqual(
+            f'Order [0] of Sponsor [{sponsor_3.id}] already used by another Sponsor in the About page "{about_page.id}".',
+            _exception.exception.message_dict['order'][0]
+        )
@@ -1,7 +1,17 @@
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import override_settings
 from rest_framework.test import APITestCase
 from BackendTennis.models import Image, Tag
-from BackendTennis.serializers import ImageSerializer
+from BackendTennis.serializers import ImageSerializer, ImageDetailSerializer
+from BackendTennis.services.image_bulk_upload_service import _check_image_file, _store_image_file
+from BackendTennis.services.image_derivative_service import generate_image_derivatives, get_pil_format
 from BackendTennis.constant import Constant
+from BackendTennis.utils.utils import is_image_file_shared, lock_image_blobs
 from io import BytesIO
 from PIL import Image as PilImage
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -107,3 +117,145 @@ class ImageSerializerTests(APITestCase):
         self.assertTrue(serializer.is_valid())
         image = serializer.save()
         self.assertEqual(image.tags.count(), 0)
+
+
+class ImageDerivativesTests(APITestCase):
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(
+            MEDIA_ROOT=self.media_root,
+            IMAGE_DERIVATIVES={'WIDTHS': [320, 640, 1280], 'FORMATS': ['webp', 'avif'], 'QUALITY': 80, 'WORKERS': 1}
+        )
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    @staticmethod
+    def create_image(width):
+        pil_image = PilImage.new('RGB', (width, width // 2), color='blue')
+        image_file = BytesIO()
+        pil_image.save(image_file, 'png')
+        image = Image.objects.create(title='Large Image', type=Constant.IMAGE_TYPE.SPONSOR)
+        image.imageUrl = SimpleUploadedFile('large.png', image_file.getvalue(), content_type='image/png')
+        image.save()
+        return image
+
+    def test_generate_image_derivatives(self):
+        """ Teste la génération des variantes webp, sans agrandir l'image ni échouer sur un format non supporté """
+        image = self.create_image(800)
+        derivatives = generate_image_derivatives(image)
+
+        self.assertEqual(sorted(derivatives['webp']), ['320', '640'])
+        for width, name in derivatives['webp'].items():
+            with PilImage.open(Path(self.media_root, name)) as derivative:
+                self.assertEqual(derivative.format, 'WEBP')
+                self.assertEqual(derivative.width, int(width))
+        if get_pil_format('avif') is None:
+            self.assertNotIn('avif', derivatives)
+
+        image.refresh_from_db()
+        self.assertEqual(image.derivatives, derivatives)
+
+    def test_image_detail_serializer_derivatives(self):
+        """ Teste l'exposition des variantes sous forme de srcset """
+        image = self.create_image(800)
+        generate_image_derivatives(image)
+
+        data = ImageDetailSerializer(image).data
+        self.assertEqual(list(data['derivatives']['webp']), ['320w', '640w'])
+        self.assertTrue(data['derivatives']['webp']['320w'].endswith('_320w.webp'))
+
+    def test_delete_image_removes_derivatives(self):
+        """ Teste la suppression des variantes avec l'image """
+        image = self.create_image(800)
+        derivatives = generate_image_derivatives(image)
+        image.delete()
+        for name in derivatives['webp'].values():
+            self.assertFalse(Path(self.media_root, name).exists())
+
+    def test_upload_schedules_derivatives_after_commit(self):
+        """ Teste que la génération est planifiée hors de la requête, après le commit """
+        with patch('BackendTennis.signals.schedule_image_derivatives') as schedule:
+            with self.captureOnCommitCallbacks(execute=True):
+                image = self.create_image(800)
+            schedule.assert_called_once_with([image.pk])
+
+
+class ImageBlobTests(APITestCase):
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+        pil_image = PilImage.new('RGB', (100, 100), color='green')
+        image_file = BytesIO()
+        pil_image.save(image_file, 'png')
+        self.content = image_file.getvalue()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def create_image(self, name='green.png'):
+        return Image.objects.create(
+            title='Green Image',
+            type=Constant.IMAGE_TYPE.SPONSOR,
+            imageUrl=SimpleUploadedFile(name, self.content, content_type='image/png')
+        )
+
+    def test_same_content_shares_one_blob(self):
+        """ Teste qu'un même contenu envoyé deux fois n'est stocké qu'une fois """
+        first_image = self.create_image()
+        second_image = self.create_image('other_name.png')
+
+        self.assertEqual(first_image.contentHash, second_image.contentHash)
+        self.assertEqual(first_image.imageUrl.name, second_image.imageUrl.name)
+        self.assertTrue(first_image.imageUrl.name.startswith(f'blobs/{first_image.contentHash[:2]}/'))
+        self.assertEqual(len(list(Path(self.media_root).rglob('*.png'))), 1)
+
+    def test_reused_blob_does_not_schedule_derivatives(self):
+        """ Teste que les variantes d'un blob existant sont reprises sans nouvelle génération """
+        first_image = self.create_image()
+        Image.objects.filter(pk=first_image.pk).update(derivatives={'webp': {'320': 'blobs/320w.webp'}})
+
+        with patch('BackendTennis.signals.schedule_image_derivatives') as schedule:
+            with self.captureOnCommitCallbacks(execute=True):
+                second_image = self.create_image()
+            schedule.assert_not_called()
+        self.assertEqual(second_image.derivatives, {'webp': {'320': 'blobs/320w.webp'}})
+
+    def test_delete_keeps_shared_blob(self):
+        """ Teste que le blob n'est supprimé qu'avec sa dernière image """
+        first_image = self.create_image()
+        second_image = self.create_image()
+        self.assertTrue(is_image_file_shared(first_image))
+
+        first_image.delete()
+        self.assertFalse(is_image_file_shared(second_image))
+        self.assertTrue(Path(self.media_root, second_image.imageUrl.name).exists())
+
+    def test_blob_lock_is_held_by_the_transaction(self):
+        """ Teste que le verrou d'un blob est un verrou consultatif PostgreSQL gardé jusqu'au commit """
+        image = self.create_image()
+        lock_image_blobs([image.contentHash, image.contentHash, ''])
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT count(*) FROM pg_locks WHERE locktype = 'advisory' AND pid = pg_backend_pid()")
+            self.assertEqual(cursor.fetchone()[0], 1)
+
+    def test_blob_deleted_after_the_check_is_written_again(self):
+        """ Teste qu'un blob supprimé entre la vérification et l'enregistrement est réécrit """
+        first_image = self.create_image()
+        instance = Image(title='Green Image', type=Constant.IMAGE_TYPE.SPONSOR)
+        file = SimpleUploadedFile('green.png', self.content, content_type='image/png')
+        self.assertIsNone(_check_image_file(instance, file))
+
+        # Deleted by its last reference before the upload takes the lock
+        first_image.imageUrl.storage.delete(first_image.imageUrl.name)
+        lock_image_blobs([instance.contentHash])
+        self.assertIsNone(_store_image_file(instance, file))
+        self.assertTrue(instance._image_uploaded)
+        self.assertEqual(instance.imageUrl.name, first_image.imageUrl.name)
+        self.assertTrue(Path(self.media_root, instance.imageUrl.name).exists())
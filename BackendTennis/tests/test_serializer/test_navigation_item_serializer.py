@@ -1,11 +1,14 @@
+import itertools
 import uuid
 
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from BackendTennis.constant import Constant
-from BackendTennis.models import NavigationItem, Route, Image, Render, PageRender
-from BackendTennis.serializers import NavigationItemSerializer, RenderSerializer
+from BackendTennis.models import NavigationItem, Route, Image, Render, PageRender, Tag
+from BackendTennis.serializers import NavigationItemSerializer, RenderSerializer, NavigationItemDetailSerializer
 
 
 class NavigationItemSerializerTests(TestCase):
@@ -902,3 +905,136 @@ class NavigationItemSerializerTests(TestCase):
         self.assertEqual(navigation_item.childrenNavigationItems.count(), 2, str(serializer.errors))
         self.assertIn(children_navigation_item.id, children_navigation_items, str(serializer.errors))
         self.assertIn(children_navigation_item_2.id, children_navigation_items, str(serializer.errors))
+
+
+class NavigationItemDetailSerializerTreeTests(TestCase):
+
+    def setUp(self):
+        self.route = Route.objects.create(name='Tree Route', protocol='https', domainUrl='tree.com')
+        self.tag = Tag.objects.create(name='Tree tag')
+        self.order = 0
+
+    def _create_navigation_item(self, title):
+        self.order += 1
+        image = Image.objects.create(title=f'{title} Image', type=Constant.IMAGE_TYPE.NAVIGATION_ITEM)
+        image.tags.add(self.tag)
+        page_render = PageRender.objects.create(
+            route=self.route,
+            render=Render.objects.create(navBarPosition='left', type='home_page', order=self.order)
+        )
+        navigation_item = NavigationItem.objects.create(
+            title=title,
+            image=image,
+            route=self.route,
+            navBarRender=Render.objects.create(navBarPosition='left', type='nav_bar', order=self.order)
+        )
+        navigation_item.pageRenders.add(page_render)
+        return navigation_item
+
+    def _create_tree(self, width):
+        root = self._create_navigation_item(f'Root {width}')
+        for child_index in range(width):
+            child = self._create_navigation_item(f'Child {width}-{child_index}')
+            root.childrenNavigationItems.add(child)
+            for grandchild_index in range(2):
+                child.childrenNavigationItems.add(
+                    self._create_navigation_item(f'Grandchild {width}-{child_index}-{grandchild_index}')
+                )
+        return NavigationItem.objects.get(id=root.id)
+
+    def _count_serialization_queries(self, root):
+        with CaptureQueriesContext(connection) as context:
+            data = NavigationItemDetailSerializer(root).data
+        return len(context.captured_queries), data
+
+    def test_tree_is_serialized_with_nested_children(self):
+        root = self._create_tree(2)
+        _, data = self._count_serialization_queries(root)
+
+        self.assertEqual(len(data['childrenNavigationItems']), 2, str(data))
+        for child in data['childrenNavigationItems']:
+            self.assertEqual(len(child['childrenNavigationItems']), 2, str(child))
+            self.assertEqual(child['route']['fullUrl'], 'https://tree.com', str(child))
+            self.assertEqual(child['image']['tags'][0]['name'], 'Tree tag', str(child))
+            self.assertEqual(child['pageRenders'][0]['render']['type'], 'home_page', str(child))
+            self.assertEqual(child['navBarRender']['type'], 'nav_bar', str(child))
+            for grandchild in child['childrenNavigationItems']:
+                self.assertEqual(grandchild['childrenNavigationItems'], [], str(grandchild))
+
+    def test_query_count_does_not_grow_with_tree_size(self):
+        small_tree_queries, _ = self._count_serialization_queries(self._create_tree(2))
+        large_tree_queries, data = self._count_serialization_queries(self._create_tree(20))
+
+        self.assertEqual(len(data['childrenNavigationItems']), 20, str(data))
+        self.assertEqual(small_tree_queries, large_tree_queries)
+        self.assertLessEqual(large_tree_queries, 7)
+
+    def test_many_serialization_shares_the_tree_loading(self):
+        self._create_tree(2)
+        self._create_tree(5)
+        roots = NavigationItem.objects.filter(title__startswith='Root')
+
+        with CaptureQueriesContext(connection) as context:
+            data = NavigationItemDetailSerializer(roots, many=True).data
+
+        self.assertEqual(len(data), 2, str(data))
+        self.assertLessEqual(len(context.captured_queries), 8)
+
+
+class NavigationItemOrderValidationQueriesTests(TestCase):
+
+    def setUp(self):
+        # Every item is a root item when created, they all need their own order
+        self.orders = itertools.count()
+
+    def _create_navigation_item(self, title):
+        order = next(self.orders)
+        navigation_item = NavigationItem.objects.create(
+            title=title,
+            navBarRender=Render.objects.create(navBarPosition='left', type='nav_bar', order=order)
+        )
+        page_render = PageRender.objects.create(render=Render.objects.create(
+            navBarPosition='left',
+            type='home_page',
+            order=order
+        ))
+        navigation_item.pageRenders.set([page_render])
+        return navigation_item
+
+    def _create_menu(self, size):
+        """ Parent with `size` children, each child having `size` children of its own """
+        parent = self._create_navigation_item(f'Parent {size}')
+        children = []
+        for child_index in range(size):
+            child = self._create_navigation_item(f'Child {size}-{child_index}')
+            child.childrenNavigationItems.set([
+                self._create_navigation_item(f'Grandchild {size}-{child_index}-{index}')
+                for index in range(size)
+            ])
+            children.append(child)
+        parent.childrenNavigationItems.set(children)
+        return children[0]
+
+    @staticmethod
+    def _count_validation_queries(navigation_item):
+        with CaptureQueriesContext(connection) as context:
+            navigation_item._clean()
+        return len(context.captured_queries)
+
+    def test_query_count_does_not_grow_with_menu_size(self):
+        query_counts = [self._count_validation_queries(self._create_menu(size)) for size in [2, 5, 10]]
+
+        self.assertEqual(len(set(query_counts)), 1, str(query_counts))
+        self.assertLessEqual(query_counts[0], 4)
+
+    def test_order_conflict_detected_in_large_menu(self):
+        navigation_item = self._create_menu(10)
+        brother = navigation_item.parent_navigation_items.get().childrenNavigationItems.order_by('createAt').last()
+        navigation_item.navBarRender.order = brother.navBarRender.order
+
+        with self.assertRaises(ValidationError) as _exception:
+            navigation_item._clean()
+        self.assertEqual(
+            f'(child_items) Several elements use the same order [{brother.navBarRender.order}] for navBarRender',
+            _exception.exception.message_dict['navBarRender'][0]
+        )
@@ -1,8 +1,11 @@
 import uuid
 
+from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
-from BackendTennis.models import Render
+from BackendTennis.models import Render, NavigationItem, PageRender
 from BackendTennis.serializers import RenderSerializer
 
 
@@ -183,3 +186,71 @@ class RenderSerializerTests(TestCase):
         self.render.refresh_from_db()
 
         self.assertEqual(self.render.isButton, True, str(serializer.errors))
+
+
+class RenderUpdateValidationTests(TestCase):
+
+    def setUp(self):
+        self.parent = NavigationItem.objects.create(
+            title='Parent',
+            navBarRender=Render.objects.create(navBarPosition='left', type='nav_bar', order=100)
+        )
+        self.children = [
+            NavigationItem.objects.create(
+                title=f'Child {index}',
+                navBarRender=Render.objects.create(navBarPosition='left', type='nav_bar', order=index)
+            )
+            for index in range(5)
+        ]
+        self.parent.childrenNavigationItems.set(self.children)
+
+    def test_update_without_order_change_skips_validation(self):
+        render = self.children[0].navBarRender
+        serializer = RenderSerializer(instance=render, data={'color': 'red'}, partial=True)
+        self.assertTrue(serializer.is_valid(), str(serializer.errors))
+
+        with CaptureQueriesContext(connection) as context:
+            serializer.save()
+        # The previous values and the UPDATE, no NavigationItem is saved again
+        self.assertEqual(len(context.captured_queries), 2, str(context.captured_queries))
+
+    def test_update_order_checks_brothers_without_writing_them(self):
+        render = self.children[0].navBarRender
+        serializer = RenderSerializer(instance=render, data={'order': 50}, partial=True)
+        self.assertTrue(serializer.is_valid(), str(serializer.errors))
+
+        with CaptureQueriesContext(connection) as context:
+            serializer.save()
+        self.assertEqual(len(context.captured_queries), 4, str(context.captured_queries))
+        self.assertFalse(any(
+            query['sql'].startswith('UPDATE "BackendTennis_navigationitem"') for query in context.captured_queries
+        ))
+
+    def test_update_order_used_by_brother(self):
+        serializer = RenderSerializer(instance=self.children[0].navBarRender, data={'order': 3}, partial=True)
+        self.assertTrue(serializer.is_valid(), str(serializer.errors))
+
+        with self.assertRaises(ValidationError) as _exception:
+            serializer.save()
+        self.assertEqual(
+            '(child_items) Several elements use the same order [3] for navBarRender',
+            _exception.exception.message_dict['navBarRender'][0]
+        )
+
+    def test_update_page_render_order_used_by_brother(self):
+        for index, child in enumerate(self.children[:2]):
+            child.pageRenders.set([
+                PageRender.objects.create(render=Render.objects.create(navBarPosition='left', type='home_page',
+                                                                       order=index))
+            ])
+        render = self.children[0].pageRenders.get().render
+        serializer = RenderSerializer(instance=render, data={'order': 1}, partial=True)
+        self.assertTrue(serializer.is_valid(), str(serializer.errors))
+
+        with self.assertRaises(ValidationError) as _exception:
+            serializer.save()
+        self.assertEqual(
+            '(child_items) Several elements use the same order [1] for pageRenders of type [home_page]'
+            ' for parent [Parent]',
+            _exception.exception.message_dict['pageRenders'][0]
+        )
@@ -6,7 +6,7 @@ from rest_framework.test import APITestCase
 from rest_framework_api_key.models import APIKey
 from rest_framework_simplejwt.tokens import AccessToken
 
-from BackendTennis.models import User, AboutPage
+from BackendTennis.models import User, AboutPage, AboutPageClubValue, ClubValue
 
 
 class AboutPageViewTests(APITestCase):
@@ -122,3 +122,70 @@ class AboutPageViewTests(APITestCase):
                                       HTTP_AUTHORIZATION=f'Bearer {self.superuser_token}')
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(AboutPage.objects.count(), 0)
+
+    def test_get_about_page_detail_with_fields_and_expand(self):
+        """ Test the requested fields only are returned, with the expanded relations as objects """
+        club_value = ClubValue.objects.create(title='Respect', description='Respect', order=1)
+        self.about_page.clubValues.add(club_value)
+
+        response = self.client.get(f'{self.detail_url}?fields=id,clubValues,sponsors', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertEqual(response.json(), {'id': str(self.about_page.id), 'clubValues': [str(club_value.id)],
+                                           'sponsors': []})
+
+        response = self.client.get(f'{self.detail_url}?fields=clubValues&expand=clubValues', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertEqual(response.json()['clubValues'][0]['title'], 'Respect')
+
+    def test_get_about_page_detail_etag_follows_related_rows(self):
+        """ Test the ETag changes with the rendered related rows: their updates, links and deletions """
+        club_value = ClubValue.objects.create(title='Respect', description='Respect', order=1)
+        url = f'{self.detail_url}?fields=clubValues&expand=clubValues'
+        response = self.client.get(url, HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        etag = response.headers['ETag']
+        self.assertNotIn('Last-Modified', response.headers)
+
+        self.about_page.clubValues.add(club_value)
+        response = self.client.get(url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertEqual(response.json()['clubValues'][0]['title'], 'Respect')
+        etag = response.headers['ETag']
+
+        response = self.client.get(url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        club_value.title = 'Fair play'
+        club_value.save()
+        response = self.client.get(url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertEqual(response.json()['clubValues'][0]['title'], 'Fair play')
+        etag = response.headers['ETag']
+
+        club_value.delete()
+        response = self.client.get(url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertEqual(response.json()['clubValues'], [])
+
+    def test_get_about_page_detail_etag_follows_links_without_touching_rows(self):
+        """ Test cleared links and links written on the through table change the ETag, the linked rows are kept """
+        club_value = ClubValue.objects.create(title='Respect', description='Respect', order=1)
+        self.about_page.clubValues.add(club_value)
+        update_at = AboutPage.objects.get(pk=self.about_page.pk).updateAt
+        club_value.refresh_from_db()
+        url = f'{self.detail_url}?fields=clubValues&expand=clubValues'
+        etag = self.client.get(url, HTTP_API_KEY=self.key).headers['ETag']
+
+        self.about_page.clubValues.clear()
+        response = self.client.get(url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertEqual(response.json()['clubValues'], [])
+        etag = response.headers['ETag']
+
+        AboutPageClubValue.objects.create(aboutPage=self.about_page, clubValue=club_value, order=1)
+        response = self.client.get(url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertEqual(response.json()['clubValues'][0]['title'], 'Respect')
+
+        self.assertEqual(AboutPage.objects.get(pk=self.about_page.pk).updateAt, update_at)
+        self.assertEqual(ClubValue.objects.get(pk=club_value.pk).updateAt, club_value.updateAt)
@@ -0,0 +1,64 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_api_key.models import APIKey
+
+from BackendTennis.models import Category
+from BackendTennis.services.api_key_cache_service import verified_api_keys
+
+
+class APIKeyAuthenticationCacheTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Category.objects.create(name="Existing Category", icon="test_icon.jpg")
+        cls.url = '/BackendTennis/category/'
+
+    def setUp(self):
+        verified_api_keys.clear()
+        self.api_key, self.key = APIKey.objects.create_key(name='test-api-key')
+
+    def _count_api_key_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len([query for query in context.captured_queries if APIKey._meta.db_table in query['sql']])
+
+    def test_verified_api_key_is_cached(self):
+        """ Test the API key is only looked up on the first request """
+        self.assertEqual(self._count_api_key_queries(), 1)
+        self.assertEqual(self._count_api_key_queries(), 0)
+
+    def test_invalid_api_key_is_not_cached(self):
+        """ Test a wrong secret for a known prefix is still rejected after a valid request """
+        self.client.get(self.url, HTTP_API_KEY=self.key)
+        response = self.client.get(self.url, HTTP_API_KEY=f'{self.api_key.prefix}.wrongsecret')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(len(verified_api_keys), 1)
+
+    def test_revoked_api_key_is_purged(self):
+        """ Test revoking a cached API key rejects the next request """
+        self.client.get(self.url, HTTP_API_KEY=self.key)
+        self.api_key.revoked = True
+        self.api_key.save()
+        response = self.client.get(self.url, HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_deleted_api_key_is_purged(self):
+        """ Test deleting a cached API key rejects the next request """
+        self.client.get(self.url, HTTP_API_KEY=self.key)
+        self.api_key.delete()
+        response = self.client.get(self.url, HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_expired_entry_is_verified_again(self):
+        """ Test an entry older than the timeout is verified against the database again """
+        timeout = verified_api_keys.timeout
+        verified_api_keys.timeout = 0
+        try:
+            self.assertEqual(self._count_api_key_queries(), 1)
+        finally:
+            verified_api_keys.timeout = timeout
+        self.assertEqual(self._count_api_key_queries(), 1)
+        self.assertEqual(self._count_api_key_queries(), 0)
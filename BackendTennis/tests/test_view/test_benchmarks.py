@@ -0,0 +1,105 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management import call_command, CommandError
+from rest_framework.test import APITestCase
+
+from BackendTennis.benchmarks.runner import compare_with_baseline
+from BackendTennis.management.commands.run_benchmarks import get_benchmark_caches
+from BackendTennis.models import Image
+
+
+def _result(**values):
+    return {
+        'requests': 10,
+        'requests_per_second': 50,
+        'p50_ms': 10,
+        'p95_ms': 20,
+        'p99_ms': 30,
+        'queries_per_request': 4,
+        'max_queries': 4,
+        **values
+    }
+
+
+class BenchmarkTests(APITestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.baseline = os.path.join(self.temp_dir.name, 'baseline.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_compare_within_tolerance(self):
+        baseline = {'peak_rss_mb': 100, 'scenarios': {'image_gallery': _result()}}
+        results = {'peak_rss_mb': 120, 'scenarios': {'image_gallery': _result(p50_ms=12, p99_ms=300)}}
+        self.assertEqual(compare_with_baseline(results, baseline, 0.25), [])
+
+    def test_compare_reports_regressions(self):
+        baseline = {'peak_rss_mb': 100, 'scenarios': {'image_gallery': _result()}}
+        results = {'peak_rss_mb': 130, 'scenarios': {
+            'image_gallery': _result(p95_ms=30, max_queries=5),
+            'admin_reorder': _result(p50_ms=1000),
+        }}
+        regressions = compare_with_baseline(results, baseline, 0.25)
+        self.assertEqual(len(regressions), 3)
+        self.assertTrue(regressions[0].startswith('peak_rss_mb'))
+        self.assertTrue(regressions[1].startswith('image_gallery: p95_ms'))
+        self.assertTrue(regressions[2].startswith('image_gallery: max_queries'))
+
+    def test_command_saves_and_compares_baseline(self):
+        image_count = Image.objects.count()
+        options = {'scale': 0.01, 'iterations': 1, 'warmup': 0, 'baseline': self.baseline, 'stdout': StringIO()}
+        call_command('run_benchmarks', save_baseline=True, **options)
+        with open(self.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        self.assertEqual(
+            set(baseline['scenarios']),
+            {'public_homepage', 'image_gallery', 'training_calendar', 'bulk_upload', 'admin_reorder'}
+        )
+        # The generated data is rolled back
+        self.assertEqual(Image.objects.count(), image_count)
+        self.assertIsInstance(baseline['peak_rss_mb'], float)
+
+        # Latencies are too noisy on a single iteration, only the query counts are compared
+        stdout = StringIO()
+        call_command('run_benchmarks', tolerance=1000, **{**options, 'stdout': stdout})
+        self.assertIn('No regression over the baseline', stdout.getvalue())
+
+    def test_command_fails_on_query_regression(self):
+        options = {'scenario': ['training_calendar'], 'warmup': 0, 'baseline': self.baseline, 'stdout': StringIO()}
+        call_command('run_benchmarks', scale=0.01, iterations=1, save_baseline=True, **options)
+        with open(self.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        baseline['scenarios']['training_calendar']['max_queries'] -= 1
+        with open(self.baseline, 'w') as baseline_file:
+            json.dump(baseline, baseline_file)
+
+        with self.assertRaisesMessage(CommandError, 'regression(s) over the baseline'):
+            call_command('run_benchmarks', scale=0.01, iterations=1, tolerance=1000, stderr=StringIO(), **options)
+
+    def test_command_refuses_other_settings_than_baseline(self):
+        options = {'scenario': ['public_homepage'], 'warmup': 0, 'baseline': self.baseline, 'stdout': StringIO()}
+        call_command('run_benchmarks', scale=0.01, iterations=1, save_baseline=True, **options)
+        with self.assertRaisesMessage(CommandError, 'The baseline was run with scale 0.01 and 1 iterations'):
+            call_command('run_benchmarks', scale=0.01, iterations=2, **options)
+
+    def test_benchmark_caches_are_process_local(self):
+        """ Test every cache alias is replaced by an own LocMemCache, the configured caches are left untouched """
+        benchmark_caches = get_benchmark_caches()
+        self.assertEqual(set(benchmark_caches), set(settings.CACHES))
+        for alias, config in benchmark_caches.items():
+            self.assertEqual(config['BACKEND'], 'django.core.cache.backends.locmem.LocMemCache')
+            self.assertNotEqual(config['LOCATION'], settings.CACHES[alias].get('LOCATION'))
+        self.assertNotEqual(benchmark_caches['default']['LOCATION'], get_benchmark_caches()['default']['LOCATION'])
+
+        caches['default'].set('benchmark-sentinel', 'kept')
+        call_command('run_benchmarks', scenario=['public_homepage'], scale=0.01, iterations=1, warmup=0,
+                     save_baseline=True, baseline=self.baseline, stdout=StringIO())
+        self.assertEqual(caches['default'].get('benchmark-sentinel'), 'kept')
+        caches['default'].delete('benchmark-sentinel')
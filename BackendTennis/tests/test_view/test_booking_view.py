@@ -1,11 +1,18 @@
+import json
 from datetime import date
+from unittest.mock import patch
 
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APITestCase, APIRequestFactory
 from rest_framework_api_key.models import APIKey
 from rest_framework_simplejwt.tokens import AccessToken
 
 from BackendTennis.models import User, Booking
+from BackendTennis.pagination import BookingPagination
+from BackendTennis.serializers.BookingSerializer import BookingSerializer
+from BackendTennis.views import BookingListCreateView
 
 
 class BookingViewTests(APITestCase):
@@ -57,6 +64,96 @@ class BookingViewTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['data']), 1)
 
+    def test_get_booking_list_with_cursor(self):
+        for index in range(4):
+            Booking.objects.create(
+                clientFirstName=f'Client {index}',
+                clientLastName='Doe',
+                clientEmail='client@example.com',
+                clientPhoneNumber='123456789',
+                start=date(2024, 2, 1),
+                end=date(2024, 2, 2)
+            )
+
+        response = self.client.get(f'{self.url}?cursor=&page_size=2', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 5)
+        self.assertIsNone(response.data['links']['previous'])
+        first_ids = [booking['id'] for booking in response.data['data']]
+        self.assertEqual(len(first_ids), 2)
+
+        seen_ids = list(first_ids)
+        next_link = response.data['links']['next']
+        while next_link:
+            response = self.client.get(next_link, HTTP_API_KEY=self.key)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertIsNotNone(response.data['links']['previous'])
+            seen_ids += [booking['id'] for booking in response.data['data']]
+            next_link = response.data['links']['next']
+
+        expected_ids = list(Booking.objects.order_by('createAt', 'id').values_list('id', flat=True))
+        self.assertEqual([str(booking_id) for booking_id in seen_ids], [str(booking_id) for booking_id in expected_ids])
+
+    def _create_bookings(self, count):
+        for index in range(count):
+            Booking.objects.create(
+                clientFirstName=f'Client {index}',
+                clientLastName='Doe',
+                clientEmail='client@example.com',
+                clientPhoneNumber='123456789',
+                start=date(2024, 2, 1),
+                end=date(2024, 2, 2)
+            )
+
+    def test_get_booking_list_stream_json(self):
+        self._create_bookings(4)
+        with patch.object(BookingListCreateView, 'stream_chunk_size', 2):
+            response = self.client.get(f'{self.url}?stream=json', HTTP_API_KEY=self.key,
+                                       HTTP_AUTHORIZATION=f'Bearer {self.superuser_token}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+        bookings = json.loads(b''.join(response.streaming_content))
+        expected_bookings = BookingSerializer(Booking.objects.order_by('createAt'), many=True).data
+        self.assertEqual(bookings, json.loads(JSONRenderer().render(expected_bookings)))
+
+    def test_get_booking_list_stream_ndjson(self):
+        self._create_bookings(2)
+        response = self.client.get(f'{self.url}?stream=ndjson', HTTP_API_KEY=self.key,
+                                   HTTP_AUTHORIZATION=f'Bearer {self.superuser_token}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(json.loads(lines[0])['id'], str(self.booking.id))
+
+    def test_get_booking_list_stream_empty_and_invalid(self):
+        Booking.objects.all().delete()
+        response = self.client.get(f'{self.url}?stream=json', HTTP_API_KEY=self.key,
+                                   HTTP_AUTHORIZATION=f'Bearer {self.superuser_token}')
+        self.assertEqual(b''.join(response.streaming_content), b'[]')
+
+        response = self.client.get(f'{self.url}?stream=csv', HTTP_API_KEY=self.key,
+                                   HTTP_AUTHORIZATION=f'Bearer {self.superuser_token}')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(f'{self.url}?stream=json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_get_booking_list_stream_requires_staff(self):
+        response = self.client.get(f'{self.url}?stream=json', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(f'{self.url}?stream=json', HTTP_API_KEY=self.key,
+                                   HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_get_booking_list_max_page_size(self):
+        request = Request(APIRequestFactory().get(self.url, {'page_size': 100000}))
+        self.assertEqual(BookingPagination().get_page_size(request), BookingPagination.max_page_size)
+
     def test_create_booking_permission(self):
         data = {
             'clientFirstName': 'Alice',
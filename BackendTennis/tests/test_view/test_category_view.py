@@ -161,3 +161,46 @@ class CategoryViewTests(APITestCase):
             HTTP_API_KEY=self.key
         )
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_get_category_list_not_modified(self):
+        """ Test fetching category list with a matching If-None-Match (should return 304 without body) """
+        response = self.client.get(self.url, HTTP_API_KEY=self.key)
+        etag = response['ETag']
+        response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_get_category_list_modified_after_create_and_delete(self):
+        """ Test the category list ETag changes when a category is created or deleted """
+        etag = self.client.get(self.url, HTTP_API_KEY=self.key)['ETag']
+        category = Category.objects.create(name="Another Category", icon="another_icon.jpg")
+        response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        etag = response['ETag']
+        category.delete()
+        response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_get_category_detail_not_modified(self):
+        """ Test fetching a category with If-None-Match / If-Modified-Since (should return 304 until updated) """
+        response = self.client.get(self.detail_url, HTTP_API_KEY=self.key)
+        etag, last_modified = response['ETag'], response['Last-Modified']
+
+        response = self.client.get(self.detail_url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        response = self.client.get(self.detail_url, HTTP_API_KEY=self.key, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.category.name = 'Renamed Category'
+        self.category.save()
+        response = self.client.get(self.detail_url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['name'], 'Renamed Category')
+
+    def test_get_category_detail_not_modified_no_authentication(self):
+        """ Test permissions are checked before answering 304 (should be forbidden) """
+        etag = self.client.get(self.detail_url, HTTP_API_KEY=self.key)['ETag']
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -1,6 +1,7 @@
 from datetime import date
 
 from django.contrib.auth.models import Permission
+from django.test import override_settings
 from rest_framework import status
 from rest_framework.test import APITestCase
 from rest_framework_api_key.models import APIKey
@@ -8,6 +9,10 @@ from rest_framework_simplejwt.tokens import AccessToken
 
 from BackendTennis.models import User, HomePage
 
+CACHED_PAYLOAD_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'payload': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-home-page'},
+}
 
 class HomePageViewTests(APITestCase):
 
@@ -139,3 +144,25 @@ class HomePageViewTests(APITestCase):
                                       HTTP_AUTHORIZATION=f'Bearer {self.superuser_token}')
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT, str(response.data))
         self.assertEqual(HomePage.objects.count(), 0, str(response.data))
+
+    @override_settings(CACHES=CACHED_PAYLOAD_CACHES)
+    def test_get_home_page_list_is_served_from_payload_cache(self):
+        """ Test the home_page list is cached with an ETag and rebuilt after a change """
+        response = self.client.get(self.url, HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        etag = response.headers['ETag']
+
+        response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # Queryset updates do not send signals, the cached payload is kept
+        HomePage.objects.filter(id=self.home_page.id).update(title='Not signaled title')
+        response = self.client.get(self.url, HTTP_API_KEY=self.key)
+        self.assertEqual(response.data[0]['title'], 'New Test HomePage', str(response.data))
+
+        self.home_page.title = 'Updated title'
+        self.home_page.save()
+        response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(response.data[0]['title'], 'Updated title', str(response.data))
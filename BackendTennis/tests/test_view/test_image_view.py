@@ -6,13 +6,16 @@ from pathlib import Path
 from PIL import Image as PilImage
 from django.contrib.auth.models import Permission
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 from rest_framework_api_key.models import APIKey
 from rest_framework_simplejwt.tokens import AccessToken
 
 from BackendTennis.constant import Constant
-from BackendTennis.models import User, Image
+from BackendTennis.models import User, Image, Tag
 
 
 class ImageViewTests(APITestCase):
@@ -97,6 +100,83 @@ class ImageViewTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 1)
 
+    def test_get_image_list_with_cursor_estimated_count(self):
+        Image.objects.create(type=Constant.IMAGE_TYPE.NEWS, imageUrl='news_image.jpg')
+        response = self.client.get(f'{self.url}?cursor=&type={Constant.IMAGE_TYPE.NEWS}', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']), 1)
+        self.assertEqual(response.data['data'][0]['type'], Constant.IMAGE_TYPE.NEWS)
+        self.assertIsInstance(response.data['count'], int)
+        self.assertIsNone(response.data['links']['next'])
+
+    def test_get_image_list_with_cursor_estimated_count_whole_table(self):
+        response = self.client.get(f'{self.url}?cursor=', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']), Image.objects.count())
+        self.assertIsInstance(response.data['count'], int)
+
+    def test_get_image_list_stream_requires_staff(self):
+        """ Test the streamed list is refused to the API key alone and to non staff users """
+        response = self.client.get(f'{self.url}?stream=json', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.get(f'{self.url}?stream=ndjson', HTTP_API_KEY=self.key,
+                                   HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(f'{self.url}?stream=ndjson', HTTP_API_KEY=self.key,
+                                   HTTP_AUTHORIZATION=f'Bearer {self.superuser_token}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), Image.objects.count())
+
+    def test_get_image_list_filtered_by_tags(self):
+        tag_a = Tag.objects.create(name='tag_a')
+        tag_b = Tag.objects.create(name='tag_b')
+        image_a = Image.objects.create(type=Constant.IMAGE_TYPE.NEWS, imageUrl='a.jpg')
+        image_a.tags.set([tag_a])
+        image_ab = Image.objects.create(type=Constant.IMAGE_TYPE.NEWS, imageUrl='ab.jpg')
+        image_ab.tags.set([tag_a, tag_b])
+
+        response = self.client.get(f'{self.url}?tags=tag_a,tag_b', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([image['id'] for image in response.data['data']], [str(image_ab.id)])
+
+        response = self.client.get(f'{self.url}?tags=tag_a,tag_b&tags_mode=any', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([image['id'] for image in response.data['data']], [str(image_a.id), str(image_ab.id)])
+
+    def test_get_image_list_filtered_by_unknown_tag(self):
+        tag_a = Tag.objects.create(name='tag_a')
+        Image.objects.create(type=Constant.IMAGE_TYPE.NEWS, imageUrl='a.jpg').tags.set([tag_a])
+
+        response = self.client.get(f'{self.url}?tags=tag_a,unknown', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data'], [])
+
+        response = self.client.get(f'{self.url}?tags=tag_a,unknown&tags_mode=any', HTTP_API_KEY=self.key)
+        self.assertEqual(len(response.data['data']), 1)
+
+        response = self.client.get(f'{self.url}?tags=tag_a&tags_mode=bad', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'payload': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-image-tags'},
+    })
+    def test_get_image_list_filtered_by_renamed_tag(self):
+        """ Test a tag renamed without signal, as by another worker, is seen at once with a local memory cache """
+        tag = Tag.objects.create(name='before')
+        image = Image.objects.create(type=Constant.IMAGE_TYPE.NEWS, imageUrl='a.jpg')
+        image.tags.set([tag])
+        response = self.client.get(f'{self.url}?tags=before', HTTP_API_KEY=self.key)
+        self.assertEqual([image['id'] for image in response.data['data']], [str(image.id)])
+
+        Tag.objects.filter(pk=tag.pk).update(name='after')
+        response = self.client.get(f'{self.url}?tags=after', HTTP_API_KEY=self.key)
+        self.assertEqual([image['id'] for image in response.data['data']], [str(image.id)])
+        response = self.client.get(f'{self.url}?tags=before', HTTP_API_KEY=self.key)
+        self.assertEqual(response.data['data'], [])
+
     def test_create_image_no_permission(self):
         image_file = self.create_test_image_file('test')
         data = {
@@ -370,6 +450,42 @@ class ImageViewTests(APITestCase):
             str(response.data)
         )
 
+    def test_create_images_with_tags_and_invalid_file(self):
+        tag = Tag.objects.create(name='Gallery')
+        image_file = self.create_test_image_file('valid')
+        invalid_file = SimpleUploadedFile('invalid.jpg', b'not an image', content_type='image/jpeg')
+
+        images_data = [
+            {'index': 0, 'title': 'valid', 'type': Constant.IMAGE_TYPE.SPONSOR, 'tags': [str(tag.id)]},
+            {'index': 1, 'title': 'invalid', 'type': Constant.IMAGE_TYPE.SPONSOR}
+        ]
+
+        permission = Permission.objects.get(codename='add_image')
+        self.user.user_permissions.add(permission)
+        response = self.client.post(
+            self.create_images_url,
+            data={
+                'images_data': json.dumps(images_data),
+                'image_0': image_file,
+                'image_1': invalid_file
+            },
+            HTTP_AUTHORIZATION=f'Bearer {self.token}',
+            HTTP_API_KEY=self.key,
+            format='multipart'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS, str(response.data))
+        self.assert_image_creation_response_key(response)
+        self.assertEqual(len(response.data['created_images']), 1)
+        self.assertEqual(response.data['created_images'][0]['tags'], [tag.id])
+        self.assertEqual([image['title'] for image in response.data['error_images']], ['invalid'])
+        self.assertIn('invalid_image', response.data['error'])
+
+        created_image = Image.objects.get(id=response.data['created_images'][0]['id'])
+        self.assertEqual(list(created_image.tags.all()), [tag])
+        self.assertTrue(Path(created_image.imageUrl.path).exists())
+        self.assertFalse(Image.objects.filter(title='invalid').exists())
+
     def test_superuser_can_create_image(self):
         image_file = self.create_test_image_file('test')
         data = {
@@ -423,6 +539,15 @@ class ImageViewTests(APITestCase):
                                       HTTP_API_KEY=self.key)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
 
+    def test_delete_image_without_file_keeps_images_directory(self):
+        image = Image.objects.create(type=Constant.IMAGE_TYPE.SPONSOR)
+        images_directory = Path(Path(__file__).parent.parent.parent.parent.resolve(), 'images')
+        images_directory_existed = images_directory.is_dir()
+        response = self.client.delete(f'{self.url}{image.id}/', HTTP_AUTHORIZATION=f'Bearer {self.superuser_token}',
+                                      HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(images_directory.is_dir(), images_directory_existed)
+
     def test_delete_multiple_images_with_permission(self):
         image1 = self.create_image_object()
         image2 = self.create_image_object()
@@ -503,3 +628,37 @@ class ImageViewTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('imageUrlLink', response.data)
         self.assertTrue(response.data['imageUrlLink'].endswith('.jpg'))
+
+    def test_get_image_list_with_fields(self):
+        """ Test only the requested fields are returned, tags as objects by default """
+        self.image.tags.add(Tag.objects.create(name='fields'))
+        response = self.client.get(f'{self.url}?fields=id,title,tags,unknown', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertEqual(set(response.data['data'][0]), {'id', 'title', 'tags'})
+        self.assertEqual(response.data['data'][0]['tags'][0]['name'], 'fields')
+
+        response = self.client.get(f'{self.url}?fields=id,tags&expand=', HTTP_API_KEY=self.key)
+        self.assertEqual(response.data['data'][0]['tags'], list(self.image.tags.values_list('id', flat=True)))
+
+    def test_get_image_list_with_fields_does_not_query_tags(self):
+        """ Test the tags are not fetched when they are not returned """
+        self.image.tags.add(Tag.objects.create(name='fields'))
+        with CaptureQueriesContext(connection) as full_context:
+            self.client.get(self.url, HTTP_API_KEY=self.key)
+        with CaptureQueriesContext(connection) as fields_context:
+            response = self.client.get(f'{self.url}?fields=id,title', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        # Neither the prefetch nor the conditional GET state of the related tables
+        self.assertEqual(len(fields_context.captured_queries), len(full_context.captured_queries) - 2)
+
+    def test_get_image_detail_with_expand(self):
+        """ Test the detail is returned by the detail serializer when fields or expand is given """
+        self.image.tags.add(Tag.objects.create(name='expand'))
+        response = self.client.get(f'{self.detail_url}?expand=tags', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertEqual(response.data['tags'][0]['name'], 'expand')
+        self.assertIn('derivatives', response.data)
+
+        response = self.client.get(f'{self.detail_url}?fields=id,tags', HTTP_API_KEY=self.key)
+        self.assertEqual(set(response.data), {'id', 'tags'})
+        self.assertEqual(response.data['tags'], list(self.image.tags.values_list('id', flat=True)))
@@ -0,0 +1,105 @@
+import os
+import subprocess
+import sys
+import tempfile
+from unittest.mock import patch
+
+from django.conf import settings
+from django.test import override_settings
+from prometheus_client import REGISTRY
+from prometheus_client.parser import text_string_to_metric_families
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_api_key.models import APIKey
+
+from BackendTennis.services.metrics_service import render_metrics, MULTIPROCESS_DIR_ENV
+
+
+class MetricsViewTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.api_key, cls.key = APIKey.objects.create_key(name='test-api-key')
+        cls.url = '/metrics'
+        cls.tag_url = '/BackendTennis/tag/'
+
+    @staticmethod
+    def _get_sample(name, labels):
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    def test_request_metrics(self):
+        """ Test the requests of the BackendTennis views are counted and measured """
+        labels = {'view': 'BackendTennis:tag-list-create', 'method': 'GET'}
+        requests_before = self._get_sample('backendtennis_requests_total', {**labels, 'status': '200'})
+        duration_count_before = self._get_sample('backendtennis_request_duration_seconds_count', labels)
+        queries_count_before = self._get_sample('backendtennis_db_queries_count', labels)
+
+        self.client.get(self.tag_url, HTTP_API_KEY=self.key)
+        self.client.get(self.tag_url, HTTP_API_KEY=self.key)
+
+        self.assertEqual(self._get_sample('backendtennis_requests_total', {**labels, 'status': '200'}),
+                         requests_before + 2)
+        self.assertEqual(self._get_sample('backendtennis_request_duration_seconds_count', labels),
+                         duration_count_before + 2)
+        self.assertEqual(self._get_sample('backendtennis_db_queries_count', labels), queries_count_before + 2)
+        self.assertGreater(self._get_sample('backendtennis_response_size_bytes_sum', labels), 0)
+
+    def test_api_key_cache_metrics(self):
+        """ Test the API key cache lookups are counted by result """
+        hits_before = self._get_sample('backendtennis_api_key_cache_lookups_total', {'result': 'hit'})
+        self.client.get(self.tag_url, HTTP_API_KEY=self.key)
+        self.client.get(self.tag_url, HTTP_API_KEY=self.key)
+        self.assertGreaterEqual(
+            self._get_sample('backendtennis_api_key_cache_lookups_total', {'result': 'hit'}),
+            hits_before + 1
+        )
+
+    @override_settings(METRICS={'ENABLED': True, 'TOKEN': None, 'PUBLIC': True})
+    def test_get_metrics(self):
+        """ Test the metrics are served in the Prometheus text format """
+        self.client.get(self.tag_url, HTTP_API_KEY=self.key)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        families = {family.name for family in text_string_to_metric_families(response.content.decode())}
+        self.assertTrue({
+            'backendtennis_requests', 'backendtennis_request_duration_seconds', 'backendtennis_response_size_bytes',
+            'backendtennis_db_queries', 'backendtennis_api_key_cache_lookups', 'backendtennis_image_uploads',
+            'backendtennis_image_upload_bytes'
+        }.issubset(families))
+
+    @override_settings(METRICS={'ENABLED': True, 'TOKEN': 'metrics-token'})
+    def test_get_metrics_with_token(self):
+        """ Test the token is required when one is configured """
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.get(self.url, HTTP_AUTHORIZATION='Bearer metrics-token')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(METRICS={'ENABLED': True, 'TOKEN': None})
+    def test_get_metrics_without_token(self):
+        """ Test the metrics are not public without a token, unless with DEBUG or an explicit opt-out """
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN)
+        with override_settings(DEBUG=True):
+            self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+        with override_settings(METRICS={'ENABLED': True, 'TOKEN': None, 'PUBLIC': True}):
+            self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+    @override_settings(METRICS={'ENABLED': False})
+    def test_get_metrics_disabled(self):
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_metrics_of_every_worker_are_summed(self):
+        """ Test the values written by several processes to the shared directory are aggregated """
+        increment = (
+            'from BackendTennis.services.metrics_service import REQUESTS; '
+            'REQUESTS.labels("BackendTennis:test", "GET", "200").inc()'
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            env = {**os.environ, MULTIPROCESS_DIR_ENV: directory}
+            for _ in range(2):
+                subprocess.run([sys.executable, '-c', increment], cwd=settings.BASE_DIR, env=env, check=True)
+            with patch.dict(os.environ, {MULTIPROCESS_DIR_ENV: directory}):
+                content = render_metrics().decode()
+
+        self.assertIn('backendtennis_requests_total{method="GET",status="200",view="BackendTennis:test"} 2.0',
+                      content)
@@ -1,6 +1,9 @@
 from datetime import date
 
 from django.contrib.auth.models import Permission
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 from rest_framework_api_key.models import APIKey
@@ -9,6 +12,10 @@ from rest_framework_simplejwt.tokens import AccessToken
 from BackendTennis.constant import Constant
 from BackendTennis.models import NavigationBar, User, Image
 
+CACHED_PAYLOAD_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'payload': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-navigation-bar'},
+}
 
 class NavigationBarViewTests(APITestCase):
 
@@ -124,3 +131,35 @@ class NavigationBarViewTests(APITestCase):
                                       HTTP_AUTHORIZATION=f'Bearer {self.superuser_token}')
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT, str(response.data))
         self.assertEqual(NavigationBar.objects.count(), 0, str(response.data))
+
+    @override_settings(CACHES=CACHED_PAYLOAD_CACHES)
+    def test_get_navigation_bar_list_is_served_from_payload_cache(self):
+        """ Test the navigation_bar list is cached with an ETag and rebuilt after a change """
+        response = self.client.get(self.url, HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        etag = response.headers['ETag']
+
+        with CaptureQueriesContext(connection) as context:
+            cached_response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached_response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertFalse(
+            [query for query in context.captured_queries if 'navigationbar' in query['sql']],
+            str(context.captured_queries)
+        )
+
+        NavigationBar.objects.create(logo=self.image_2)
+        response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(len(response.data), 2, str(response.data))
+
+    @override_settings(CACHES=CACHED_PAYLOAD_CACHES)
+    def test_get_navigation_bar_detail_is_invalidated_by_related_model(self):
+        """ Test the navigation_bar detail payload is rebuilt when a related model is deleted """
+        response = self.client.get(self.detail_url, HTTP_API_KEY=self.key)
+        self.assertEqual(response.data['logo'], self.image.id, str(response.data))
+
+        self.image.delete()
+        response = self.client.get(self.detail_url, HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertIsNone(response.data['logo'], str(response.data))
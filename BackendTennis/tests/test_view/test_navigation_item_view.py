@@ -1,12 +1,15 @@
+import json
 from datetime import date
 
 from django.contrib.auth.models import Permission
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 from rest_framework_api_key.models import APIKey
 from rest_framework_simplejwt.tokens import AccessToken
 
-from BackendTennis.models import User, NavigationItem
+from BackendTennis.models import User, NavigationItem, Render
 
 
 class NavigationItemViewTests(APITestCase):
@@ -180,3 +183,231 @@ class NavigationItemViewTests(APITestCase):
         navigation_item_2.refresh_from_db()
         self.assertEqual('Updated Item 1', self.navigation_item.title, str(response.data))
         self.assertEqual('Updated Item 2', navigation_item_2.title, str(response.data))
+
+    def _reorder(self, updates):
+        return self.client.patch(self.update_multi_url,
+                                 data={'updates': updates},
+                                 format='json',
+                                 HTTP_API_KEY=self.key,
+                                 HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+    def _add_change_permission(self):
+        permission = Permission.objects.get(codename='change_navigationitem')
+        self.user.user_permissions.add(permission)
+
+    def _create_menu(self, size):
+        parent = NavigationItem.objects.create(
+            title='Parent',
+            navBarRender=Render.objects.create(navBarPosition='left', type='nav_bar', order=1000)
+        )
+        children = [
+            NavigationItem.objects.create(
+                title=f'Child {index}',
+                navBarRender=Render.objects.create(navBarPosition='left', type='nav_bar', order=2000 + index)
+            )
+            for index in range(size)
+        ]
+        parent.childrenNavigationItems.set(children)
+        return parent, children
+
+    def test_multiple_update_navigation_item_reorder(self):
+        """ Test swapping the orders of children and moving one of them to the root, in a single request """
+        self._add_change_permission()
+        parent, children = self._create_menu(3)
+        response = self._reorder([
+            {'id': str(children[0].id), 'order': 2001},
+            {'id': str(children[1].id), 'order': 2000, 'enabled': False},
+            {'id': str(children[2].id), 'parent': None},
+        ])
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+
+        for child in children:
+            child.refresh_from_db()
+        self.assertEqual(children[0].navBarRender.order, 2001)
+        self.assertEqual(children[1].navBarRender.order, 2000)
+        self.assertFalse(children[1].enabled)
+        self.assertEqual(list(parent.childrenNavigationItems.order_by('title')), children[:2])
+        self.assertFalse(children[2].parent_navigation_items.exists())
+
+    def test_multiple_update_navigation_item_reorder_changes_parents(self):
+        """ Test the old and new parents of a moved item are updated, a conditional GET of them is not a 304 """
+        self._add_change_permission()
+        parent, children = self._create_menu(2)
+        other_parent = NavigationItem.objects.create(title='Other parent')
+        parent_url = f'{self.url}{parent.id}/'
+        other_parent_url = f'{self.url}{other_parent.id}/'
+        parent_etag = self.client.get(parent_url, HTTP_API_KEY=self.key)['ETag']
+        other_parent_etag = self.client.get(other_parent_url, HTTP_API_KEY=self.key)['ETag']
+        update_at = parent.updateAt
+
+        response = self._reorder([{'id': str(children[0].id), 'parent': str(other_parent.id)}])
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+
+        parent.refresh_from_db()
+        other_parent.refresh_from_db()
+        self.assertGreater(parent.updateAt, update_at)
+        self.assertEqual(parent.updateAt, other_parent.updateAt)
+        response = self.client.get(parent_url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=parent_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['childrenNavigationItems'], [children[1].id])
+        response = self.client.get(other_parent_url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=other_parent_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['childrenNavigationItems'], [children[0].id])
+
+    def test_multiple_update_navigation_item_reorder_order_conflict(self):
+        """ Test the final tree is validated and nothing is written on a conflict """
+        self._add_change_permission()
+        parent, children = self._create_menu(3)
+        response = self._reorder([
+            {'id': str(children[0].id), 'order': 2005},
+            {'id': str(children[1].id), 'order': 2005},
+        ])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, str(response.data))
+        self.assertIn('(child_items) Several elements use the same order [2005] for navBarRender',
+                      response.data['message'])
+        children[0].navBarRender.refresh_from_db()
+        self.assertEqual(children[0].navBarRender.order, 2000)
+
+    def test_multiple_update_navigation_item_reorder_cycle(self):
+        """ Test an item can not be moved under its own child """
+        self._add_change_permission()
+        parent, children = self._create_menu(1)
+        response = self._reorder([{'id': str(parent.id), 'parent': str(children[0].id)}])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, str(response.data))
+        self.assertFalse(parent.parent_navigation_items.exists())
+
+    def test_multiple_update_navigation_item_reorder_shared_render(self):
+        """ Test the new order of a shared navBarRender is validated for every item using it """
+        self._add_change_permission()
+        parent, children = self._create_menu(2)
+        other_parent = NavigationItem.objects.create(title='Other parent')
+        shared_item = NavigationItem.objects.create(title='Shared', navBarRender=children[0].navBarRender)
+        other_child = NavigationItem.objects.create(
+            title='Other child',
+            navBarRender=Render.objects.create(navBarPosition='left', type='nav_bar', order=2010)
+        )
+        other_parent.childrenNavigationItems.set([shared_item, other_child])
+
+        response = self._reorder([{'id': str(children[0].id), 'order': 2010}])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, str(response.data))
+        self.assertIn('(child_items) Several elements use the same order [2010] for navBarRender',
+                      response.data['message'])
+
+        response = self._reorder([
+            {'id': str(children[0].id), 'order': 2011},
+            {'id': str(shared_item.id), 'order': 2012},
+        ])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, str(response.data))
+        children[0].navBarRender.refresh_from_db()
+        self.assertEqual(children[0].navBarRender.order, 2000)
+
+        response = self._reorder([
+            {'id': str(children[0].id), 'order': 2011},
+            {'id': str(shared_item.id), 'order': 2011},
+        ])
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        shared_item.navBarRender.refresh_from_db()
+        self.assertEqual(shared_item.navBarRender.order, 2011)
+
+    def test_multiple_update_navigation_item_reorder_invalid_values(self):
+        """ Test a non boolean enabled or a non integer order is rejected """
+        self._add_change_permission()
+        parent, children = self._create_menu(1)
+        for update in [{'enabled': 'false'}, {'enabled': 0}, {'order': 'first'}, {'order': 1.5}, {'order': None},
+                       {'order': True}]:
+            response = self._reorder([{'id': str(children[0].id), **update}])
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, str(update))
+        children[0].refresh_from_db()
+        self.assertTrue(children[0].enabled)
+        self.assertEqual(children[0].navBarRender.order, 2000)
+
+    def test_multiple_update_navigation_item_reorder_query_count(self):
+        """ Test the reorder does not run queries per item """
+        self._add_change_permission()
+        query_counts = []
+        for size in [3, 30]:
+            parent, children = self._create_menu(size)
+            updates = [
+                {'id': str(child.id), 'order': 3000 + size + index, 'parent': str(parent.id)}
+                for index, child in enumerate(children)
+            ]
+            with CaptureQueriesContext(connection) as context:
+                response = self._reorder(updates)
+            self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+            query_counts.append(len(context.captured_queries))
+            parent.delete()
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_get_navigation_item_detail_with_fields_skips_tree(self):
+        """ Test the children tree is not loaded when the children are not requested """
+        parent, children = self._create_menu(3)
+        detail_url = f'{self.url}{parent.id}/'
+
+        with CaptureQueriesContext(connection) as tree_context:
+            response = self.client.get(f'{detail_url}?fields=id,childrenNavigationItems', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertEqual(len(response.data['childrenNavigationItems']), 3)
+
+        with CaptureQueriesContext(connection) as fields_context:
+            response = self.client.get(f'{detail_url}?fields=id,title', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertEqual(response.json(), {'id': str(parent.id), 'title': 'Parent'})
+        self.assertLess(len(fields_context.captured_queries), len(tree_context.captured_queries))
+
+    def test_get_navigation_item_detail_etag_follows_parents(self):
+        """ Test a change of a rendered parent is a change of the child detail """
+        parent, children = self._create_menu(1)
+        detail_url = f'{self.url}{children[0].id}/'
+        etag = self.client.get(detail_url, HTTP_API_KEY=self.key)['ETag']
+        response = self.client.get(detail_url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        parent.title = 'Renamed parent'
+        parent.save()
+        response = self.client.get(detail_url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['parent_navigation_items'][0]['title'], 'Renamed parent')
+
+    def test_get_navigation_item_detail_etag_follows_expanded_children(self):
+        """ Test a change of an expanded child, or of the links, is a change of the parent detail """
+        parent, children = self._create_menu(2)
+        detail_url = f'{self.url}{parent.id}/?fields=id,childrenNavigationItems&expand=childrenNavigationItems'
+        etag = self.client.get(detail_url, HTTP_API_KEY=self.key)['ETag']
+
+        children[0].enabled = False
+        children[0].save()
+        response = self.client.get(detail_url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(False, [child['enabled'] for child in response.json()['childrenNavigationItems']])
+        etag = response['ETag']
+
+        # A link replaced by another one keeps the count of the through table
+        other_item = NavigationItem.objects.create(title='Other')
+        parent.childrenNavigationItems.set([children[0], other_item])
+        response = self.client.get(detail_url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual({child['id'] for child in response.json()['childrenNavigationItems']},
+                         {str(children[0].id), str(other_item.id)})
+
+    def test_get_navigation_item_list_with_expand(self):
+        """ Test only the expanded relations are returned as objects """
+        parent, children = self._create_menu(1)
+        response = self.client.get(f'{self.url}?expand=navBarRender', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        items = {item['id']: item for item in response.json()}
+        self.assertEqual(items[str(parent.id)]['navBarRender']['order'], 1000)
+        self.assertEqual(items[str(parent.id)]['pageRenders'], [])
+        self.assertIsNone(items[str(parent.id)]['route'])
+        self.assertEqual(items[str(parent.id)]['childrenNavigationItems'][0]['id'], str(children[0].id))
+
+    def test_get_navigation_item_list_stream_json(self):
+        """ Test the streamed list has the same items as the list """
+        self._create_menu(3)
+        response = self.client.get(self.url, HTTP_API_KEY=self.key)
+        stream_response = self.client.get(f'{self.url}?stream=json', HTTP_API_KEY=self.key,
+                                          HTTP_AUTHORIZATION=f'Bearer {self.superuser_token}')
+        self.assertEqual(stream_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            sorted(json.loads(b''.join(stream_response.streaming_content)), key=lambda item: item['id']),
+            sorted(response.json(), key=lambda item: item['id'])
+        )
@@ -0,0 +1,74 @@
+import uuid
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from io import BytesIO
+
+from django.test import SimpleTestCase, override_settings
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+from BackendTennis.parsers import ORJSONParser
+from BackendTennis.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+
+    def setUp(self):
+        self.data = {
+            'id': uuid.uuid4(),
+            'title': 'Tournoi d\'été\u2028\u2029',
+            'createAt': datetime(2024, 5, 1, 10, 30, 15, 123456, tzinfo=dt_timezone.utc),
+            'naive': datetime(2024, 5, 1, 10, 30),
+            'day': date(2024, 5, 1),
+            'hour': time(10, 30),
+            'duration': timedelta(hours=1),
+            'price': Decimal('12.50'),
+            'label': gettext_lazy('Title'),
+            'tags': [{'id': uuid.uuid4(), 'name': 'tag'}],
+            1: None,
+        }
+
+    def test_render_same_output_as_json_renderer(self):
+        self.assertEqual(ORJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_render_none(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_render_indent_falls_back_to_json_renderer(self):
+        self.assertEqual(
+            ORJSONRenderer().render(self.data, 'application/json; indent=4'),
+            JSONRenderer().render(self.data, 'application/json; indent=4')
+        )
+
+    def test_render_big_integer_falls_back_to_json_renderer(self):
+        self.assertEqual(ORJSONRenderer().render({'count': 2 ** 70}), b'{"count":1180591620717411303424}')
+
+    def test_render_custom_datetime_format(self):
+        rest_framework_settings = {'DATETIME_FORMAT': '%d-%m-%Y %H:%M:%S'}
+        with override_settings(REST_FRAMEWORK=rest_framework_settings):
+            api_settings.reload()
+            try:
+                rendered = ORJSONRenderer().render({'start': datetime(2024, 5, 1, 10, 30)})
+            finally:
+                api_settings.reload()
+        self.assertEqual(rendered, b'{"start":"01-05-2024 10:30:00"}')
+
+    def test_parse(self):
+        content = '{"id": "6a3b", "title": "Tournoi d\'été", "count": 3, "price": 12.5}'.encode()
+        self.assertEqual(
+            ORJSONParser().parse(BytesIO(content)),
+            JSONParser().parse(BytesIO(content))
+        )
+
+    def test_parse_other_encoding(self):
+        content = '{"title": "été"}'.encode('latin-1')
+        self.assertEqual(ORJSONParser().parse(BytesIO(content), parser_context={'encoding': 'latin-1'}),
+                         {'title': 'été'})
+
+    def test_parse_invalid_json(self):
+        for content in [b'{"title": ', b'{"count": NaN}']:
+            with self.assertRaises(ParseError):
+                ORJSONParser().parse(BytesIO(content))
@@ -2,6 +2,8 @@ import json
 from datetime import date
 
 from django.contrib.auth.models import Permission
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 from rest_framework_api_key.models import APIKey
@@ -197,3 +199,36 @@ class PricingViewTests(APITestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(Pricing.objects.count(), 0)
+
+    def test_get_pricing_detail_with_fields_and_expand(self):
+        """ Teste le choix des champs et des relations détaillées d'un pricing """
+        self.pricing.image = self.image
+        self.pricing.save()
+
+        response = self.client.get(f'{self.detail_url}?fields=id,title,image', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertEqual(
+            response.json(),
+            {'id': str(self.pricing.id), 'title': 'Basic Pricing', 'image': str(self.image.id)}
+        )
+
+        response = self.client.get(f'{self.detail_url}?fields=id,image&expand=image', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertEqual(response.data['image']['id'], str(self.image.id))
+        self.assertEqual(response.data['image']['tags'], [])
+
+    def test_get_pricing_list_with_fields_does_not_query_image(self):
+        """ Teste que l'image n'est pas chargée quand elle n'est pas demandée """
+        self.pricing.image = self.image
+        self.pricing.save()
+
+        with CaptureQueriesContext(connection) as expand_context:
+            response = self.client.get(f'{self.url}?expand=image', HTTP_API_KEY=self.key)
+        self.assertEqual(response.data['data'][0]['image']['title'], 'test')
+        with CaptureQueriesContext(connection) as fields_context:
+            response = self.client.get(f'{self.url}?fields=id,title', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertEqual(set(response.data['data'][0]), {'id', 'title'})
+        # Neither the prefetch nor the conditional GET state of the related tables
+        self.assertEqual(len(fields_context.captured_queries), len(expand_context.captured_queries) - 2)
+        self.assertNotIn('JOIN', fields_context.captured_queries[-1]['sql'])
@@ -0,0 +1,234 @@
+import inspect
+import json
+import shutil
+import tempfile
+from datetime import date
+from io import BytesIO
+
+from PIL import Image as PilImage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
+from django.test import override_settings
+from django.views import View
+from rest_framework.test import APITestCase
+from rest_framework_api_key.models import APIKey
+from rest_framework_simplejwt.tokens import AccessToken
+
+from BackendTennis import views
+from BackendTennis.constant import Constant
+from BackendTennis.models import User
+from BackendTennis.tests.query_budget import QueryBudget, count_view_queries, create_query_budget_fixtures
+from BackendTennis.views import AboutPageListCreateView, AboutPageRetrieveUpdateDestroyView, BookingListCreateView, \
+    BookingRetrieveUpdateDestroyView, BulkImageUploadView, CategoryListCreateView, \
+    CategoryRetrieveUpdateDestroyView, ClubValueListCreateView, ClubValueRetrieveUpdateDestroyView, \
+    CustomTokenObtainPairView, EventListCreateView, EventRetrieveUpdateDestroyView, HomePageListCreateView, \
+    HomePageRetrieveUpdateDestroyView, ImageBatchDeleteView, ImageListCreateView, ImageRetrieveUpdateDestroyView, \
+    ImageTypeListView, MetricsView, NavigationBarListCreateView, NavigationBarRetrieveUpdateDestroyView, \
+    NavigationItemListCreateView, NavigationItemRetrieveUpdateDestroyView, NewsListCreateView, \
+    NewsRetrieveUpdateDestroyView, PageRenderListCreateView, PageRenderRetrieveUpdateDestroyView, \
+    PricingListCreateView, PricingPageListCreateView, PricingPageRetrieveUpdateDestroyView, \
+    PricingRetrieveUpdateDestroyView, ProfessorListCreateView, ProfessorRetrieveUpdateDestroyView, \
+    RenderListCreateView, RenderRetrieveUpdateDestroyView, RequestTimingStatsView, RouteListCreateView, \
+    RouteRetrieveUpdateDestroyView, SiteBundleView, SponsorListCreateView, SponsorRetrieveUpdateDestroyView, \
+    TagRetrieveUpdateDestroyView, TagView, TeamMemberListCreateView, TeamMemberRetrieveUpdateDestroyView, \
+    TeamPageListCreateView, TeamPageRetrieveUpdateDestroyView, TournamentListCreateView, \
+    TournamentRetrieveUpdateDestroyView, TrainingListCreateView, TrainingRetrieveUpdateDestroyView, \
+    UpdateNavigationItemsView, UserAdminView, UserRegisterView
+
+SMALL_FIXTURE_SIZE = 2
+LARGE_FIXTURE_SIZE = 5
+
+COMPACT_PARTICIPANTS = f'?participants={Constant.PARTICIPANTS_MODE.COMPACT}'
+FULL_PARTICIPANTS = f'?participants={Constant.PARTICIPANTS_MODE.FULL}'
+
+
+def _upload_data(fixtures):
+    image_file = BytesIO()
+    PilImage.new('RGB', (10, 10), color='red').save(image_file, 'jpeg')
+    return {
+        'images_data': json.dumps([{'index': 0, 'title': 'Upload', 'type': Constant.IMAGE_TYPE.PICTURE}]),
+        'image_0': SimpleUploadedFile('upload.jpg', image_file.getvalue(), content_type='image/jpeg'),
+    }
+
+
+def _reorder_data(fixtures):
+    root = fixtures['navigation_item']
+    children = list(root.childrenNavigationItems.select_related('navBarRender'))
+    orders = [child.navBarRender.order for child in reversed(children)]
+    return {'updates': [
+        {'id': str(child.id), 'order': order, 'parent': str(root.id)} for child, order in zip(children, orders)
+    ]}
+
+
+def _register_data(fixtures):
+    return {
+        'first_name': 'New',
+        'last_name': 'User',
+        'birthdate': '1990-01-01',
+        'email': 'new-user@example.com',
+        'phone_number': '+33600000000',
+        'postal_code': '33114',
+        'address': '1 rue du Stade',
+        'street': 'rue du Stade',
+        'city': 'Arsac',
+        'country': 'France',
+        'spouse': None,
+        'children': [],
+    }
+
+
+def _detail_budgets(view, lookup, get, patch, delete, patch_data=None, **kwargs):
+    return [
+        QueryBudget(view, 'get', get, lookup=lookup, **kwargs),
+        QueryBudget(view, 'patch', patch, lookup=lookup, data=patch_data or (lambda fixtures: {}), **kwargs),
+        QueryBudget(view, 'delete', delete, lookup=lookup, **kwargs),
+    ]
+
+
+# Maximum count of queries of each view and method, the API key check and the user lookup included.
+# Create and replace requests need a full payload of each model, they are left to the tests of each view.
+QUERY_BUDGETS = [
+    QueryBudget(AboutPageListCreateView, 'get', 6),
+    *_detail_budgets(AboutPageRetrieveUpdateDestroyView, 'about_page', 5, 9, 10),
+    QueryBudget(BookingListCreateView, 'get', 4),
+    *_detail_budgets(BookingRetrieveUpdateDestroyView, 'booking', 2, 4, 4),
+    QueryBudget(CategoryListCreateView, 'get', 3),
+    *_detail_budgets(CategoryRetrieveUpdateDestroyView, 'category', 2, 4, 6),
+    QueryBudget(ClubValueListCreateView, 'get', 3),
+    *_detail_budgets(ClubValueRetrieveUpdateDestroyView, 'club_value', 2, 10, 6),
+    QueryBudget(CustomTokenObtainPairView, 'post', 1,
+                data=lambda fixtures: {'email': fixtures['user'].email, 'password': 'password'}),
+    QueryBudget(EventListCreateView, 'get', 6),
+    QueryBudget(EventListCreateView, 'get', 6, query_params=f'?mode={Constant.EVENT_MODE.FUTURE_EVENT}'),
+    *_detail_budgets(EventRetrieveUpdateDestroyView, 'event', 3, 7, 4),
+    QueryBudget(HomePageListCreateView, 'get', 3),
+    *_detail_budgets(HomePageRetrieveUpdateDestroyView, 'home_page', 3, 5, 6),
+    QueryBudget(ImageTypeListView, 'get', 1),
+    QueryBudget(ImageListCreateView, 'get', 6),
+    QueryBudget(ImageListCreateView, 'get', 7, query_params='?cursor='),
+    QueryBudget(ImageListCreateView, 'get', 9, query_params='?tags=query-budget-0,query-budget-1'),
+    *_detail_budgets(ImageRetrieveUpdateDestroyView, 'image', 4, 6, 23),
+    QueryBudget(ImageBatchDeleteView, 'delete', 38,
+                data=lambda fixtures: {'ids': [str(image.id) for image in fixtures['images'][:2]]}),
+    QueryBudget(BulkImageUploadView, 'post', 9, data=_upload_data, format='multipart'),
+    QueryBudget(MetricsView, 'get', 0),
+    QueryBudget(NavigationBarListCreateView, 'get', 3),
+    *_detail_budgets(NavigationBarRetrieveUpdateDestroyView, 'navigation_bar', 3, 5, 6),
+    QueryBudget(NavigationItemListCreateView, 'get', 7),
+    *_detail_budgets(NavigationItemRetrieveUpdateDestroyView, 'navigation_item', 6, 24, 14),
+    QueryBudget(UpdateNavigationItemsView, 'patch', 13, data=_reorder_data),
+    QueryBudget(NewsListCreateView, 'get', 6),
+    *_detail_budgets(NewsRetrieveUpdateDestroyView, 'news', 4, 9, 6),
+    QueryBudget(PageRenderListCreateView, 'get', 4),
+    *_detail_budgets(PageRenderRetrieveUpdateDestroyView, 'page_render', 3, 4, 6),
+    QueryBudget(PricingPageListCreateView, 'get', 5),
+    *_detail_budgets(PricingPageRetrieveUpdateDestroyView, 'pricing_page', 4, 5, 6),
+    QueryBudget(PricingListCreateView, 'get', 5),
+    *_detail_budgets(PricingRetrieveUpdateDestroyView, 'pricing', 3, 6, 6),
+    QueryBudget(ProfessorListCreateView, 'get', 6),
+    *_detail_budgets(ProfessorRetrieveUpdateDestroyView, 'professor', 4, 13, 7),
+    QueryBudget(RenderListCreateView, 'get', 3),
+    *_detail_budgets(RenderRetrieveUpdateDestroyView, 'render', 2, 5, 6),
+    QueryBudget(RequestTimingStatsView, 'get', 2),
+    QueryBudget(RouteListCreateView, 'get', 3),
+    *_detail_budgets(RouteRetrieveUpdateDestroyView, 'route', 2, 4, 7),
+    QueryBudget(SiteBundleView, 'get', 38),
+    QueryBudget(SponsorListCreateView, 'get', 6),
+    *_detail_budgets(SponsorRetrieveUpdateDestroyView, 'sponsor', 4, 12, 7),
+    QueryBudget(TagView, 'get', 4),
+    *_detail_budgets(TagRetrieveUpdateDestroyView, 'tag', 2, 6, 6, patch_data=lambda fixtures: {'name': 'Renamed'}),
+    QueryBudget(TeamMemberListCreateView, 'get', 7),
+    *_detail_budgets(TeamMemberRetrieveUpdateDestroyView, 'team_member', 5, 13, 10),
+    QueryBudget(TeamPageListCreateView, 'get', 6),
+    *_detail_budgets(TeamPageRetrieveUpdateDestroyView, 'team_page', 5, 6, 8),
+    QueryBudget(TournamentListCreateView, 'get', 6),
+    QueryBudget(TournamentListCreateView, 'get', 7, query_params=COMPACT_PARTICIPANTS),
+    QueryBudget(TournamentListCreateView, 'get', 9, query_params=FULL_PARTICIPANTS),
+    *_detail_budgets(TournamentRetrieveUpdateDestroyView, 'tournament', 4, 6, 6),
+    QueryBudget(TournamentRetrieveUpdateDestroyView, 'get', 5, lookup='tournament', query_params=COMPACT_PARTICIPANTS),
+    QueryBudget(TournamentRetrieveUpdateDestroyView, 'get', 7, lookup='tournament', query_params=FULL_PARTICIPANTS),
+    QueryBudget(TrainingListCreateView, 'get', 6),
+    QueryBudget(TrainingListCreateView, 'get', 7, query_params=COMPACT_PARTICIPANTS),
+    QueryBudget(TrainingListCreateView, 'get', 9, query_params=FULL_PARTICIPANTS),
+    *_detail_budgets(TrainingRetrieveUpdateDestroyView, 'training', 4, 6, 6),
+    QueryBudget(TrainingRetrieveUpdateDestroyView, 'get', 5, lookup='training', query_params=COMPACT_PARTICIPANTS),
+    QueryBudget(TrainingRetrieveUpdateDestroyView, 'get', 7, lookup='training', query_params=FULL_PARTICIPANTS),
+    QueryBudget(UserAdminView, 'get', 2, force_authentication=True),
+    *_detail_budgets(UserAdminView, 'user', 2, 3, 12, force_authentication=True),
+    QueryBudget(UserRegisterView, 'post', 6, data=_register_data),
+]
+
+# Query counts growing with the data, known and not fixed yet. Remove the entry with the fix.
+QUERY_GROWTH_ALLOWED = set()
+
+
+# The requests of the budgets carry no metrics token
+@override_settings(METRICS={'ENABLED': True, 'TOKEN': None, 'PUBLIC': True})
+class QueryBudgetTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(
+            email='superuser@example.com',
+            password='superpassword',
+            first_name='Super',
+            last_name='User',
+            birthdate=date(1990, 1, 1)
+        )
+        cls.api_key, cls.key = APIKey.objects.create_key(name='test-api-key')
+        cls.headers = {
+            'HTTP_API_KEY': cls.key,
+            'HTTP_AUTHORIZATION': f'Bearer {AccessToken.for_user(cls.superuser)}',
+        }
+
+    def _count_queries(self, size):
+        """:return: the query count of every budget, on fixtures of `size` rows (rolled back afterwards)"""
+        counts = {}
+        # A media root per size, the files stored by a run are not rolled back and would be deduplicated by the next
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        with override_settings(MEDIA_ROOT=media_root), transaction.atomic():
+            fixtures = create_query_budget_fixtures(size)
+            for query_budget in QUERY_BUDGETS:
+                with self.subTest(query_budget.name, size=size):
+                    counts[query_budget.name] = count_view_queries(
+                        query_budget, fixtures, self.headers, self.superuser
+                    )
+            transaction.set_rollback(True)
+        return counts
+
+    def test_every_view_has_a_budget(self):
+        view_classes = {
+            view_class for view_class in vars(views).values()
+            if inspect.isclass(view_class) and issubclass(view_class, View)
+        }
+        budgeted_view_classes = {query_budget.view for query_budget in QUERY_BUDGETS}
+        self.assertEqual(view_classes - budgeted_view_classes, set())
+
+        for query_budget in QUERY_BUDGETS:
+            self.assertTrue(hasattr(query_budget.view, query_budget.method), query_budget.name)
+        names = [query_budget.name for query_budget in QUERY_BUDGETS]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual(QUERY_GROWTH_ALLOWED - set(names), set())
+
+    def test_query_counts_within_budget_and_independent_of_data_size(self):
+        small_counts = self._count_queries(SMALL_FIXTURE_SIZE)
+        large_counts = self._count_queries(LARGE_FIXTURE_SIZE)
+
+        for query_budget in QUERY_BUDGETS:
+            name = query_budget.name
+            if name not in small_counts or name not in large_counts:
+                continue
+            with self.subTest(name):
+                self.assertLessEqual(
+                    large_counts[name],
+                    query_budget.budget,
+                    f'{name}: {large_counts[name]} queries over the budget of {query_budget.budget}'
+                )
+                if name not in QUERY_GROWTH_ALLOWED:
+                    self.assertEqual(
+                        large_counts[name],
+                        small_counts[name],
+                        f'{name}: {small_counts[name]} queries with {SMALL_FIXTURE_SIZE} rows, '
+                        f'{large_counts[name]} with {LARGE_FIXTURE_SIZE}'
+                    )
@@ -0,0 +1,117 @@
+import re
+from datetime import date
+
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_api_key.models import APIKey
+from rest_framework_simplejwt.tokens import AccessToken
+
+from BackendTennis.models import User, Tag
+from BackendTennis.services.request_timing_service import request_timing_stats, RollingTimingStats, RequestTiming
+
+SERVER_TIMING_PATTERN = re.compile(
+    r'^db;dur=[\d.]+;desc="(\d+) queries", auth;dur=[\d.]+, serialize;dur=([\d.]+), render;dur=[\d.]+, '
+    r'total;dur=[\d.]+$'
+)
+
+
+class RequestTimingTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='testuser@example.com',
+            password='testpassword',
+            first_name='Test',
+            last_name='User',
+            birthdate=date(1990, 1, 1)
+        )
+        cls.staff_user = User.objects.create_user(
+            email='staff@example.com',
+            password='staffpassword',
+            first_name='Staff',
+            last_name='User',
+            birthdate=date(1990, 1, 1),
+            is_staff=True
+        )
+        cls.token = str(AccessToken.for_user(cls.user))
+        cls.staff_token = str(AccessToken.for_user(cls.staff_user))
+        cls.api_key, cls.key = APIKey.objects.create_key(name='test-api-key')
+        Tag.objects.create(name='timing')
+
+        cls.url = '/BackendTennis/request_timing_stats/'
+        cls.tag_url = '/BackendTennis/tag/'
+
+    def setUp(self):
+        request_timing_stats.clear()
+
+    def test_server_timing_header(self):
+        """ Test the header gives the query count and the time of every step """
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.tag_url, HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        match = SERVER_TIMING_PATTERN.match(response['Server-Timing'])
+        self.assertIsNotNone(match, response['Server-Timing'])
+        self.assertEqual(int(match.group(1)), len(context.captured_queries))
+
+    def test_serialization_is_timed(self):
+        """ Test the list and retrieve actions are measured in the serialize step, not the 304 answers """
+        tag = Tag.objects.get(name='timing')
+        for url in [self.tag_url, f'{self.tag_url}{tag.id}/']:
+            response = self.client.get(url, HTTP_API_KEY=self.key)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertGreater(float(SERVER_TIMING_PATTERN.match(response['Server-Timing']).group(2)), 0, url)
+
+            response = self.client.get(url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=response['ETag'])
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(float(SERVER_TIMING_PATTERN.match(response['Server-Timing']).group(2)), 0, url)
+
+    def test_request_timing_is_logged(self):
+        """ Test a structured log line is written for every request """
+        with self.assertLogs('BackendTennis.services.request_timing_service', 'INFO') as logs:
+            self.client.get(self.tag_url, HTTP_API_KEY=self.key)
+        self.assertRegex(
+            logs.output[0],
+            r'view=BackendTennis:tag-list-create method=GET status=200 queries=\d+ db_ms=[\d.]+ auth_ms=[\d.]+ '
+            r'serialize_ms=[\d.]+ render_ms=[\d.]+ total_ms=[\d.]+$'
+        )
+
+    def test_get_stats_staff_only(self):
+        """ Test only staff users can read the stats """
+        response = self.client.get(self.url, HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_get_stats(self):
+        """ Test the stats give the percentiles of every measured view """
+        for _ in range(3):
+            self.client.get(self.tag_url, HTTP_API_KEY=self.key)
+
+        response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_AUTHORIZATION=f'Bearer {self.staff_token}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        tag_stats = response.data['views']['BackendTennis:tag-list-create']
+        self.assertEqual(tag_stats['count'], 3)
+        self.assertEqual(set(tag_stats), {'count', 'total', 'db', 'auth', 'serialize', 'render', 'queries'})
+        self.assertEqual(set(tag_stats['queries']), {'p50', 'p90', 'p99'})
+        self.assertGreater(tag_stats['queries']['p50'], 0)
+
+
+class RollingTimingStatsTests(SimpleTestCase):
+
+    def test_percentiles_of_the_window(self):
+        """ Test only the last requests are kept and the percentiles use the nearest rank """
+        stats = RollingTimingStats(window=4)
+        for query_count in [100, 1, 2, 3, 4]:
+            timing = RequestTiming()
+            timing.query_count = query_count
+            timing.stop()
+            stats.add('view', timing)
+
+        view_stats = stats.get_stats()['view']
+        self.assertEqual(view_stats['count'], 4)
+        self.assertEqual(view_stats['queries'], {'p50': 2, 'p90': 4, 'p99': 4})
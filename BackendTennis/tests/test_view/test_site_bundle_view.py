@@ -0,0 +1,182 @@
+from datetime import datetime, timedelta
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_api_key.models import APIKey
+
+from BackendTennis.constant import Constant
+from BackendTennis.models import HomePage, NavigationBar, AboutPage, TeamPage, PricingPage, Event, News, Category, \
+    Image, Tag, Sponsor, ClubValue, Professor
+
+CACHED_PAYLOAD_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'payload': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-site-bundle'},
+}
+
+
+class SiteBundleViewTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.api_key, cls.key = APIKey.objects.create_key(name='test-api-key')
+
+        cls.category = Category.objects.create(name='Test Category')
+        cls.tag = Tag.objects.create(name='Test Tag')
+        cls.event_image = Image.objects.create(type=Constant.IMAGE_TYPE.EVENT, imageUrl='test_image_url.jpg')
+        cls.event_image.tags.add(cls.tag)
+        cls.sponsor_image = Image.objects.create(type=Constant.IMAGE_TYPE.SPONSOR)
+
+        cls.home_page = HomePage.objects.create(title='Home')
+        cls.navigation_bar = NavigationBar.objects.create()
+        cls.about_page = AboutPage.objects.create(clubTitle='About')
+        cls.about_page.clubValues.add(ClubValue.objects.create(title='Value', description='Description', order=0))
+        cls.about_page.sponsors.add(Sponsor.objects.create(brandName='Sponsor', image=cls.sponsor_image, order=0))
+        cls.team_page = TeamPage.objects.create()
+        cls.team_page.professors.add(Professor.objects.create(
+            fullName='Professor',
+            image=Image.objects.create(type=Constant.IMAGE_TYPE.PROFESSOR),
+            role='Coach',
+            diploma='DE',
+            best_rank='2/6',
+            year_experience='10 ans',
+            order=0
+        ))
+        cls.pricing_page = PricingPage.objects.create(title='Pricing')
+
+        cls.upcoming_event = Event.objects.create(
+            title='Upcoming Event',
+            description='Test Description',
+            dateType='single-day',
+            start=datetime.now() + timedelta(days=1),
+            end=datetime.now() + timedelta(days=2),
+            image=cls.event_image,
+            category=cls.category
+        )
+        cls.past_event = Event.objects.create(
+            title='Past Event',
+            description='Test Description',
+            dateType='single-day',
+            start=datetime.now() - timedelta(days=3),
+            end=datetime.now() - timedelta(days=2),
+            image=cls.event_image,
+            category=cls.category
+        )
+        cls.news = News.objects.create(
+            title='Test News',
+            content='This is a test news content.',
+            subtitle='Test Subtitle',
+            category=cls.category
+        )
+        cls.news.images.add(cls.event_image)
+
+        cls.url = '/BackendTennis/site_bundle/'
+
+    def test_get_site_bundle_no_authentication(self):
+        """ Test if unauthenticated users cannot access the site bundle """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN, str(response.data))
+
+    def test_get_site_bundle_with_api_key(self):
+        """ Test the site bundle holds every page, the upcoming events and the latest news """
+        response = self.client.get(self.url, HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertIn('version', response.data)
+        self.assertEqual(response.data['homePages'][0]['title'], 'Home')
+        self.assertEqual(response.data['navigationBars'][0]['id'], str(self.navigation_bar.id))
+        self.assertEqual(response.data['aboutPages'][0]['sponsors'][0]['brandName'], 'Sponsor')
+        self.assertEqual(response.data['aboutPages'][0]['clubValues'][0]['title'], 'Value')
+        self.assertEqual(response.data['teamPages'][0]['professors'][0]['fullName'], 'Professor')
+        self.assertEqual(response.data['pricingPages'][0]['title'], 'Pricing')
+        self.assertEqual([event['title'] for event in response.data['upcomingEvents']], ['Upcoming Event'])
+        self.assertEqual(response.data['upcomingEvents'][0]['image']['tags'][0]['name'], 'Test Tag')
+        self.assertEqual(response.data['latestNews'][0]['title'], 'Test News')
+
+    def test_create_site_bundle_not_allowed(self):
+        """ Test the site bundle is read only """
+        response = self.client.post(self.url, data={}, HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED, str(response.data))
+
+    def test_site_bundle_query_count_does_not_grow_with_rows(self):
+        """ Test the related objects are prefetched for all the pages at once """
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.url, HTTP_API_KEY=self.key)
+        query_count = len(context.captured_queries)
+
+        for index in range(3):
+            image = Image.objects.create(type=Constant.IMAGE_TYPE.EVENT)
+            image.tags.add(self.tag)
+            Event.objects.create(
+                title=f'Upcoming Event {index}',
+                description='Test Description',
+                dateType='single-day',
+                start=datetime.now() + timedelta(days=1),
+                end=datetime.now() + timedelta(days=2),
+                image=image,
+                category=Category.objects.create(name=f'Category {index}')
+            )
+            self.about_page.sponsors.add(
+                Sponsor.objects.create(brandName=f'Sponsor {index}', image=self.sponsor_image, order=index + 1)
+            )
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, HTTP_API_KEY=self.key)
+        self.assertEqual(len(response.data['upcomingEvents']), 4)
+        self.assertEqual(len(context.captured_queries), query_count)
+
+    @override_settings(CACHES=CACHED_PAYLOAD_CACHES)
+    def test_get_site_bundle_is_served_from_payload_cache(self):
+        """ Test the site bundle is cached with an ETag and rebuilt after a content change """
+        response = self.client.get(self.url, HTTP_API_KEY=self.key)
+        etag = response.headers['ETag']
+        version = response.data['version']
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(context.captured_queries), 0)
+
+        self.news.title = 'Updated News'
+        self.news.save()
+        response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertNotEqual(response.data['version'], version)
+        self.assertEqual(response.data['latestNews'][0]['title'], 'Updated News')
+
+    @override_settings(CACHES=CACHED_PAYLOAD_CACHES)
+    def test_site_bundle_built_before_commit_is_invalidated_on_commit(self):
+        """ Test a bundle built while the change is not committed yet is not kept after the commit """
+        with self.captureOnCommitCallbacks(execute=True):
+            self.news.title = 'Updated News'
+            self.news.save()
+            # A concurrent request would read the rows of before the commit
+            etag = self.client.get(self.url, HTTP_API_KEY=self.key).headers['ETag']
+            response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, str(response.data))
+
+    @override_settings(CACHES={**CACHED_PAYLOAD_CACHES, 'payload': {**CACHED_PAYLOAD_CACHES['payload'], 'LOCATION': 'host'}},
+                       ALLOWED_HOSTS=['api.example.com', 'other.example.com'])
+    def test_site_bundle_image_urls_use_request_host(self):
+        """ Test a cached bundle is kept by host, its image URLs are the ones of the host serving it """
+        response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_HOST='api.example.com', secure=True)
+        self.assertEqual(
+            response.data['upcomingEvents'][0]['image']['imageUrl'],
+            'https://api.example.com/images/test_image_url.jpg'
+        )
+
+        response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_HOST='other.example.com')
+        self.assertEqual(
+            response.data['upcomingEvents'][0]['image']['imageUrl'],
+            'http://other.example.com/images/test_image_url.jpg'
+        )
+        response = self.client.get(self.url, HTTP_API_KEY=self.key, HTTP_HOST='api.example.com', secure=True)
+        self.assertEqual(
+            response.data['upcomingEvents'][0]['image']['imageUrl'],
+            'https://api.example.com/images/test_image_url.jpg'
+        )
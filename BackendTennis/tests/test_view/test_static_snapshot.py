@@ -0,0 +1,113 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command, CommandError
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_api_key.models import APIKey
+
+from BackendTennis.models import AboutPage, Route
+from BackendTennis.services.static_snapshot_service import export_static_snapshot, read_manifest, \
+    schedule_static_snapshot_rebuild, SNAPSHOT_URL_NAMES
+
+
+class StaticSnapshotTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.api_key, cls.key = APIKey.objects.create_key(name='test-api-key')
+        cls.about_page = AboutPage.objects.create(clubTitle='About')
+        cls.route = Route.objects.create(
+            name='Home',
+            protocol='https',
+            domainUrl='test.com',
+            metaTags=[{'name': 'description', 'content': 'Home page'}]
+        )
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _read_snapshot(self, manifest, name):
+        with open(os.path.join(self.root, manifest['files'][name]['file'])) as snapshot_file:
+            return json.load(snapshot_file)
+
+    def test_export_writes_every_payload_and_manifest(self):
+        """ Test every public payload is exported with the same content as its API response """
+        manifest = export_static_snapshot(self.root, 'http://testserver')
+
+        self.assertEqual(read_manifest(self.root), manifest)
+        self.assertEqual(set(manifest['files']), set(SNAPSHOT_URL_NAMES))
+        for name, snapshot in manifest['files'].items():
+            self.assertTrue(os.path.exists(os.path.join(self.root, snapshot['file'])), name)
+
+        response = self.client.get(manifest['files']['about_page']['path'], HTTP_API_KEY=self.key)
+        self.assertEqual(self._read_snapshot(manifest, 'about_page'), json.loads(response.content))
+        self.assertNotIn('site_bundle', manifest['files'])
+        self.assertEqual(self._read_snapshot(manifest, 'route')[0]['metaTags'],
+                         [{'name': 'description', 'content': 'Home page'}])
+
+    def test_export_etags_are_the_api_etags(self):
+        """ Test the manifest ETag of a file is the one the API returns, a conditional request gets a 304 """
+        manifest = export_static_snapshot(self.root, 'http://testserver')
+
+        for name, snapshot in manifest['files'].items():
+            response = self.client.get(snapshot['path'], HTTP_API_KEY=self.key)
+            self.assertEqual(response.headers['ETag'], snapshot['etag'], name)
+            response = self.client.get(snapshot['path'], HTTP_API_KEY=self.key, HTTP_IF_NONE_MATCH=snapshot['etag'])
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED, name)
+
+    def test_export_keeps_unchanged_files_and_prunes_old_ones(self):
+        """ Test files are immutable, a change gives a new file and only the previous one is kept """
+        first_manifest = export_static_snapshot(self.root, 'http://testserver')
+        self.assertEqual(export_static_snapshot(self.root, 'http://testserver')['files'], first_manifest['files'])
+
+        self.about_page.clubTitle = 'Updated About'
+        self.about_page.save()
+        second_manifest = export_static_snapshot(self.root, 'http://testserver')
+        first_file = first_manifest['files']['about_page']['file']
+        second_file = second_manifest['files']['about_page']['file']
+        self.assertNotEqual(first_file, second_file)
+        self.assertEqual(self._read_snapshot(second_manifest, 'about_page')[0]['clubTitle'], 'Updated About')
+        self.assertTrue(os.path.exists(os.path.join(self.root, first_file)))
+
+        self.about_page.clubTitle = 'Updated About again'
+        self.about_page.save()
+        export_static_snapshot(self.root, 'http://testserver')
+        self.assertFalse(os.path.exists(os.path.join(self.root, first_file)))
+        self.assertTrue(os.path.exists(os.path.join(self.root, second_file)))
+
+    def test_export_command(self):
+        """ Test the management command exports to the given directory """
+        call_command('export_static_snapshot', root=self.root, base_url='http://testserver', stdout=StringIO())
+        self.assertEqual(set(read_manifest(self.root)['files']), set(SNAPSHOT_URL_NAMES))
+
+    @override_settings(STATIC_SNAPSHOT={'ROOT': None, 'BASE_URL': None})
+    def test_export_requires_base_url(self):
+        """ Test the host of the image URLs is never guessed """
+        with self.assertRaisesMessage(ValueError, 'STATIC_SNAPSHOT BASE_URL is not configured.'):
+            export_static_snapshot(self.root)
+        with self.assertRaisesMessage(CommandError, 'STATIC_SNAPSHOT BASE_URL'):
+            call_command('export_static_snapshot', root=self.root, stdout=StringIO())
+
+    def test_schedule_rebuild_without_root(self):
+        """ Test nothing is rebuilt when no snapshot directory is configured """
+        with override_settings(STATIC_SNAPSHOT={'ROOT': None}):
+            self.assertIsNone(schedule_static_snapshot_rebuild())
+
+    def test_schedule_rebuild_coalesces_changes(self):
+        """ Test a burst of changes triggers a single background rebuild """
+        snapshot_settings = {'ROOT': self.root, 'BASE_URL': 'http://testserver', 'REBUILD_DELAY': 0.5}
+        with override_settings(STATIC_SNAPSHOT=snapshot_settings):
+            future = schedule_static_snapshot_rebuild()
+            self.assertIsNotNone(future)
+            self.assertIsNone(schedule_static_snapshot_rebuild())
+            future.result(timeout=30)
+
+        self.assertEqual(set(read_manifest(self.root)['files']), set(SNAPSHOT_URL_NAMES))
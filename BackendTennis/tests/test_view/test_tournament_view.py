@@ -137,6 +137,64 @@ class TournamentViewTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['name'], self.tournament.name)
 
+    def test_get_tournament_list_with_compact_participants(self):
+        """ Test listing tournaments with the ids and display names of the participants """
+        response = self.client.get(f'{self.url}?participants=compact', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['data'][0]['participants'],
+            [{'id': str(self.user.id), 'displayName': 'Test User'}]
+        )
+
+    def test_get_tournament_detail_with_full_participants(self):
+        """ Test retrieving a tournament with the participants as users """
+        self.user.children.set([self.superuser])
+        self.user.user_permissions.add(Permission.objects.get(codename='view_user'))
+        response = self.client.get(f'{self.detail_url}?participants=full', HTTP_API_KEY=self.key,
+                                   HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['participants'][0]['email'], self.user.email)
+        self.assertEqual(response.data['participants'][0]['children'], [self.superuser.id])
+
+        # Each mode has its own ETag
+        default_response = self.client.get(self.detail_url, HTTP_API_KEY=self.key)
+        self.assertEqual(default_response.data['participants'], [self.user.id])
+        self.assertNotEqual(response['ETag'], default_response['ETag'])
+
+    def test_get_tournament_full_participants_requires_view_user(self):
+        """ Test the users of the full mode are refused to the API key alone and to users not allowed to view them """
+        response = self.client.get(f'{self.detail_url}?participants=full', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.get(f'{self.url}?participants=full', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.get(f'{self.url}?participants=full', HTTP_API_KEY=self.key,
+                                   HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(f'{self.url}?participants=full', HTTP_API_KEY=self.key,
+                                   HTTP_AUTHORIZATION=f'Bearer {self.superuser_token}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data'][0]['participants'][0]['email'], self.user.email)
+
+    def test_get_tournament_compact_participants_etag_follows_participants(self):
+        """ Test a change of a participant is a change of the compact responses """
+        list_response = self.client.get(f'{self.url}?participants=compact', HTTP_API_KEY=self.key)
+        detail_response = self.client.get(f'{self.detail_url}?participants=compact', HTTP_API_KEY=self.key)
+
+        self.user.first_name = 'Renamed'
+        self.user.save()
+
+        for url, response in [(self.url, list_response), (self.detail_url, detail_response)]:
+            response = self.client.get(f'{url}?participants=compact', HTTP_API_KEY=self.key,
+                                       HTTP_IF_NONE_MATCH=response['ETag'])
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['participants'][0]['displayName'], 'Renamed User')
+
+    def test_get_tournament_list_with_bad_participants_mode(self):
+        """ Test listing tournaments with an unknown participants mode """
+        response = self.client.get(f'{self.url}?participants=bad', HTTP_API_KEY=self.key)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_update_tournament_no_permission(self):
         """ Test updating a tournament without permission """
         data = {'name': 'Updated Tournament'}
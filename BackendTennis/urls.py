@@ -16,7 +16,8 @@ from BackendTennis.views import ImageListCreateView, PricingListCreateView, TagV
     HomePageListCreateView, HomePageRetrieveUpdateDestroyView, RenderListCreateView, RenderRetrieveUpdateDestroyView, \
     PageRenderListCreateView, PageRenderRetrieveUpdateDestroyView, NavigationBarListCreateView, \
     NavigationBarRetrieveUpdateDestroyView, PricingPageListCreateView, PricingPageRetrieveUpdateDestroyView, \
-    UpdateNavigationItemsView, ImageTypeListView, ImageBatchDeleteView, BulkImageUploadView, CustomTokenObtainPairView
+    UpdateNavigationItemsView, ImageTypeListView, ImageBatchDeleteView, BulkImageUploadView, CustomTokenObtainPairView, \
+    SiteBundleView, RequestTimingStatsView
 
 app_name = 'BackendTennis'
 urlpatterns = [
@@ -136,8 +137,12 @@ urlpatterns = [
         name='pricing_page_retrieve_update_destroy'
     ),
 
+    path('site_bundle/', SiteBundleView.as_view(), name='site_bundle'),
+
     path('api/image-types/', ImageTypeListView.as_view(), name='image-types'),
 
+    path('request_timing_stats/', RequestTimingStatsView.as_view(), name='request_timing_stats'),
+
     # path('admin/users/', UserAdminView.as_view(), name='user-admin'),
     # path('admin/users/<uuid:id>/', UserAdminView.as_view(), name='user-admin-detail'),
     # path('register/', UserRegisterView.as_view(), name='user-register'),
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+from django.utils.http import parse_etags, parse_http_date_safe, quote_etag
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from typing import Optional
+    from rest_framework.request import Request
+
+
+def compute_etag(*parts) -> str:
+    digest = hashlib.sha1(':'.join(str(part) for part in parts).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def _strip_weak_indicator(etag: str) -> str:
+    return etag[2:] if etag.startswith('W/') else etag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of the request If-None-Match header with the given ETag (RFC 9110 13.1.2)."""
+    if_none_match = request.headers.get('If-None-Match')
+    if not if_none_match:
+        return False
+    etags = parse_etags(if_none_match)
+    if '*' in etags:
+        return True
+    return _strip_weak_indicator(etag) in {_strip_weak_indicator(_etag) for _etag in etags}
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """If-Modified-Since is only evaluated when the request has no If-None-Match header (RFC 9110 13.2.2)."""
+    if request.headers.get('If-None-Match'):
+        return etag_matches(request, etag)
+    if last_modified is not None:
+        if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+        return if_modified_since is not None and int(last_modified.timestamp()) <= if_modified_since
+    return False
@@ -1,13 +1,17 @@
 import datetime
+import hashlib
 import json
 import os
+import shutil
 from pathlib import Path
 
+from django.db import connection
 from rest_framework import status
 from rest_framework.response import Response
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
 DELETE_PATH = Path(PROJECT_ROOT, 'images_deleted')
+BLOB_DIRECTORY = 'blobs'
 
 
 def ensure_directory_exists(path: Path):
@@ -23,9 +27,60 @@ def ensure_path_delete_exists():
 
 
 def compute_image_url(instance, filename):
+    if getattr(instance, 'contentHash', ''):
+        # Content addressed blob, shared by every Image uploading the same file
+        content_hash = instance.contentHash
+        return os.path.join(BLOB_DIRECTORY, content_hash[:2], f'{content_hash}.{filename.split('.')[-1].lower()}')
     return os.path.join(instance.type, f'{instance.pk}.{filename.split('.')[-1]}')
 
 
+def compute_content_hash(file) -> str:
+    """Streaming SHA-256 of an uploaded file, read chunk by chunk."""
+    sha256 = hashlib.sha256()
+    for chunk in file.chunks():
+        sha256.update(chunk)
+    file.seek(0)
+    return sha256.hexdigest()
+
+
+def lock_image_blobs(content_hashes) -> None:
+    """
+    Serialize the reuse and the deletion of the blobs of `content_hashes` across workers and processes, until the
+    end of the current transaction: a PostgreSQL advisory lock keyed on each hash, taken in order.
+    An upload then either sees the blob removed by a committed deletion, or commits its Image row before the
+    deletion checks the remaining references.
+    """
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        for content_hash in sorted(set(filter(None, content_hashes))):
+            cursor.execute('SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))', [content_hash])
+
+
+def image_blob_exists(image, file) -> bool:
+    return image.imageUrl.storage.exists(compute_image_url(image, file.name))
+
+
+def store_image_blob(image, file) -> bool:
+    """
+    Store `file` as the content addressed blob of `image` (see compute_image_url), writing it only when no
+    blob with the same content exists yet. `image.contentHash` is set, and locked with lock_image_blobs.
+
+    :return: True when an existing blob is reused
+    """
+    if image_blob_exists(image, file):
+        image.imageUrl.name = compute_image_url(image, file.name)
+        image.imageUrl._committed = True
+        return True
+    image.imageUrl.save(file.name, file, save=False)
+    return False
+
+
+def is_image_file_shared(image) -> bool:
+    """Return True when another Image references the same file (blob)."""
+    return type(image).objects.filter(imageUrl=image.imageUrl.name).exclude(pk=image.pk).exists()
+
+
 def move_deleted_image_to_new_path(image):
     image_url = image.imageUrl.__str__()
     file_to_move = Path(PROJECT_ROOT, 'images', image.imageUrl.__str__())
@@ -35,7 +90,16 @@ def move_deleted_image_to_new_path(image):
     ensure_directory_exists(delete_path)
     new_path = Path(delete_path, f'{image.id}.{image_url.split('.')[-1]}')
 
-    if file_to_move.exists():
+    # Without a file the path is the images directory itself
+    if not image_url or not file_to_move.is_file():
+        return
+    if image.imageUrl and is_image_file_shared(image):
+        # The blob is still referenced, the archive gets a hard link and the blob leaves with its last reference
+        try:
+            os.link(file_to_move, new_path)
+        except OSError:
+            shutil.copy2(file_to_move, new_path)
+    else:
         file_to_move.rename(new_path)
 
 
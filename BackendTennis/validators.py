@@ -1,6 +1,7 @@
 from rest_framework.exceptions import ValidationError
 
-from BackendTennis.constant import constant_pricing_type_list, constant_image_type_list
+from BackendTennis.constant import constant_pricing_type_list, constant_image_type_list, constant_tag_match_mode_list, \
+    constant_participants_mode_list
 
 
 def validate_type_for_str(validated_type, value):
@@ -31,3 +32,11 @@ def validate_pricing_type(value):
 
 def validate_image_type(value):
     validate_type(constant_image_type_list, value)
+
+
+def validate_tag_match_mode(value):
+    validate_type(constant_tag_match_mode_list, value)
+
+
+def validate_participants_mode(value):
+    validate_type(constant_participants_mode_list, value)
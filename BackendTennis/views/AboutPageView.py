@@ -3,21 +3,26 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
+from BackendTennis.mixins.dynamic_fields_mixin import DynamicFieldsViewMixin, DYNAMIC_FIELDS_PARAMETERS
 from BackendTennis.models import AboutPage
 from BackendTennis.permissions.page_permission.about_page_permissions import AboutPagePermissions
 from BackendTennis.serializers import AboutPageSerializer, AboutPageDetailSerializer
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class AboutPageListCreateView(ListCreateAPIView):
-    queryset = AboutPage.objects.all()
+class AboutPageListCreateView(DynamicFieldsViewMixin, ConditionalGetMixin, ListCreateAPIView):
+    queryset = AboutPage.objects.select_related('clubImage').prefetch_related(
+        'clubImage__tags', 'clubValues', 'sponsors__image__tags'
+    )
     serializer_class = AboutPageSerializer
+    dynamic_serializer_class = AboutPageDetailSerializer
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
     permission_classes = [AboutPagePermissions]
 
     @extend_schema(
         summary='Get list of About Page',
-        parameters=[],
+        parameters=DYNAMIC_FIELDS_PARAMETERS,
         responses={200: AboutPageDetailSerializer(many=True)},
         tags=['AboutPages']
     )
@@ -36,9 +41,12 @@ class AboutPageListCreateView(ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, AboutPageDetailSerializer, is_creation=True)
 
 
-class AboutPageRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
-    queryset = AboutPage.objects.all()
+class AboutPageRetrieveUpdateDestroyView(DynamicFieldsViewMixin, ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
+    queryset = AboutPage.objects.select_related('clubImage').prefetch_related(
+        'clubImage__tags', 'clubValues', 'sponsors__image__tags'
+    )
     serializer_class = AboutPageSerializer
+    dynamic_serializer_class = AboutPageDetailSerializer
     serializer_class_response = AboutPageDetailSerializer
     lookup_field = 'id'
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
@@ -46,6 +54,7 @@ class AboutPageRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
 
     @extend_schema(
         summary='Get About Page with Id',
+        parameters=DYNAMIC_FIELDS_PARAMETERS,
         responses={200: serializer_class_response},
         request=serializer_class,
         tags=['AboutPages']
@@ -3,13 +3,15 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
+from BackendTennis.mixins.streaming_list_mixin import StreamingListMixin, STREAMING_LIST_PARAMETERS
 from BackendTennis.models import Booking
 from BackendTennis.pagination import BookingPagination
 from BackendTennis.permissions.booking_permissions import BookingPermissions
 from BackendTennis.serializers.BookingSerializer import BookingSerializer
 
 
-class BookingListCreateView(ListCreateAPIView):
+class BookingListCreateView(StreamingListMixin, ConditionalGetMixin, ListCreateAPIView):
     queryset = Booking.objects.all()
     serializer_class = BookingSerializer
     pagination_class = BookingPagination
@@ -26,6 +28,9 @@ class BookingListCreateView(ListCreateAPIView):
                              type=int),
             OpenApiParameter(name='page', description='Page number within the paginated result set', required=False,
                              type=int),
+            OpenApiParameter(name='cursor', description='Cursor of the page, empty for the first one (keyset pagination)',
+                             required=False, type=str),
+            *STREAMING_LIST_PARAMETERS,
         ],
         responses={200: BookingSerializer(many=True)},
         tags=['Bookings']
@@ -44,7 +49,7 @@ class BookingListCreateView(ListCreateAPIView):
         return self.create(request, *args, **kwargs)
 
 
-class BookingRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
+class BookingRetrieveUpdateDestroyView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     queryset = Booking.objects.all()
     serializer_class = BookingSerializer
     lookup_field = 'id'
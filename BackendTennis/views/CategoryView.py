@@ -3,12 +3,13 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
 from BackendTennis.models import Category
 from BackendTennis.permissions.category_permissions import CategoryPermissions
 from BackendTennis.serializers import CategorySerializer
 
 
-class CategoryListCreateView(ListCreateAPIView):
+class CategoryListCreateView(ConditionalGetMixin, ListCreateAPIView):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
@@ -36,7 +37,7 @@ class CategoryListCreateView(ListCreateAPIView):
         return super().post(request, *args, **kwargs)
 
 
-class CategoryRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
+class CategoryRetrieveUpdateDestroyView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     lookup_field = 'id'
@@ -3,12 +3,13 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
 from BackendTennis.models import ClubValue
 from BackendTennis.permissions.club_value_permissions import ClubValuePermissions
 from BackendTennis.serializers import ClubValueSerializer
 
 
-class ClubValueListCreateView(ListCreateAPIView):
+class ClubValueListCreateView(ConditionalGetMixin, ListCreateAPIView):
     queryset = ClubValue.objects.all()
     serializer_class = ClubValueSerializer
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
@@ -33,7 +34,7 @@ class ClubValueListCreateView(ListCreateAPIView):
         return super().post(request, *args, **kwargs)
 
 
-class ClubValueRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
+class ClubValueRetrieveUpdateDestroyView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     queryset = ClubValue.objects.all()
     serializer_class = ClubValueSerializer
     lookup_field = 'id'
@@ -8,10 +8,12 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
 from BackendTennis.constant import Constant, constant_event_mode_list
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
 from BackendTennis.models import Event
 from BackendTennis.pagination import EventPagination
 from BackendTennis.permissions.event_permissions import EventPermissions
 from BackendTennis.serializers import EventSerializer, EventDetailSerializer
+from BackendTennis.services.request_timing_service import timed_step
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
@@ -20,22 +22,22 @@ class EventModeMixin:
         self.request = None
 
     def get_queryset(self):
-        queryset = Event.objects.all()
+        queryset = super().get_queryset()
         mode = self.request.query_params.get('mode')
         today = date.today()
 
         if mode == Constant.EVENT_MODE.HISTORY:
-            return Event.objects.filter(end__lt=today).order_by('end')
+            return queryset.filter(end__lt=today).order_by('end')
         elif mode == Constant.EVENT_MODE.FUTURE_EVENT:
-            return Event.objects.filter(end__gte=today).order_by('start')
+            return queryset.filter(end__gte=today).order_by('start')
         elif mode:
             raise ValidationError("Bad Mode. Mode available: %s" % ', '.join(Constant.EVENT_MODE.__dict__.values()))
 
         return queryset
 
 
-class EventListCreateView(EventModeMixin, ListCreateAPIView):
-    queryset = Event.objects.all()
+class EventListCreateView(ConditionalGetMixin, EventModeMixin, ListCreateAPIView):
+    queryset = Event.objects.select_related('image', 'category').prefetch_related('image__tags')
     serializer_class = EventDetailSerializer
     pagination_class = EventPagination
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
@@ -60,13 +62,14 @@ class EventListCreateView(EventModeMixin, ListCreateAPIView):
         return EventDetailSerializer
 
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({'status': 'success', 'count': queryset.count(), 'data': serializer.data})
+        with timed_step('serialize'):
+            queryset = self.get_queryset()
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                return self.get_paginated_response(serializer.data)
+            serializer = self.get_serializer(queryset, many=True)
+            return Response({'status': 'success', 'count': queryset.count(), 'data': serializer.data})
 
     @extend_schema(
         summary="Create a new event",
@@ -79,7 +82,7 @@ class EventListCreateView(EventModeMixin, ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, EventDetailSerializer, is_creation=True)
 
 
-class EventRetrieveUpdateDestroyView(EventModeMixin, RetrieveUpdateDestroyAPIView):
+class EventRetrieveUpdateDestroyView(ConditionalGetMixin, EventModeMixin, RetrieveUpdateDestroyAPIView):
     queryset = Event.objects.all()
     serializer_class = EventSerializer
     lookup_field = 'id'
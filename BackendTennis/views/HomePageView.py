@@ -3,14 +3,17 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.constant import Constant
+from BackendTennis.mixins.cached_payload_mixin import CachedPayloadMixin
 from BackendTennis.models import HomePage
 from BackendTennis.permissions.page_permission.home_page_permissions import HomePagePermissions
 from BackendTennis.serializers import HomePageSerializer, HomePageDetailSerializer
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class HomePageListCreateView(ListCreateAPIView):
+class HomePageListCreateView(CachedPayloadMixin, ListCreateAPIView):
     queryset = HomePage.objects.all()
+    payload_group = Constant.PAYLOAD_GROUP.HOME_PAGE
     serializer_class = HomePageSerializer
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
     permission_classes = [HomePagePermissions]
@@ -22,8 +25,7 @@ class HomePageListCreateView(ListCreateAPIView):
         tags=['HomePages']
     )
     def get(self, request, *args, **kwargs):
-        self.get_queryset()
-        return self.list(request, *args, **kwargs)
+        return self.get_cached_response()
 
     @extend_schema(
         summary='Create a new HomePage',
@@ -36,8 +38,9 @@ class HomePageListCreateView(ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, HomePageDetailSerializer, is_creation=True)
 
 
-class HomePageRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
+class HomePageRetrieveUpdateDestroyView(CachedPayloadMixin, RetrieveUpdateDestroyAPIView):
     queryset = HomePage.objects.all()
+    payload_group = Constant.PAYLOAD_GROUP.HOME_PAGE
     serializer_class = HomePageSerializer
     serializer_class_response = HomePageDetailSerializer
     lookup_field = 'id'
@@ -51,7 +54,7 @@ class HomePageRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
         tags=['HomePages']
     )
     def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+        return self.get_cached_response()
 
     @extend_schema(
         summary='Update an HomePage',
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import json
+import time
 from datetime import datetime
 
-from django.db.models import Count
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.db import transaction
+from django.db.models import prefetch_related_objects
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from rest_framework import status
 from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
@@ -11,20 +14,26 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
-from BackendTennis.constant import constant_image_type_list
+from BackendTennis.constant import constant_image_type_list, Constant
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
+from BackendTennis.mixins.dynamic_fields_mixin import DynamicFieldsViewMixin, DYNAMIC_FIELDS_PARAMETERS
+from BackendTennis.mixins.streaming_list_mixin import StreamingListMixin, STREAMING_LIST_PARAMETERS
 from BackendTennis.models import Image
 from BackendTennis.pagination import ImagePagination
 from BackendTennis.permissions.image_permissions import ImagePermissions
 from BackendTennis.serializers import ImageSerializer, ImageDetailSerializer
+from BackendTennis.services.image_bulk_upload_service import bulk_upload_images
+from BackendTennis.services.image_tag_filter_service import filter_images_by_tags
+from BackendTennis.services.metrics_service import record_image_uploads
 from BackendTennis.trads.image_message import IMAGES_MESSAGES
-from BackendTennis.utils.serializer_utils import SerializerUtils
-from BackendTennis.utils.utils import move_deleted_image_to_new_path
-from BackendTennis.validators import validate_image_type
+from BackendTennis.utils.utils import lock_image_blobs, move_deleted_image_to_new_path
+from BackendTennis.validators import validate_image_type, validate_tag_match_mode
 
 
-class ImageListCreateView(ListCreateAPIView):
-    queryset = Image.objects.all()
+class ImageListCreateView(StreamingListMixin, DynamicFieldsViewMixin, ConditionalGetMixin, ListCreateAPIView):
+    queryset = Image.objects.prefetch_related('tags')
     serializer_class = ImageDetailSerializer
+    dynamic_serializer_class = ImageDetailSerializer
     pagination_class = ImagePagination
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
     permission_classes = [ImagePermissions]
@@ -34,10 +43,16 @@ class ImageListCreateView(ListCreateAPIView):
         parameters=[
             OpenApiParameter(name='type', description='Type of the image', required=False, type=str),
             OpenApiParameter(name='tags', description='Comma-separated list of tags', required=False, type=str),
+            OpenApiParameter(name='tags_mode', description='Images with all (default) or any of the tags',
+                             required=False, type=str, enum=['all', 'any']),
             OpenApiParameter(name='start', description='Start date for filtering images (format: dd-mm-yyyy)',
                              required=False, type=str),
             OpenApiParameter(name='end', description='End date for filtering images (format: dd-mm-yyyy)',
                              required=False, type=str),
+            OpenApiParameter(name='cursor', description='Cursor of the page, empty for the first one (keyset pagination)',
+                             required=False, type=str),
+            *DYNAMIC_FIELDS_PARAMETERS,
+            *STREAMING_LIST_PARAMETERS,
         ],
         responses={status.HTTP_200_OK: ImageDetailSerializer(many=True)},
         tags=['Images']
@@ -49,6 +64,7 @@ class ImageListCreateView(ListCreateAPIView):
     def get_queryset(self):
         queryset = super().get_queryset()
         tags = self.request.query_params.get('tags')
+        tags_mode = self.request.query_params.get('tags_mode', Constant.TAG_MATCH_MODE.ALL)
         image_type = self.request.query_params.get('type')
         start = self.request.query_params.get('start')
         end = self.request.query_params.get('end')
@@ -61,9 +77,8 @@ class ImageListCreateView(ListCreateAPIView):
                 queryset = queryset.none()
 
         if tags:
-            tags_list = tags.split(',')
-            queryset = queryset.filter(tags__name__in=tags_list).annotate(
-                tag_count=Count('tags__name')).filter(tag_count=len(tags_list))
+            validate_tag_match_mode(tags_mode)
+            queryset = filter_images_by_tags(queryset, tags.split(','), tags_mode)
 
         if start:
             start_date = datetime.strptime(start, '%d-%m-%Y').strftime('%Y-%m-%d')
@@ -82,18 +97,28 @@ class ImageListCreateView(ListCreateAPIView):
         tags=['Images']
     )
     def post(self, request, *args, **kwargs):
-        return self.create(request, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            response = self.create(request, *args, **kwargs)
+        except Exception:
+            record_image_uploads('single', time.perf_counter() - start, [], 1)
+            raise
+        upload = request.FILES.get('imageUrl')
+        record_image_uploads('single', time.perf_counter() - start, [upload.size] if upload else [], 0)
+        return response
 
 
-class ImageRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
-    queryset = Image.objects.all()
+class ImageRetrieveUpdateDestroyView(DynamicFieldsViewMixin, ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
+    queryset = Image.objects.prefetch_related('tags')
     serializer_class = ImageSerializer
+    dynamic_serializer_class = ImageDetailSerializer
     lookup_field = 'id'
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
     permission_classes = [ImagePermissions]
 
     @extend_schema(
         summary='Get image with Id',
+        parameters=DYNAMIC_FIELDS_PARAMETERS,
         responses={status.HTTP_200_OK: ImageDetailSerializer()},
         request=serializer_class,
         tags=['Images']
@@ -126,8 +151,11 @@ class ImageRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
     )
     def delete(self, request, *args, **kwargs):
         instance = self.get_object()
-        move_deleted_image_to_new_path(instance)
-        return self.destroy(request, *args, **kwargs)
+        with transaction.atomic():
+            # Until the commit, no upload can reuse the blob removed with its last reference
+            lock_image_blobs([instance.contentHash])
+            move_deleted_image_to_new_path(instance)
+            return self.destroy(request, *args, **kwargs)
 
 
 class ImageBatchDeleteView(RetrieveUpdateDestroyAPIView):
@@ -182,8 +210,10 @@ class ImageBatchDeleteView(RetrieveUpdateDestroyAPIView):
         for image_id in ids:
             try:
                 instance = Image.objects.get(id=image_id)
-                move_deleted_image_to_new_path(instance)
-                instance.delete()
+                with transaction.atomic():
+                    lock_image_blobs([instance.contentHash])
+                    move_deleted_image_to_new_path(instance)
+                    instance.delete()
             except Image.DoesNotExist:
                 failed_ids.append(image_id)
 
@@ -208,6 +238,11 @@ class BulkImageUploadView(ListCreateAPIView):
     permission_classes = [ImagePermissions]
     serializer_class = ImageSerializer
 
+    def initialize_request(self, request, *args, **kwargs):
+        # Stream every uploaded file to a temporary file in chunks instead of keeping the small ones in memory
+        request.upload_handlers = [TemporaryFileUploadHandler(request)]
+        return super().initialize_request(request, *args, **kwargs)
+
     @extend_schema(
         summary='Batch create images',
         request=ImageSerializer,
@@ -226,7 +261,6 @@ class BulkImageUploadView(ListCreateAPIView):
         tags=['Images']
     )
     def create(self, request, *args, **kwargs):
-        files = request.FILES
         try:
             images_data = json.loads(request.data.get('images_data', '[]'))
         except json.JSONDecodeError as e:
@@ -249,38 +283,9 @@ class BulkImageUploadView(ListCreateAPIView):
                 'error_images': []
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        created_images = []
-        error_images = []
-        errors = []
-        for image in images_data:
-            image_index = image.get('index')
-            if image_index is None:
-                errors.append(
-                    IMAGES_MESSAGES['ERROR']['NO_INDEX_ON_IMAGE'].format(image_title=image.get('title', 'no title'))
-                )
-                continue
-
-            file_from_image = files.get(f'image_{image['index']}')
-
-            if not file_from_image:
-                errors.append(IMAGES_MESSAGES['ERROR']['FILE_NOT_FOUND'].format(image_index=image_index))
-                continue
-
-            image['imageUrl'] = files.get(f'image_{image['index']}')
-            serializer = self.get_serializer(data=image)
-            if serializer.is_valid():
-                try:
-                    created_image = serializer.save()
-                    created_images.append(self.get_serializer(created_image).data)
-                except Exception as e:
-                    image['imageUrl'] = image['imageUrl'].name
-                    error_images.append(image)
-                    errors.append(IMAGES_MESSAGES['ERROR']['SAVE_ERROR'].format(error=str(e)))
-            else:
-                image['imageUrl'] = image['imageUrl'].name
-                error_images.append(image)
-                errors.append(
-                    IMAGES_MESSAGES['ERROR']['SAVE_ERROR'].format(error=SerializerUtils.get_error_message(serializer)))
+        created_images, error_images, errors = bulk_upload_images(images_data, request.FILES)
+        prefetch_related_objects(created_images, 'tags')
+        created_images = self.get_serializer(created_images, many=True).data
 
         if errors:
             return Response(
@@ -0,0 +1,28 @@
+import hmac
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.views import View
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from BackendTennis.services.metrics_service import get_metrics_setting, render_metrics
+
+
+class MetricsView(View):
+    """
+    Prometheus metrics of every worker, behind `Authorization: Bearer <METRICS['TOKEN']>` when a token is set.
+    Without a token, the metrics are only served with DEBUG or when `METRICS['PUBLIC']` is set.
+    """
+
+    def get(self, request, *args, **kwargs):
+        if not get_metrics_setting('ENABLED'):
+            raise Http404()
+
+        token = get_metrics_setting('TOKEN')
+        if token:
+            if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+                return HttpResponse(status=403)
+        elif not settings.DEBUG and not get_metrics_setting('PUBLIC'):
+            return HttpResponse(status=403)
+
+        return HttpResponse(render_metrics(), content_type=CONTENT_TYPE_LATEST)
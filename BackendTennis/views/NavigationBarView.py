@@ -3,14 +3,17 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.constant import Constant
+from BackendTennis.mixins.cached_payload_mixin import CachedPayloadMixin
 from BackendTennis.models import NavigationBar
 from BackendTennis.permissions.navigation_bar_permissions import NavigationBarPermissions
 from BackendTennis.serializers import NavigationBarSerializer, NavigationBarDetailSerializer
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class NavigationBarListCreateView(ListCreateAPIView):
+class NavigationBarListCreateView(CachedPayloadMixin, ListCreateAPIView):
     queryset = NavigationBar.objects.all()
+    payload_group = Constant.PAYLOAD_GROUP.NAVIGATION_BAR
     serializer_class = NavigationBarSerializer
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
     permission_classes = [NavigationBarPermissions]
@@ -22,8 +25,7 @@ class NavigationBarListCreateView(ListCreateAPIView):
         tags=['NavigationBars']
     )
     def get(self, request, *args, **kwargs):
-        self.get_queryset()
-        return self.list(request, *args, **kwargs)
+        return self.get_cached_response()
 
     @extend_schema(
         summary='Create a new NavigationBar',
@@ -36,8 +38,9 @@ class NavigationBarListCreateView(ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, NavigationBarDetailSerializer, is_creation=True)
 
 
-class NavigationBarRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
+class NavigationBarRetrieveUpdateDestroyView(CachedPayloadMixin, RetrieveUpdateDestroyAPIView):
     queryset = NavigationBar.objects.all()
+    payload_group = Constant.PAYLOAD_GROUP.NAVIGATION_BAR
     serializer_class = NavigationBarSerializer
     serializer_class_response = NavigationBarDetailSerializer
     lookup_field = 'id'
@@ -51,7 +54,7 @@ class NavigationBarRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
         tags=['NavigationBars']
     )
     def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+        return self.get_cached_response()
 
     @extend_schema(
         summary='Update a NavigationBar',
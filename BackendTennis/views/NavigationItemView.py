@@ -5,22 +5,28 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
+from BackendTennis.mixins.dynamic_fields_mixin import DynamicFieldsViewMixin, DYNAMIC_FIELDS_PARAMETERS
+from BackendTennis.mixins.streaming_list_mixin import StreamingListMixin, STREAMING_LIST_PARAMETERS
 from BackendTennis.models import NavigationItem
 from BackendTennis.permissions.navigation_item_permissions import NavigationItemPermissions
 from BackendTennis.serializers import NavigationItemSerializer, NavigationItemDetailSerializer
-from BackendTennis.services.navigation_item_service import update_multiple_navigation_items
+from BackendTennis.services.navigation_item_service import update_multiple_navigation_items, is_reorder_update, \
+    reorder_navigation_items
+from BackendTennis.services.navigation_item_tree_service import NAVIGATION_ITEM_TREE_PREFETCHES
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class NavigationItemListCreateView(ListCreateAPIView):
-    queryset = NavigationItem.objects.all()
+class NavigationItemListCreateView(StreamingListMixin, DynamicFieldsViewMixin, ConditionalGetMixin, ListCreateAPIView):
+    queryset = NavigationItem.objects.prefetch_related(*NAVIGATION_ITEM_TREE_PREFETCHES)
     serializer_class = NavigationItemSerializer
+    dynamic_serializer_class = NavigationItemDetailSerializer
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
     permission_classes = [NavigationItemPermissions]
 
     @extend_schema(
         summary='Get list of NavigationItem',
-        parameters=[],
+        parameters=[*DYNAMIC_FIELDS_PARAMETERS, *STREAMING_LIST_PARAMETERS],
         responses={200: NavigationItemDetailSerializer(many=True)},
         tags=['NavigationItems']
     )
@@ -39,9 +45,10 @@ class NavigationItemListCreateView(ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, NavigationItemDetailSerializer, is_creation=True)
 
 
-class NavigationItemRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
-    queryset = NavigationItem.objects.all()
+class NavigationItemRetrieveUpdateDestroyView(DynamicFieldsViewMixin, ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
+    queryset = NavigationItem.objects.prefetch_related(*NAVIGATION_ITEM_TREE_PREFETCHES)
     serializer_class = NavigationItemSerializer
+    dynamic_serializer_class = NavigationItemDetailSerializer
     serializer_class_response = NavigationItemDetailSerializer
     lookup_field = 'id'
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
@@ -49,6 +56,7 @@ class NavigationItemRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
 
     @extend_schema(
         summary='Get NavigationItem with Id',
+        parameters=DYNAMIC_FIELDS_PARAMETERS,
         responses={200: serializer_class_response},
         request=serializer_class,
         tags=['NavigationItems']
@@ -90,6 +98,8 @@ class UpdateNavigationItemsView(APIView):
 
     @extend_schema(
         summary='Update many NavigationItems',
+        description='Updates only made of `id`, `order` (navBarRender order), `enabled` and `parent` (null for a root '
+                    'item) are applied at once and validated on the final tree, the others item by item.',
         responses={200: None},
         request=serializer_class,
         tags=['NavigationItems']
@@ -97,7 +107,10 @@ class UpdateNavigationItemsView(APIView):
     def patch(self, request):
         navigation_items_updates = request.data.get('updates', [])
         try:
-            update_multiple_navigation_items(navigation_items_updates)
+            if is_reorder_update(navigation_items_updates):
+                reorder_navigation_items(navigation_items_updates)
+            else:
+                update_multiple_navigation_items(navigation_items_updates)
             return Response({'status': 'success'})
         except Exception as e:
             return Response({'status': 'error', 'message': str(e)}, status=400)
@@ -3,6 +3,7 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
 from BackendTennis.models import News
 from BackendTennis.pagination import NewsPagination
 from BackendTennis.permissions.news_permissions import NewsPermissions
@@ -10,8 +11,8 @@ from BackendTennis.serializers import NewsSerializer, NewsDetailSerializer
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class NewsListCreateView(ListCreateAPIView):
-    queryset = News.objects.all()
+class NewsListCreateView(ConditionalGetMixin, ListCreateAPIView):
+    queryset = News.objects.prefetch_related('images')
     serializer_class = NewsSerializer
     pagination_class = NewsPagination
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
@@ -43,7 +44,7 @@ class NewsListCreateView(ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, NewsDetailSerializer, is_creation=True)
 
 
-class NewsRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
+class NewsRetrieveUpdateDestroyView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     queryset = News.objects.all()
     serializer_class = NewsSerializer
     lookup_field = 'id'
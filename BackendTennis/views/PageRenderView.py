@@ -3,13 +3,14 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
 from BackendTennis.models import PageRender
 from BackendTennis.permissions.page_render_permissions import PageRenderPermissions
 from BackendTennis.serializers import PageRenderSerializer, PageRenderDetailSerializer
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class PageRenderListCreateView(ListCreateAPIView):
+class PageRenderListCreateView(ConditionalGetMixin, ListCreateAPIView):
     queryset = PageRender.objects.all()
     serializer_class = PageRenderSerializer
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
@@ -36,7 +37,7 @@ class PageRenderListCreateView(ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, PageRenderDetailSerializer, is_creation=True)
 
 
-class PageRenderRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
+class PageRenderRetrieveUpdateDestroyView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     queryset = PageRender.objects.all()
     serializer_class = PageRenderSerializer
     serializer_class_response = PageRenderDetailSerializer
@@ -3,13 +3,14 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
 from BackendTennis.models import PricingPage
 from BackendTennis.permissions.page_permission.pricing_page_permissions import PricingPagePermissions
 from BackendTennis.serializers import PricingPageSerializer, PricingPageDetailSerializer
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class PricingPageListCreateView(ListCreateAPIView):
+class PricingPageListCreateView(ConditionalGetMixin, ListCreateAPIView):
     queryset = PricingPage.objects.all()
     serializer_class = PricingPageSerializer
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
@@ -36,7 +37,7 @@ class PricingPageListCreateView(ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, PricingPageDetailSerializer, is_creation=True)
 
 
-class PricingPageRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
+class PricingPageRetrieveUpdateDestroyView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     queryset = PricingPage.objects.all()
     serializer_class = PricingPageSerializer
     serializer_class_response = PricingPageDetailSerializer
@@ -5,6 +5,8 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
 from BackendTennis.constant import constant_pricing_type_list
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
+from BackendTennis.mixins.dynamic_fields_mixin import DynamicFieldsViewMixin, DYNAMIC_FIELDS_PARAMETERS
 from BackendTennis.models import Pricing
 from BackendTennis.pagination import PricingPagination
 from BackendTennis.permissions.pricing_permissions import PricingPermissions
@@ -13,9 +15,10 @@ from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 from BackendTennis.validators import validate_pricing_type
 
 
-class PricingListCreateView(ListCreateAPIView):
-    queryset = Pricing.objects.all()
+class PricingListCreateView(DynamicFieldsViewMixin, ConditionalGetMixin, ListCreateAPIView):
+    queryset = Pricing.objects.select_related('image').prefetch_related('image__tags')
     serializer_class = PricingSerializer
+    dynamic_serializer_class = PricingDetailSerializer
     pagination_class = PricingPagination
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
     permission_classes = [PricingPermissions]
@@ -31,6 +34,7 @@ class PricingListCreateView(ListCreateAPIView):
                              ),
             OpenApiParameter(name='order', type=str, description='Order of sorting (asc or desc)', enum=['asc', 'desc']
                              ),
+            *DYNAMIC_FIELDS_PARAMETERS,
         ],
         responses={200: PricingDetailSerializer(many=True)},
         tags=['Pricings']
@@ -66,15 +70,17 @@ class PricingListCreateView(ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, PricingDetailSerializer, is_creation=True)
 
 
-class PricingRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
-    queryset = Pricing.objects.all()
+class PricingRetrieveUpdateDestroyView(DynamicFieldsViewMixin, ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
+    queryset = Pricing.objects.select_related('image').prefetch_related('image__tags')
     serializer_class = PricingSerializer
+    dynamic_serializer_class = PricingDetailSerializer
     lookup_field = 'id'
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
     permission_classes = [PricingPermissions]
 
     @extend_schema(
         summary="Get pricing with Id",
+        parameters=DYNAMIC_FIELDS_PARAMETERS,
         responses={200: PricingDetailSerializer()},
         request=serializer_class,
         tags=['Pricings']
@@ -3,6 +3,7 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
 from BackendTennis.models import Professor
 from BackendTennis.pagination import ProfessorPagination
 from BackendTennis.permissions.professor_permissions import ProfessorPermissions
@@ -10,8 +11,8 @@ from BackendTennis.serializers import ProfessorSerializer, ProfessorDetailSerial
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class ProfessorListCreateView(ListCreateAPIView):
-    queryset = Professor.objects.all()
+class ProfessorListCreateView(ConditionalGetMixin, ListCreateAPIView):
+    queryset = Professor.objects.select_related('image').prefetch_related('image__tags')
     serializer_class = ProfessorSerializer
     pagination_class = ProfessorPagination
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
@@ -48,8 +49,8 @@ class ProfessorListCreateView(ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, ProfessorDetailSerializer, is_creation=True)
 
 
-class ProfessorRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
-    queryset = Professor.objects.all()
+class ProfessorRetrieveUpdateDestroyView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
+    queryset = Professor.objects.select_related('image').prefetch_related('image__tags')
     serializer_class = ProfessorSerializer
     serializer_class_response = ProfessorDetailSerializer
     lookup_field = 'id'
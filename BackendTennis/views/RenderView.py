@@ -3,13 +3,14 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
 from BackendTennis.models import Render
 from BackendTennis.permissions.render_permissions import RenderPermissions
 from BackendTennis.serializers import RenderSerializer
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class RenderListCreateView(ListCreateAPIView):
+class RenderListCreateView(ConditionalGetMixin, ListCreateAPIView):
     queryset = Render.objects.all()
     serializer_class = RenderSerializer
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
@@ -36,7 +37,7 @@ class RenderListCreateView(ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, RenderSerializer, is_creation=True)
 
 
-class RenderRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
+class RenderRetrieveUpdateDestroyView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     queryset = Render.objects.all()
     serializer_class = RenderSerializer
     serializer_class_response = RenderSerializer
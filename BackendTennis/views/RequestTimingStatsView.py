@@ -0,0 +1,25 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.permissions.admin_permissions import AdminPermissions
+from BackendTennis.services.request_timing_service import get_request_timing_setting, request_timing_stats
+
+
+class RequestTimingStatsView(APIView):
+    """Percentiles of the last requests of every view measured by RequestTimingMiddleware, in this worker."""
+    authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
+    permission_classes = [AdminPermissions]
+
+    @extend_schema(
+        summary='Get the response time, database time and query count percentiles of every view',
+        responses={200: dict},
+        tags=['RequestTimingStats']
+    )
+    def get(self, request, *args, **kwargs):
+        return Response({
+            'window': get_request_timing_setting('WINDOW'),
+            'views': request_timing_stats.get_stats(),
+        })
@@ -3,13 +3,14 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
 from BackendTennis.models import Route
 from BackendTennis.permissions.route_permissions import RoutePermissions
 from BackendTennis.serializers import RouteSerializer
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class RouteListCreateView(ListCreateAPIView):
+class RouteListCreateView(ConditionalGetMixin, ListCreateAPIView):
     queryset = Route.objects.all()
     serializer_class = RouteSerializer
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
@@ -36,7 +37,7 @@ class RouteListCreateView(ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, RouteSerializer, is_creation=True)
 
 
-class RouteRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
+class RouteRetrieveUpdateDestroyView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     queryset = Route.objects.all()
     serializer_class = RouteSerializer
     serializer_class_response = RouteSerializer
@@ -0,0 +1,40 @@
+from datetime import date
+
+from drf_spectacular.utils import extend_schema
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.constant import Constant
+from BackendTennis.mixins.cached_payload_mixin import CachedPayloadMixin
+from BackendTennis.services.site_bundle_service import build_site_bundle
+
+
+class SiteBundleView(CachedPayloadMixin, GenericAPIView):
+    """
+    Every page of the public site in one response, served from a snapshot rebuilt after a content change.
+    The snapshot `version` is the one of the payload group, it changes with the ETag.
+    """
+    payload_group = Constant.PAYLOAD_GROUP.SITE_BUNDLE
+    authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
+    permission_classes = [AllowAny]
+
+    def get_payload_name(self) -> str:
+        # Upcoming events depend on the day, a new snapshot is built every day
+        return f'bundle:{date.today().isoformat()}'
+
+    def build_payload_response(self) -> Response:
+        return Response(build_site_bundle(self.request, date.today()))
+
+    def get_cached_response(self) -> Response:
+        return Response({'version': self._payload['version'], **self._payload['data']})
+
+    @extend_schema(
+        summary='Get every page of the site, the upcoming events and the latest news',
+        responses={200: dict},
+        tags=['SiteBundle']
+    )
+    def get(self, request, *args, **kwargs):
+        return self.get_cached_response()
@@ -3,6 +3,7 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
 from BackendTennis.models import Sponsor
 from BackendTennis.pagination import SponsorPagination
 from BackendTennis.permissions.sponsor_permissions import SponsorPermissions
@@ -10,8 +11,8 @@ from BackendTennis.serializers import SponsorSerializer, SponsorDetailSerializer
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class SponsorListCreateView(ListCreateAPIView):
-    queryset = Sponsor.objects.all()
+class SponsorListCreateView(ConditionalGetMixin, ListCreateAPIView):
+    queryset = Sponsor.objects.select_related('image').prefetch_related('image__tags')
     serializer_class = SponsorSerializer
     pagination_class = SponsorPagination
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
@@ -48,8 +49,8 @@ class SponsorListCreateView(ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, SponsorDetailSerializer, is_creation=True)
 
 
-class SponsorRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
-    queryset = Sponsor.objects.all()
+class SponsorRetrieveUpdateDestroyView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
+    queryset = Sponsor.objects.select_related('image').prefetch_related('image__tags')
     serializer_class = SponsorSerializer
     serializer_class_response = SponsorDetailSerializer
     lookup_field = 'id'
@@ -4,6 +4,7 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
 from BackendTennis.models import Tag
 from BackendTennis.pagination import TagPagination
 from BackendTennis.permissions.tag_permissions import TagPermissions
@@ -11,7 +12,7 @@ from BackendTennis.serializers import TagSerializer
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class TagView(ListCreateAPIView):
+class TagView(ConditionalGetMixin, ListCreateAPIView):
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
     pagination_class = TagPagination
@@ -52,7 +53,7 @@ class TagView(ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, TagSerializer, is_creation=True)
 
 
-class TagRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
+class TagRetrieveUpdateDestroyView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
     lookup_field = 'id'
@@ -3,6 +3,7 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
 from BackendTennis.models import TeamMember
 from BackendTennis.pagination import TeamMemberPagination
 from BackendTennis.permissions.team_member_permissions import TeamMemberPermissions
@@ -10,8 +11,8 @@ from BackendTennis.serializers import TeamMemberSerializer, TeamMemberDetailSeri
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class TeamMemberListCreateView(ListCreateAPIView):
-    queryset = TeamMember.objects.all()
+class TeamMemberListCreateView(ConditionalGetMixin, ListCreateAPIView):
+    queryset = TeamMember.objects.prefetch_related('images__tags')
     serializer_class = TeamMemberSerializer
     pagination_class = TeamMemberPagination
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
@@ -48,8 +49,8 @@ class TeamMemberListCreateView(ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, TeamMemberDetailSerializer, is_creation=True)
 
 
-class TeamMemberRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
-    queryset = TeamMember.objects.all()
+class TeamMemberRetrieveUpdateDestroyView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
+    queryset = TeamMember.objects.prefetch_related('images__tags')
     serializer_class = TeamMemberSerializer
     serializer_class_response = TeamMemberDetailSerializer
     lookup_field = 'id'
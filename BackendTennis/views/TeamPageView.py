@@ -3,13 +3,14 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
 from BackendTennis.models import TeamPage
 from BackendTennis.permissions.page_permission.team_page_permissions import TeamPagePermissions
 from BackendTennis.serializers import TeamPageSerializer, TeamPageDetailSerializer
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class TeamPageListCreateView(ListCreateAPIView):
+class TeamPageListCreateView(ConditionalGetMixin, ListCreateAPIView):
     queryset = TeamPage.objects.all()
     serializer_class = TeamPageSerializer
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
@@ -36,7 +37,7 @@ class TeamPageListCreateView(ListCreateAPIView):
         return check_if_is_valid_save_and_return(serializer, TeamPageDetailSerializer, is_creation=True)
 
 
-class TeamPageRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
+class TeamPageRetrieveUpdateDestroyView(ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     queryset = TeamPage.objects.all()
     serializer_class = TeamPageSerializer
     serializer_class_response = TeamPageDetailSerializer
@@ -4,16 +4,20 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
+from BackendTennis.mixins.participants_mode_mixin import ParticipantsModeViewMixin, PARTICIPANTS_MODE_PARAMETERS
 from BackendTennis.models import Tournament
 from BackendTennis.pagination import TournamentPagination
 from BackendTennis.permissions.tournament_permissions import TournamentPermissions
-from BackendTennis.serializers import TournamentSerializer, TournamentDetailSerializer
+from BackendTennis.serializers import TournamentSerializer, TournamentDetailSerializer, TournamentCompactSerializer
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class TournamentListCreateView(ListCreateAPIView):
+class TournamentListCreateView(ParticipantsModeViewMixin, ConditionalGetMixin, ListCreateAPIView):
     queryset = Tournament.objects.all()
     serializer_class = TournamentSerializer
+    compact_serializer_class = TournamentCompactSerializer
+    detail_serializer_class = TournamentDetailSerializer
     pagination_class = TournamentPagination
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
     permission_classes = [TournamentPermissions]
@@ -25,6 +29,9 @@ class TournamentListCreateView(ListCreateAPIView):
                              type=int),
             OpenApiParameter(name='end_date', description='End date to return tournaments', required=False,
                              type=int),
+            OpenApiParameter(name='cursor', description='Cursor of the page, empty for the first one (keyset pagination)',
+                             required=False, type=str),
+            *PARTICIPANTS_MODE_PARAMETERS,
         ],
         responses={200: TournamentDetailSerializer(many=True)},
         tags=['Tournaments']
@@ -62,9 +69,11 @@ class TournamentListCreateView(ListCreateAPIView):
         return self.create(request, *args, **kwargs)
 
 
-class TournamentRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
+class TournamentRetrieveUpdateDestroyView(ParticipantsModeViewMixin, ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     queryset = Tournament.objects.all()
     serializer_class = TournamentSerializer
+    compact_serializer_class = TournamentCompactSerializer
+    detail_serializer_class = TournamentDetailSerializer
     serializer_class_response = TournamentDetailSerializer
     lookup_field = 'id'
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
@@ -72,6 +81,7 @@ class TournamentRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
 
     @extend_schema(
         summary='Get Tournament by Id',
+        parameters=PARTICIPANTS_MODE_PARAMETERS,
         responses={200: serializer_class_response},
         request=serializer_class,
         tags=['Tournaments']
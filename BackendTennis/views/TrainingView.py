@@ -4,16 +4,21 @@ from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIV
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from BackendTennis.authentication import CustomAPIKeyAuthentication
+from BackendTennis.mixins.conditional_get_mixin import ConditionalGetMixin
+from BackendTennis.mixins.participants_mode_mixin import ParticipantsModeViewMixin, PARTICIPANTS_MODE_PARAMETERS
+from BackendTennis.mixins.streaming_list_mixin import StreamingListMixin, STREAMING_LIST_PARAMETERS
 from BackendTennis.models import Training
 from BackendTennis.pagination import TrainingPagination
 from BackendTennis.permissions.training_permissions import TrainingPermissions
-from BackendTennis.serializers import TrainingSerializer, TrainingDetailSerializer
+from BackendTennis.serializers import TrainingSerializer, TrainingDetailSerializer, TrainingCompactSerializer
 from BackendTennis.utils.utils import check_if_is_valid_save_and_return
 
 
-class TrainingListCreateView(ListCreateAPIView):
+class TrainingListCreateView(StreamingListMixin, ParticipantsModeViewMixin, ConditionalGetMixin, ListCreateAPIView):
     queryset = Training.objects.all()
     serializer_class = TrainingSerializer
+    compact_serializer_class = TrainingCompactSerializer
+    detail_serializer_class = TrainingDetailSerializer
     pagination_class = TrainingPagination
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
     permission_classes = [TrainingPermissions]
@@ -25,6 +30,10 @@ class TrainingListCreateView(ListCreateAPIView):
                              type=int),
             OpenApiParameter(name='end_date', description='End date to return trainings', required=False,
                              type=int),
+            OpenApiParameter(name='cursor', description='Cursor of the page, empty for the first one (keyset pagination)',
+                             required=False, type=str),
+            *PARTICIPANTS_MODE_PARAMETERS,
+            *STREAMING_LIST_PARAMETERS,
         ],
         responses={200: TrainingDetailSerializer(many=True)},
         tags=['Trainings']
@@ -62,15 +71,18 @@ class TrainingListCreateView(ListCreateAPIView):
         return self.create(request, *args, **kwargs)
 
 
-class TrainingRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
+class TrainingRetrieveUpdateDestroyView(ParticipantsModeViewMixin, ConditionalGetMixin, RetrieveUpdateDestroyAPIView):
     queryset = Training.objects.all()
     serializer_class = TrainingSerializer
+    compact_serializer_class = TrainingCompactSerializer
+    detail_serializer_class = TrainingDetailSerializer
     lookup_field = 'id'
     authentication_classes = [CustomAPIKeyAuthentication, JWTAuthentication]
     permission_classes = [TrainingPermissions]
 
     @extend_schema(
         summary="Get Training by Id",
+        parameters=PARTICIPANTS_MODE_PARAMETERS,
         responses={200: TrainingDetailSerializer()},
         request=serializer_class,
         tags=['Trainings']
@@ -1,10 +1,13 @@
 from rest_framework import permissions, generics
 
+from BackendTennis.mixins.serialization_timing_mixin import SerializationTimingMixin
+from BackendTennis.mixins.streaming_list_mixin import StreamingListMixin
 from BackendTennis.models import User
 from BackendTennis.serializers import UserSerializer
 
 
-class UserAdminView(generics.ListCreateAPIView, generics.RetrieveUpdateDestroyAPIView):
+class UserAdminView(StreamingListMixin, SerializationTimingMixin, generics.ListCreateAPIView,
+                    generics.RetrieveUpdateDestroyAPIView):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAdminUser]
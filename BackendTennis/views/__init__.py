@@ -10,6 +10,7 @@ from .EventView import EventRetrieveUpdateDestroyView
 from .HomePageView import HomePageListCreateView, HomePageRetrieveUpdateDestroyView
 from .ImageTypeView import ImageTypeListView
 from .ImageView import ImageListCreateView, ImageRetrieveUpdateDestroyView, ImageBatchDeleteView, BulkImageUploadView
+from .MetricsView import MetricsView
 from .NavigationBarView import NavigationBarListCreateView, NavigationBarRetrieveUpdateDestroyView
 from .NavigationItemView import NavigationItemListCreateView, NavigationItemRetrieveUpdateDestroyView, \
     UpdateNavigationItemsView
@@ -21,7 +22,9 @@ from .PricingView import PricingListCreateView
 from .PricingView import PricingRetrieveUpdateDestroyView
 from .ProfessorView import ProfessorListCreateView, ProfessorRetrieveUpdateDestroyView
 from .RenderView import RenderListCreateView, RenderRetrieveUpdateDestroyView
+from .RequestTimingStatsView import RequestTimingStatsView
 from .RouteView import RouteListCreateView, RouteRetrieveUpdateDestroyView
+from .SiteBundleView import SiteBundleView
 from .SponsorView import SponsorListCreateView, SponsorRetrieveUpdateDestroyView
 from .TagView import TagView, TagRetrieveUpdateDestroyView
 from .TeamMemberView import TeamMemberListCreateView, TeamMemberRetrieveUpdateDestroyView